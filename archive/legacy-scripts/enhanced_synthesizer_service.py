@@ -4,16 +4,91 @@ Implements internal-first philosophy with deep content understanding and compreh
 """
 
 import asyncio
+import copy
+import hashlib
 import json
 import logging
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
+import multiprocessing
+import os
+from typing import Dict, FrozenSet, List, Optional, Any, Pattern, Tuple, Union
+from dataclasses import dataclass, field
 from enum import Enum
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from functools import lru_cache
 import re
+import threading
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import fitz  # PyMuPDF
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+    fitz = None
+
+# PyMuPDF is not thread-safe; serializes its use across threads in this process
+_PYMUPDF_LOCK = threading.Lock()
+
+
+def _dumps_table(table: Dict[str, Any]) -> str:
+    """Compact JSON for table content (fewer prompt tokens, no unicode escaping)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(table, default=str).decode()
+    return json.dumps(table, ensure_ascii=False, separators=(',', ':'))
+
+# Below this many references, extraction runs inline (process startup isn't worth it)
+_PARALLEL_EXTRACT_MIN_REFS = 8
+
+# Worker processes are spawned, not forked: the parent already runs logging
+# and asyncio helper threads whose locks a fork could copy mid-use
+_WORKER_CONTEXT = multiprocessing.get_context("spawn")
+
+# Maximum number of cached AI content analyses
+_ANALYSIS_CACHE_SIZE = 256
+
+# Character budget for the reference summary sent for content analysis
+_ANALYSIS_SUMMARY_MAX_CHARS = 32_000
+
+# Maximum number of cached AI query responses
+_QUERY_CACHE_SIZE = 512
+
+# Prefix HybridAIManager.query puts on the text it returns when every provider failed
+_AI_ERROR_PREFIX = "[AI Service Error"
+
+# Maximum number of sections generated concurrently
+_SYNTH_MAX_CONCURRENT = int(os.getenv('SYNTH_MAX_CONCURRENT', '8'))
+
+# Seconds a synthesized chapter stays in the adapter cache
+_CHAPTER_CACHE_TTL = 86400
+
+# Section generation instructions, identical for every section of every chapter
+_SECTION_PROMPT_PREFIX = """
+        CRITICAL REQUIREMENTS:
+        1. MUST synthesize ALL information provided in the evidence below
+        2. MUST preserve ALL subtleties and detailed information
+        3. MUST integrate information from multiple sources seamlessly
+        4. MUST explicitly note any contradictions found between sources
+        5. MUST include citations for all statements
+        6. If evidence is insufficient, state: "Additional information regarding [specific aspect] is not available in the internal reference library."
+
+        SYNTHESIS GUIDELINES:
+        - Combine similar information from multiple sources into coherent paragraphs
+        - Preserve unique details from each source
+        - When sources disagree, present both perspectives with citations
+        - Include all relevant statistics, measurements, and specific data
+        - Maintain medical accuracy and professional terminology
+        """
+
 class ContentType(Enum):
     TEXT = "text"
     TABLE = "table"
@@ -21,7 +96,7 @@ class ContentType(Enum):
     FORMULA = "formula"
     DIAGRAM = "diagram"
 
-@dataclass
+@dataclass(slots=True)
 class ContentElement:
     """Represents a single element of content from references"""
     type: ContentType
@@ -31,8 +106,14 @@ class ContentElement:
     page_number: Optional[int] = None
     confidence_score: float = 1.0
     metadata: Dict[str, Any] = None
-
-@dataclass
+    # Bit per _SECTION_KEYWORDS section whose keywords appear in the content
+    section_mask: Optional[int] = field(default=None, repr=False, compare=False)
+    # Lowercased content, computed once per element
+    content_lower: Optional[str] = field(default=None, repr=False, compare=False)
+    # Keyword hits per _COVERAGE_KEYWORDS section, computed once per element
+    coverage_hits: Optional[Dict[str, int]] = field(default=None, repr=False, compare=False)
+
+@dataclass(slots=True)
 class ContentAnalysis:
     """Analysis results for content understanding"""
     similarities: List[Dict[str, Any]]
@@ -42,68 +123,344 @@ class ContentAnalysis:
     knowledge_gaps: List[str]
     unique_insights: List[Dict[str, Any]]
 
+# Caption shown for images whose metadata has none
+_DEFAULT_IMAGE_CAPTION = 'Medical image'
+
+# Shared metadata for images without caption or figure number. Plain dict
+# rather than a read-only proxy so elements still pickle across workers;
+# treat it as immutable.
+_DEFAULT_IMAGE_METADATA: Dict[str, Any] = {
+    'caption': '',
+    'figure_number': '',
+    'draggable': True  # Enable easy drag-and-drop
+}
+
+def _image_metadata(image: Dict[str, Any]) -> Dict[str, Any]:
+    """Metadata for an image element, reusing the shared default when possible"""
+    caption = image.get('caption', '')
+    figure_number = image.get('figure_number', '')
+    if not caption and not figure_number:
+        return _DEFAULT_IMAGE_METADATA
+    return {'caption': caption, 'figure_number': figure_number, 'draggable': True}
+
+def _extract_one(ref: Dict[str, Any], include_images: bool) -> List[ContentElement]:
+    """
+    Extracts content elements from a single reference.
+    Module-level so it can run in a worker process.
+    """
+    elements = []
+    source_title = ref.get('source_title', 'Unknown Source')
+
+    # Extract text content
+    if 'content' in ref:
+        text_element = ContentElement(
+            type=ContentType.TEXT,
+            content=ref['content'],
+            source=source_title,
+            citation=ref.get('citation', ''),
+            page_number=ref.get('page_number'),
+            metadata=ref.get('metadata', {})
+        )
+        # Derived fields (section_mask, content_lower, coverage_hits) are
+        # computed lazily in the parent; set here they would double the
+        # data pickled back from worker processes
+        elements.append(text_element)
+
+    # Extract tables
+    if 'tables' in ref:
+        for table in ref['tables']:
+            elements.append(ContentElement(
+                type=ContentType.TABLE,
+                content=_dumps_table(table),
+                source=source_title,
+                citation=ref.get('citation', ''),
+                metadata={'table_title': table.get('title', '')}
+            ))
+
+    # Extract images if requested
+    if include_images and 'images' in ref:
+        citation = ref.get('citation', '')
+        elements.extend(
+            ContentElement(
+                type=ContentType.IMAGE,
+                content=image.get('path', ''),
+                source=source_title,
+                citation=citation,
+                metadata=_image_metadata(image)
+            )
+            for image in ref['images']
+        )
+
+    # Extract formulas and diagrams
+    if 'formulas' in ref:
+        for formula in ref['formulas']:
+            elements.append(ContentElement(
+                type=ContentType.FORMULA,
+                content=formula,
+                source=source_title,
+                citation=ref.get('citation', '')
+            ))
+
+    return elements
+
+
+def _is_ai_response(result: Optional[str]) -> bool:
+    """True for a non-empty AI response that is not a provider failure message"""
+    return bool(result) and not result.startswith(_AI_ERROR_PREFIX)
+
+
+def _balanced_object_end(text: str, start: int) -> int:
+    """
+    Returns the index just past the '{...}' opening at start, or -1 if it
+    never closes. Braces inside JSON strings are ignored.
+    """
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        c = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif c == '\\':
+                escaped = True
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c == '{':
+            depth += 1
+        elif c == '}':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+    return -1
+
+
+def _extract_json_object(text: str) -> Optional[str]:
+    """
+    Finds the first balanced, parseable JSON object embedded in text
+    (e.g. an LLM response with surrounding prose) in a linear scan.
+    """
+    start = text.find('{')
+    while start >= 0:
+        end = _balanced_object_end(text, start)
+        if end < 0:
+            return None
+        candidate = text[start:end]
+        try:
+            json.loads(candidate)
+            return candidate
+        except ValueError:
+            start = text.find('{', start + 1)
+    return None
+
+
+# Comprehensive chapter structure for neurosurgical topics
+_COMPREHENSIVE_STRUCTURE: Tuple[str, ...] = (
+    "Introduction",
+    "Epidemiology",
+    "Risk Factors",
+    "Pathophysiology",
+    "Molecular Biology",
+    "Genetics",
+    "Classification Systems",
+    "Clinical Presentation",
+    "Physical Examination",
+    "Differential Diagnosis",
+    "Diagnostic Workup",
+    "Laboratory Studies",
+    "Imaging",
+    "Advanced Imaging Techniques",
+    "Surgical Anatomy",
+    "Treatment Options and Alternatives",
+    "Conservative Management",
+    "Medical Management",
+    "Surgical Indications",
+    "Preoperative Planning",
+    "Surgical Techniques",
+    "Step-by-Step Surgical Procedure",
+    "Intraoperative Monitoring",
+    "Postoperative Management",
+    "Complications",
+    "Adjuvant Therapy",
+    "Radiation Therapy",
+    "Chemotherapy",
+    "Targeted Therapy",
+    "Pathology",
+    "Histopathological Features",
+    "Immunohistochemistry",
+    "Molecular Markers",
+    "Prognosis",
+    "Survival Statistics",
+    "Progression Patterns",
+    "Quality of Life",
+    "Follow-up Protocol",
+    "Recurrence Management",
+    "Recent Advances",
+    "Future Directions",
+    "Key Points Summary",
+    "Conclusion",
+    "References"
+)
+
+# Keywords indicating content coverage for each section
+_COVERAGE_KEYWORDS: Dict[str, FrozenSet[str]] = {
+    "Epidemiology": frozenset({"incidence", "prevalence", "demographics", "statistics"}),
+    "Pathophysiology": frozenset({"mechanism", "pathogenesis", "molecular", "cellular"}),
+    "Clinical Presentation": frozenset({"symptoms", "signs", "presentation", "clinical"}),
+    "Imaging": frozenset({"mri", "ct", "x-ray", "ultrasound", "imaging"}),
+    "Surgical Techniques": frozenset({"procedure", "technique", "approach", "surgical"}),
+    # Add more mappings as needed
+}
+
+# Keywords used to select evidence for each section
+_SECTION_KEYWORDS: Dict[str, FrozenSet[str]] = {
+    "Introduction": frozenset({"overview", "definition", "background", "introduction"}),
+    "Epidemiology": frozenset({"incidence", "prevalence", "demographics", "statistics", "frequency"}),
+    "Pathophysiology": frozenset({"mechanism", "pathogenesis", "molecular", "cellular", "pathway"}),
+    "Clinical Presentation": frozenset({"symptoms", "signs", "presentation", "clinical", "features"}),
+    "Diagnosis": frozenset({"diagnostic", "criteria", "diagnosis", "workup", "evaluation"}),
+    "Imaging": frozenset({"mri", "ct", "x-ray", "ultrasound", "imaging", "radiological"}),
+    "Surgical Anatomy": frozenset({"anatomy", "anatomical", "landmarks", "structures", "approach"}),
+    "Surgical Techniques": frozenset({"procedure", "technique", "approach", "surgical", "operation"}),
+    "Complications": frozenset({"complication", "adverse", "risk", "morbidity", "mortality"}),
+    "Prognosis": frozenset({"survival", "outcome", "prognosis", "progression", "recurrence"}),
+    # Add more as needed
+}
+
+# Caption keywords for image relevance
+_IMAGE_KEYWORDS: Dict[str, FrozenSet[str]] = {
+    "Surgical Anatomy": frozenset({"anatomy", "anatomical", "structure"}),
+    "Imaging": frozenset({"mri", "ct", "scan", "radiograph"}),
+    "Surgical Techniques": frozenset({"procedure", "technique", "step", "approach"}),
+    "Pathology": frozenset({"histology", "microscopy", "specimen"}),
+}
+
+
+def _keyword_alternation(keywords) -> str:
+    """Regex alternation matching any keyword at a word start (longest first)"""
+    ordered = sorted({kw.lower() for kw in keywords}, key=len, reverse=True)
+    return r'\b(?:' + '|'.join(re.escape(kw) for kw in ordered) + ')'
+
+
+@lru_cache(maxsize=None)
+def _keyword_pattern(keywords: FrozenSet[str]) -> Pattern[str]:
+    """Compiled case-insensitive pattern matching any of the keywords"""
+    return re.compile(_keyword_alternation(keywords), re.IGNORECASE)
+
+
+def _build_keyword_index(
+    section_keywords: Dict[str, FrozenSet[str]]
+) -> Tuple[Pattern[str], Dict[str, Tuple[str, ...]]]:
+    """
+    Compiles all section keywords into one alternation and maps each
+    lowercased keyword back to the sections that use it
+    """
+    kw_to_sections: Dict[str, Tuple[str, ...]] = {}
+    for section, keywords in section_keywords.items():
+        for keyword in keywords:
+            key = keyword.lower()
+            if section not in kw_to_sections.get(key, ()):
+                kw_to_sections[key] = kw_to_sections.get(key, ()) + (section,)
+    pattern = re.compile(_keyword_alternation(kw_to_sections), re.IGNORECASE)
+    return pattern, kw_to_sections
+
+
+_WORD_RE = re.compile(r'\w+')
+
+# One bit per keyword-backed section, and a single pattern over all their keywords
+_SECTION_BIT: Dict[str, int] = {section: 1 << i for i, section in enumerate(_SECTION_KEYWORDS)}
+_SECTION_KEYWORD_RE, _KW_TO_SECTIONS = _build_keyword_index(_SECTION_KEYWORDS)
+
+# Single alternation over all coverage keywords, mapped back to sections
+_COVERAGE_KEYWORD_RE, _COVERAGE_KW_TO_SECTIONS = _build_keyword_index(_COVERAGE_KEYWORDS)
+
+
+def _insight_terms(insight: Any) -> Tuple[str, FrozenSet[str]]:
+    """Lowercased text of an analysis insight and its set of words"""
+    insight_text = str(insight).lower()
+    return insight_text, frozenset(_WORD_RE.findall(insight_text))
+
+
+def _section_mask(element: ContentElement) -> int:
+    """Returns (computing once) the element's section keyword bitmask"""
+    if element.section_mask is None:
+        mask = 0
+        for match in _SECTION_KEYWORD_RE.finditer(element.content):
+            for section in _KW_TO_SECTIONS[match.group(0).lower()]:
+                mask |= _SECTION_BIT[section]
+        element.section_mask = mask
+    return element.section_mask
+
+
+def _content_lower(element: ContentElement) -> str:
+    """Returns (computing once) the element's lowercased content"""
+    if element.content_lower is None:
+        element.content_lower = element.content.lower()
+    return element.content_lower
+
+
+def _coverage_hits(element: ContentElement) -> Dict[str, int]:
+    """Returns (computing once) the element's coverage keyword hits per section"""
+    if element.coverage_hits is None:
+        hits = Counter()
+        for match in _COVERAGE_KEYWORD_RE.finditer(element.content):
+            hits.update(_COVERAGE_KW_TO_SECTIONS[match.group(0).lower()])
+        element.coverage_hits = dict(hits)
+    return element.coverage_hits
+
+
 class EnhancedSynthesisEngine:
     """
     Advanced synthesis engine with deep content understanding and comprehensive integration.
     Ensures all knowledge, details, and subtleties are captured in structured, accurate chapters.
     """
 
-    def __init__(self, hybrid_ai_manager=None, pdf_extractor=None):
+    def __init__(self, hybrid_ai_manager=None, pdf_extractor=None, extract_workers: Optional[int] = None):
         self.hybrid_ai_manager = hybrid_ai_manager
         self.pdf_extractor = pdf_extractor
-        self.chapter_sections = self._get_comprehensive_structure()
+        self.chapter_sections = _COMPREHENSIVE_STRUCTURE
 
         # Support for standalone operation if AI manager not provided
         self.standalone_mode = hybrid_ai_manager is None
 
+        # LRU of AI content analyses keyed by reference content hash
+        self._analysis_cache: "OrderedDict[bytes, ContentAnalysis]" = OrderedDict()
+
+        # LRU of AI query responses keyed by model and prompt hash, plus
+        # per-key locks so concurrent identical prompts share one request
+        self._query_cache: "OrderedDict[Tuple[str, bool, bytes], str]" = OrderedDict()
+        self._query_locks: Dict[Tuple[str, bool, bytes], asyncio.Lock] = {}
+
+        # Worker processes for per-reference extraction (0 or 1 disables),
+        # started on the first extraction large enough to use them
+        self._extract_workers = os.cpu_count() if extract_workers is None else extract_workers
+        self._extract_pool: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
+
+    def shutdown(self):
+        """Releases the extraction worker pool, if one was started"""
+        if self._extract_pool is not None:
+            self._extract_pool.shutdown(wait=True)
+            self._extract_pool = None
+
+    def _get_extract_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Returns the extraction pool, starting it on first use"""
+        if self._extract_pool is None and self._extract_workers and self._extract_workers > 1:
+            self._extract_pool = ProcessPoolExecutor(
+                max_workers=self._extract_workers, mp_context=_WORKER_CONTEXT
+            )
+        return self._extract_pool
+
     def _get_comprehensive_structure(self) -> List[str]:
-        """Returns comprehensive chapter structure for neurosurgical topics"""
-        return [
-            "Introduction",
-            "Epidemiology",
-            "Risk Factors",
-            "Pathophysiology",
-            "Molecular Biology",
-            "Genetics",
-            "Classification Systems",
-            "Clinical Presentation",
-            "Physical Examination",
-            "Differential Diagnosis",
-            "Diagnostic Workup",
-            "Laboratory Studies",
-            "Imaging",
-            "Advanced Imaging Techniques",
-            "Surgical Anatomy",
-            "Treatment Options and Alternatives",
-            "Conservative Management",
-            "Medical Management",
-            "Surgical Indications",
-            "Preoperative Planning",
-            "Surgical Techniques",
-            "Step-by-Step Surgical Procedure",
-            "Intraoperative Monitoring",
-            "Postoperative Management",
-            "Complications",
-            "Adjuvant Therapy",
-            "Radiation Therapy",
-            "Chemotherapy",
-            "Targeted Therapy",
-            "Pathology",
-            "Histopathological Features",
-            "Immunohistochemistry",
-            "Molecular Markers",
-            "Prognosis",
-            "Survival Statistics",
-            "Progression Patterns",
-            "Quality of Life",
-            "Follow-up Protocol",
-            "Recurrence Management",
-            "Recent Advances",
-            "Future Directions",
-            "Key Points Summary",
-            "Conclusion",
-            "References"
-        ]
+        """Returns a mutable copy of the comprehensive chapter structure"""
+        return list(_COMPREHENSIVE_STRUCTURE)
 
     async def synthesize_initial_chapter(
         self,
@@ -117,10 +474,10 @@ class EnhancedSynthesisEngine:
         """
 
         if not internal_references:
-            logger.warning(f"No internal references provided for topic: {topic}")
+            logger.warning("No internal references provided for topic: %s", topic)
             return None
 
-        logger.info(f"Starting comprehensive synthesis for topic: {topic}")
+        logger.info("Starting comprehensive synthesis for topic: %s", topic)
 
         # Process Flow with Deep Understanding
         try:
@@ -128,47 +485,71 @@ class EnhancedSynthesisEngine:
             content_elements = await self._extract_content_elements(internal_references, include_images)
 
             # 2. Deeply analyze content relationships
-            content_analysis = await self._analyze_content_relationships(content_elements, topic)
+            by_source = self._group_by_source(content_elements)
+            content_analysis = await self._analyze_content_relationships(content_elements, topic, by_source)
+
+            # CPU-bound preprocessing runs in worker threads so the event loop
+            # keeps serving other syntheses' in-flight AI calls meanwhile
 
             # 3. Determine optimal structure based on available content
-            chapter_structure = self._determine_optimal_structure(topic, content_elements, content_analysis)
+            chapter_structure = await asyncio.to_thread(
+                self._determine_optimal_structure, topic, content_elements, content_analysis
+            )
 
             # 4. Aggregate evidence with full context understanding
-            aggregated_evidence = self._aggregate_evidence_advanced(content_elements, content_analysis)
-
-            # 5. Generate content section by section with comprehensive integration
-            chapter_content = {}
-            for section in chapter_structure:
-                section_content = await self._generate_comprehensive_section(
-                    section_name=section,
-                    content_elements=content_elements,
-                    content_analysis=content_analysis,
-                    aggregated_evidence=aggregated_evidence,
-                    topic=topic,
-                    include_images=include_images
-                )
-                if section_content:
-                    chapter_content[section] = section_content
+            aggregated_evidence = await asyncio.to_thread(
+                self._aggregate_evidence_advanced, content_elements, content_analysis, by_source
+            )
+
+            # 5. Generate all sections concurrently, bounded to respect AI rate limits
+            semaphore = asyncio.Semaphore(_SYNTH_MAX_CONCURRENT)
+            top_contradictions = content_analysis.contradictions[:3]  # Limit to top 3
+            has_contradictions = bool(content_analysis.contradictions)
+
+            async def generate(section: str) -> Tuple[Optional[str], bool]:
+                async with semaphore:
+                    return await self._generate_comprehensive_section(
+                        section_name=section,
+                        content_elements=content_elements,
+                        top_contradictions=top_contradictions,
+                        has_contradictions=has_contradictions,
+                        aggregated_evidence=aggregated_evidence,
+                        topic=topic,
+                        include_images=include_images
+                    )
+
+            section_results = await asyncio.gather(*[generate(section) for section in chapter_structure])
+            chapter_content = [
+                (section, section_content)
+                for section, (section_content, _) in zip(chapter_structure, section_results)
+                if section_content
+            ]
+            failed_sections = [
+                section
+                for section, (_, failed) in zip(chapter_structure, section_results)
+                if failed
+            ]
 
             # 6. Compile final comprehensive chapter
             compiled_chapter = self._compile_comprehensive_chapter(
                 topic=topic,
                 content=chapter_content,
-                images=self._extract_image_references(content_elements) if include_images else [],
+                images=self._extract_image_references(content_elements, by_source) if include_images else [],
                 content_analysis=content_analysis,
                 metadata={
                     "total_sources": len(internal_references),
                     "content_elements": len(content_elements),
                     "knowledge_gaps": content_analysis.knowledge_gaps,
-                    "contradictions_found": len(content_analysis.contradictions)
+                    "contradictions_found": len(content_analysis.contradictions),
+                    "failed_sections": failed_sections
                 }
             )
 
-            logger.info(f"Successfully completed synthesis for topic: {topic}")
+            logger.info("Successfully completed synthesis for topic: %s", topic)
             return compiled_chapter
 
         except Exception as e:
-            logger.error(f"Failed to synthesize chapter for topic {topic}: {e}")
+            logger.error("Failed to synthesize chapter for topic %s: %s", topic, e)
             return None
 
     async def _extract_content_elements(
@@ -180,73 +561,48 @@ class EnhancedSynthesisEngine:
         Extracts all content elements from references including text, tables, and images.
         Implements deep content parsing and understanding.
         """
-        content_elements = []
-
-        for ref in references:
-            source_title = ref.get('source_title', 'Unknown Source')
-
-            # Extract text content
-            if 'content' in ref:
-                content_elements.append(ContentElement(
-                    type=ContentType.TEXT,
-                    content=ref['content'],
-                    source=source_title,
-                    citation=ref.get('citation', ''),
-                    page_number=ref.get('page_number'),
-                    metadata=ref.get('metadata', {})
-                ))
-
-            # Extract tables
-            if 'tables' in ref:
-                for table in ref['tables']:
-                    content_elements.append(ContentElement(
-                        type=ContentType.TABLE,
-                        content=json.dumps(table),
-                        source=source_title,
-                        citation=ref.get('citation', ''),
-                        metadata={'table_title': table.get('title', '')}
-                    ))
-
-            # Extract images if requested
-            if include_images and 'images' in ref:
-                for image in ref['images']:
-                    content_elements.append(ContentElement(
-                        type=ContentType.IMAGE,
-                        content=image.get('path', ''),
-                        source=source_title,
-                        citation=ref.get('citation', ''),
-                        metadata={
-                            'caption': image.get('caption', ''),
-                            'figure_number': image.get('figure_number', ''),
-                            'draggable': True  # Enable easy drag-and-drop
-                        }
-                    ))
-
-            # Extract formulas and diagrams
-            if 'formulas' in ref:
-                for formula in ref['formulas']:
-                    content_elements.append(ContentElement(
-                        type=ContentType.FORMULA,
-                        content=formula,
-                        source=source_title,
-                        citation=ref.get('citation', '')
-                    ))
-
-        logger.info(f"Extracted {len(content_elements)} content elements from {len(references)} references")
+        pool = self._get_extract_pool() if len(references) >= _PARALLEL_EXTRACT_MIN_REFS else None
+        if pool is None:
+            per_reference = [_extract_one(ref, include_images) for ref in references]
+        else:
+            loop = asyncio.get_running_loop()
+            per_reference = await asyncio.gather(*[
+                loop.run_in_executor(pool, _extract_one, ref, include_images)
+                for ref in references
+            ])
+
+        content_elements = list(chain.from_iterable(per_reference))
+
+        logger.info("Extracted %s content elements from %s references", len(content_elements), len(references))
         return content_elements
 
     async def _analyze_content_relationships(
         self,
         content_elements: List[ContentElement],
-        topic: str
+        topic: str,
+        by_source: Optional[Dict[str, Dict[str, List[ContentElement]]]] = None
     ) -> ContentAnalysis:
         """
         Deeply analyzes relationships between content from different sources.
         Identifies similarities, differences, complementary info, and contradictions.
         """
 
+        # Identical reference sets reuse the previous AI analysis
+        cache_key = None
+        if not self.standalone_mode:
+            cache_key = self._analysis_cache_key(content_elements, topic)
+            cached = self._analysis_cache.get(cache_key)
+            if cached is not None:
+                self._analysis_cache.move_to_end(cache_key)
+                logger.info("Using cached content analysis for topic: %s", topic)
+                # Chapters keep references to the analysis lists, so never hand out the cached object
+                return copy.deepcopy(cached)
+
+        if by_source is None:
+            by_source = self._group_by_source(content_elements)
+
         # Prepare content for AI analysis
-        content_summary = self._prepare_content_for_analysis(content_elements)
+        content_summary = self._prepare_content_for_analysis(content_elements, by_source)
 
         analysis_prompt = f"""
         Analyze the following medical content about '{topic}' from multiple sources.
@@ -269,19 +625,39 @@ class EnhancedSynthesisEngine:
             # Handle standalone mode without AI
             if self.standalone_mode:
                 logger.info("Running in standalone mode - using basic analysis")
-                return self._basic_content_analysis(content_elements)
+                return self._basic_content_analysis(content_elements, by_source)
 
-            analysis_result = await self.hybrid_ai_manager.query(
+            analysis_result = await self._cached_query(
                 "Claude",
                 analysis_prompt,
                 use_fallback=False
             )
 
             # Parse and structure the analysis
-            return self._parse_content_analysis(analysis_result)
+            analysis = None
+            if _is_ai_response(analysis_result):
+                analysis = self._parse_content_analysis(analysis_result)
+                if analysis is None:
+                    # Otherwise the query cache would serve the same unusable text again
+                    self._query_cache.pop(self._query_cache_key("Claude", analysis_prompt, False), None)
+            else:
+                logger.error("Content analysis query failed: %s", analysis_result)
+
+            # Failed or unparsable responses are not cached, so the next call retries
+            if analysis is None:
+                return ContentAnalysis(
+                    similarities=[], differences=[], complementary_info=[],
+                    contradictions=[], knowledge_gaps=[], unique_insights=[]
+                )
+
+            self._analysis_cache[cache_key] = copy.deepcopy(analysis)
+            if len(self._analysis_cache) > _ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+
+            return analysis
 
         except Exception as e:
-            logger.error(f"Failed to analyze content relationships: {e}")
+            logger.error("Failed to analyze content relationships: %s", e)
             # Return basic analysis structure
             return ContentAnalysis(
                 similarities=[],
@@ -292,25 +668,97 @@ class EnhancedSynthesisEngine:
                 unique_insights=[]
             )
 
-    def _basic_content_analysis(self, content_elements: List[ContentElement]) -> ContentAnalysis:
-        """Basic content analysis for standalone mode without AI"""
-        # Group by source to detect overlaps
-        sources_content = {}
+    async def _cached_query(self, model: str, prompt: str, use_fallback: bool = False) -> str:
+        """
+        Queries the AI manager, reusing responses to identical prompts.
+        Concurrent callers with the same prompt wait for a single request.
+        """
+        key = self._query_cache_key(model, prompt, use_fallback)
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            self._query_cache.move_to_end(key)
+            return cached
+
+        lock = self._query_locks.get(key)
+        if lock is None:
+            lock = self._query_locks[key] = asyncio.Lock()
+        try:
+            async with lock:
+                cached = self._query_cache.get(key)
+                if cached is not None:
+                    self._query_cache.move_to_end(key)
+                    return cached
+
+                result = await self.hybrid_ai_manager.query(model, prompt, use_fallback=use_fallback)
+                # Failures come back as error text; only real responses are reused
+                if _is_ai_response(result):
+                    self._query_cache[key] = result
+                    if len(self._query_cache) > _QUERY_CACHE_SIZE:
+                        self._query_cache.popitem(last=False)
+                return result
+        finally:
+            if self._query_locks.get(key) is lock:
+                del self._query_locks[key]
+
+    @staticmethod
+    def _query_cache_key(model: str, prompt: str, use_fallback: bool) -> Tuple[str, bool, bytes]:
+        """Key of a query response in the query cache"""
+        return (model, use_fallback, hashlib.blake2b(prompt.encode(), digest_size=16).digest())
+
+    @staticmethod
+    def _analysis_cache_key(content_elements: List[ContentElement], topic: str) -> bytes:
+        """Order-independent content hash of the elements analyzed for a topic"""
+        h = hashlib.blake2b(topic.encode(), digest_size=16)
+        for element in sorted(content_elements, key=lambda e: (e.source, e.citation, e.type.value, e.content)):
+            # Fields are NUL-separated so adjacent values cannot run together
+            for value in (element.type.value, element.source, element.citation, element.content):
+                h.update(value.encode())
+                h.update(b"\0")
+        return h.digest()
+
+    @staticmethod
+    def _group_by_source(content_elements: List[ContentElement]) -> Dict[str, Dict[str, List[ContentElement]]]:
+        """Groups elements by source, then by type, in a single pass"""
+        by_source = {}
         for element in content_elements:
-            if element.source not in sources_content:
-                sources_content[element.source] = []
+            groups = by_source.get(element.source)
+            if groups is None:
+                groups = by_source[element.source] = {'text': [], 'tables': [], 'images': []}
+
             if element.type == ContentType.TEXT:
-                sources_content[element.source].append(element.content.lower())
+                groups['text'].append(element)
+            elif element.type == ContentType.TABLE:
+                groups['tables'].append(element)
+            elif element.type == ContentType.IMAGE:
+                groups['images'].append(element)
+        return by_source
 
-        # Simple similarity detection
-        similarities = []
-        all_text = ' '.join([' '.join(texts) for texts in sources_content.values()])
+    def _basic_content_analysis(
+        self,
+        content_elements: List[ContentElement],
+        by_source: Optional[Dict[str, Dict[str, List[ContentElement]]]] = None
+    ) -> ContentAnalysis:
+        """Basic content analysis for standalone mode without AI"""
+        # Group by source to detect overlaps
+        if by_source is None:
+            by_source = self._group_by_source(content_elements)
 
-        # Find common medical terms across sources
+        # Find common medical terms across sources, counting each text once
         common_terms = ["treatment", "diagnosis", "surgery", "therapy", "management"]
-        for term in common_terms:
-            if all_text.count(term) > len(sources_content):
-                similarities.append({"term": term, "frequency": all_text.count(term)})
+        totals = Counter(dict.fromkeys(common_terms, 0))
+        for content in by_source.values():
+            for element in content['text']:
+                text = _content_lower(element)
+                for term in common_terms:
+                    totals[term] += text.count(term)
+
+        # Simple similarity detection
+        n_sources = len(by_source)
+        similarities = [
+            {"term": term, "frequency": frequency}
+            for term, frequency in totals.items()
+            if frequency > n_sources
+        ]
 
         return ContentAnalysis(
             similarities=similarities,
@@ -321,41 +769,50 @@ class EnhancedSynthesisEngine:
             unique_insights=[]
         )
 
-    def _prepare_content_for_analysis(self, content_elements: List[ContentElement]) -> str:
-        """Prepares content elements for AI analysis"""
-        summary = ""
+    def _prepare_content_for_analysis(
+        self,
+        content_elements: List[ContentElement],
+        by_source: Optional[Dict[str, Dict[str, List[ContentElement]]]] = None,
+        max_chars: int = _ANALYSIS_SUMMARY_MAX_CHARS
+    ) -> str:
+        """
+        Prepares content elements for AI analysis.
+        The summary is capped at max_chars, split evenly across sources.
+        """
+        parts: List[str] = []
 
-        # Group by source
-        sources = {}
-        for element in content_elements:
-            if element.source not in sources:
-                sources[element.source] = []
-            sources[element.source].append(element)
-
-        for source, elements in sources.items():
-            summary += f"\n\n=== Source: {source} ===\n"
-            for element in elements:
-                if element.type == ContentType.TEXT:
-                    summary += f"Text: {element.content[:500]}...\n"
-                elif element.type == ContentType.TABLE:
-                    summary += f"Table: {element.metadata.get('table_title', 'Data table')}\n"
-                elif element.type == ContentType.IMAGE:
-                    summary += f"Image: {element.metadata.get('caption', 'Medical image')}\n"
-
-        return summary
-
-    def _parse_content_analysis(self, analysis_result: str) -> ContentAnalysis:
-        """Parses AI analysis into structured format"""
-        try:
-            # Attempt to extract JSON from the response
-            import json
+        if by_source is None:
+            by_source = self._group_by_source(content_elements)
+        if not by_source:
+            return ''
+        per_source = max_chars // len(by_source)
 
+        for source, content in by_source.items():
+            lines = chain(
+                (f"\n\n=== Source: {source} ===\n",),
+                (f"Text: {element.content[:500]}...\n" for element in content['text']),
+                (f"Table: {element.metadata.get('table_title', 'Data table')}\n" for element in content['tables']),
+                (f"Image: {element.metadata.get('caption', _DEFAULT_IMAGE_CAPTION)}\n" for element in content['images']),
+            )
+            remaining = per_source
+            for line in lines:
+                if len(line) >= remaining:
+                    parts.append(line[:remaining])
+                    break
+                parts.append(line)
+                remaining -= len(line)
+
+        return ''.join(parts)
+
+    def _parse_content_analysis(self, analysis_result: str) -> Optional[ContentAnalysis]:
+        """Parses AI analysis into structured format; None if it holds no usable JSON"""
+        try:
             # Find JSON in the response
-            json_match = re.search(r'\{.*\}', analysis_result, re.DOTALL)
-            if json_match:
-                analysis_data = json.loads(json_match.group())
-            else:
-                analysis_data = {}
+            json_text = _extract_json_object(analysis_result)
+            if not json_text:
+                logger.error("No JSON object found in content analysis response")
+                return None
+            analysis_data = json.loads(json_text)
 
             return ContentAnalysis(
                 similarities=analysis_data.get('similarities', []),
@@ -366,11 +823,8 @@ class EnhancedSynthesisEngine:
                 unique_insights=analysis_data.get('unique_insights', [])
             )
         except Exception as e:
-            logger.error(f"Failed to parse content analysis: {e}")
-            return ContentAnalysis(
-                similarities=[], differences=[], complementary_info=[],
-                contradictions=[], knowledge_gaps=[], unique_insights=[]
-            )
+            logger.error("Failed to parse content analysis: %s", e)
+            return None
 
     def _determine_optimal_structure(
         self,
@@ -384,11 +838,14 @@ class EnhancedSynthesisEngine:
         """
 
         # Start with comprehensive structure
-        base_structure = self._get_comprehensive_structure()
+        base_structure = _COMPREHENSIVE_STRUCTURE
 
         # Analyze which sections have substantial content
         content_coverage = self._analyze_content_coverage(content_elements)
 
+        # Tokenize each insight once rather than once per section
+        insight_terms = [_insight_terms(insight) for insight in content_analysis.unique_insights]
+
         # Filter sections based on content availability
         relevant_sections = []
         for section in base_structure:
@@ -399,9 +856,9 @@ class EnhancedSynthesisEngine:
             elif self._has_content_for_section(section, content_coverage):
                 relevant_sections.append(section)
             # Add custom sections for unique insights
-            elif content_analysis.unique_insights:
-                for insight in content_analysis.unique_insights:
-                    if self._section_matches_insight(section, insight):
+            elif insight_terms:
+                for terms in insight_terms:
+                    if self._section_matches_insight(section, terms):
                         relevant_sections.append(section)
 
         # Add any custom sections based on content analysis
@@ -411,30 +868,18 @@ class EnhancedSynthesisEngine:
                 # Insert in appropriate position
                 relevant_sections.insert(-2, custom_section)  # Before conclusion
 
-        logger.info(f"Determined {len(relevant_sections)} relevant sections for topic: {topic}")
+        logger.info("Determined %s relevant sections for topic: %s", len(relevant_sections), topic)
         return relevant_sections
 
     def _analyze_content_coverage(self, content_elements: List[ContentElement]) -> Dict[str, int]:
         """Analyzes which topics are covered in the content"""
-        coverage = {}
-
-        # Keywords for each section
-        section_keywords = {
-            "Epidemiology": ["incidence", "prevalence", "demographics", "statistics"],
-            "Pathophysiology": ["mechanism", "pathogenesis", "molecular", "cellular"],
-            "Clinical Presentation": ["symptoms", "signs", "presentation", "clinical"],
-            "Imaging": ["MRI", "CT", "X-ray", "ultrasound", "imaging"],
-            "Surgical Techniques": ["procedure", "technique", "approach", "surgical"],
-            # Add more mappings as needed
-        }
+        coverage = Counter()
 
+        # Per-element hits are scanned during extraction, in the worker
+        # processes when the pool is enabled; only the sums happen here
         for element in content_elements:
             if element.type == ContentType.TEXT:
-                content_lower = element.content.lower()
-                for section, keywords in section_keywords.items():
-                    for keyword in keywords:
-                        if keyword in content_lower:
-                            coverage[section] = coverage.get(section, 0) + 1
+                coverage.update(_coverage_hits(element))
 
         return coverage
 
@@ -442,13 +887,11 @@ class EnhancedSynthesisEngine:
         """Determines if there's enough content for a section"""
         return coverage.get(section, 0) > 0
 
-    def _section_matches_insight(self, section: str, insight: Dict[str, Any]) -> bool:
-        """Checks if a section matches a unique insight"""
-        insight_text = str(insight).lower()
+    def _section_matches_insight(self, section: str, insight_terms: Tuple[str, FrozenSet[str]]) -> bool:
+        """Checks if a section matches a unique insight (as returned by _insight_terms)"""
+        insight_text, insight_tokens = insight_terms
         section_lower = section.lower()
-        return section_lower in insight_text or any(
-            word in insight_text for word in section_lower.split()
-        )
+        return section_lower in insight_text or not insight_tokens.isdisjoint(section_lower.split())
 
     def _identify_custom_sections(
         self,
@@ -474,135 +917,176 @@ class EnhancedSynthesisEngine:
     def _aggregate_evidence_advanced(
         self,
         content_elements: List[ContentElement],
-        content_analysis: ContentAnalysis
+        content_analysis: ContentAnalysis,
+        by_source: Optional[Dict[str, Dict[str, List[ContentElement]]]] = None
     ) -> str:
         """
         Advanced evidence aggregation with deep understanding of relationships.
         Structures evidence to maintain context and relationships.
         """
 
-        evidence_text = "=== AGGREGATED EVIDENCE WITH ANALYSIS ===\n\n"
+        parts: List[str] = ["=== AGGREGATED EVIDENCE WITH ANALYSIS ===\n\n"]
 
         # Group content by type and source
-        by_source = {}
-        for element in content_elements:
-            if element.source not in by_source:
-                by_source[element.source] = {'text': [], 'tables': [], 'images': []}
+        if by_source is None:
+            by_source = self._group_by_source(content_elements)
 
-            if element.type == ContentType.TEXT:
-                by_source[element.source]['text'].append(element)
-            elif element.type == ContentType.TABLE:
-                by_source[element.source]['tables'].append(element)
-            elif element.type == ContentType.IMAGE:
-                by_source[element.source]['images'].append(element)
+        # Index which sources each relationship mentions, once
+        consistent_sources = self._sources_mentioned(content_analysis.similarities, by_source)
+        contradicting_sources = self._sources_mentioned(content_analysis.contradictions, by_source)
 
         # Structure evidence by source with relationships noted
         for source, content in by_source.items():
-            evidence_text += f"\n### Source: {source}\n"
+            parts.append(f"\n### Source: {source}\n")
 
             # Add text content
             for text_element in content['text']:
-                evidence_text += f"\nContent: {text_element.content}\n"
-                evidence_text += f"Citation: {text_element.citation}\n"
+                parts.append(f"\nContent: {text_element.content}\n")
+                parts.append(f"Citation: {text_element.citation}\n")
 
                 # Note relationships
-                for similarity in content_analysis.similarities:
-                    if source in str(similarity):
-                        evidence_text += f"[CONSISTENT WITH OTHER SOURCES]\n"
+                if source in consistent_sources:
+                    parts.append("[CONSISTENT WITH OTHER SOURCES]\n")
 
-                for contradiction in content_analysis.contradictions:
-                    if source in str(contradiction):
-                        evidence_text += f"[CONTRADICTS OTHER SOURCES - NEEDS RECONCILIATION]\n"
+                if source in contradicting_sources:
+                    parts.append("[CONTRADICTS OTHER SOURCES - NEEDS RECONCILIATION]\n")
 
             # Add table references
             for table in content['tables']:
-                evidence_text += f"\nTable: {table.metadata.get('table_title', 'Data table')}\n"
-                evidence_text += f"Data: {table.content}\n"
+                parts.append(f"\nTable: {table.metadata.get('table_title', 'Data table')}\n")
+                parts.append(f"Data: {table.content}\n")
 
             # Add image references
             for image in content['images']:
-                evidence_text += f"\nImage: {image.metadata.get('caption', '')}\n"
-                evidence_text += f"Path: {image.content}\n"
-                evidence_text += "[IMAGE AVAILABLE FOR INCLUSION]\n"
+                parts.append(f"\nImage: {image.metadata.get('caption', '')}\n")
+                parts.append(f"Path: {image.content}\n")
+                parts.append("[IMAGE AVAILABLE FOR INCLUSION]\n")
 
         # Add analysis summary
-        evidence_text += "\n\n=== CONTENT ANALYSIS SUMMARY ===\n"
-        evidence_text += f"Contradictions found: {len(content_analysis.contradictions)}\n"
-        evidence_text += f"Knowledge gaps identified: {', '.join(content_analysis.knowledge_gaps)}\n"
-        evidence_text += f"Unique insights: {len(content_analysis.unique_insights)}\n"
+        parts.append("\n\n=== CONTENT ANALYSIS SUMMARY ===\n")
+        parts.append(f"Contradictions found: {len(content_analysis.contradictions)}\n")
+        parts.append(f"Knowledge gaps identified: {', '.join(content_analysis.knowledge_gaps)}\n")
+        parts.append(f"Unique insights: {len(content_analysis.unique_insights)}\n")
 
-        return evidence_text
+        return ''.join(parts)
+
+    @staticmethod
+    def _sources_mentioned(items: List[Any], sources) -> set:
+        """
+        Returns the sources referenced by analysis items. Names in an item's
+        'source'/'sources' fields match a known source when either contains
+        the other (AI output often shortens titles); items whose names match
+        nothing fall back to searching the item's text for each source.
+        """
+        sources_lower = {source: source.lower() for source in sources}
+        mentioned = set()
+        for item in items:
+            names = []
+            if isinstance(item, dict):
+                if item.get('source'):
+                    names.append(item['source'])
+                sources_field = item.get('sources') or []
+                if isinstance(sources_field, str):
+                    sources_field = [sources_field]
+                names.extend(sources_field)
+
+            matched = set()
+            for name in names:
+                name = str(name).strip().lower()
+                if name:
+                    matched.update(
+                        source for source, source_lower in sources_lower.items()
+                        if name in source_lower or source_lower in name
+                    )
+
+            if not matched:
+                item_text = str(item)
+                matched = {source for source in sources if source in item_text}
+            mentioned |= matched
+        return mentioned
 
     async def _generate_comprehensive_section(
         self,
         section_name: str,
         content_elements: List[ContentElement],
-        content_analysis: ContentAnalysis,
+        top_contradictions: List[Dict[str, Any]],
+        has_contradictions: bool,
         aggregated_evidence: str,
         topic: str,
         include_images: bool
-    ) -> Optional[str]:
+    ) -> Tuple[Optional[str], bool]:
         """
         Generates comprehensive section content with all subtleties preserved.
         Integrates all available information seamlessly.
+        Returns the content (None to skip the section) and whether synthesis failed.
         """
 
         # Filter relevant content for this section
-        section_evidence = self._filter_evidence_for_section(
+        section_evidence = await asyncio.to_thread(
+            self._filter_evidence_for_section,
             section_name,
             content_elements,
             aggregated_evidence
         )
 
         if not section_evidence and section_name not in ["Introduction", "Conclusion"]:
-            return None  # Skip sections without relevant content
+            return None, False  # Skip sections without relevant content
 
         # Identify images for this section
         section_images = []
         if include_images:
-            section_images = self._identify_section_images(section_name, content_elements)
-
-        # Generate comprehensive prompt with strict constraints
-        prompt = self._create_comprehensive_section_prompt(
-            section_name=section_name,
-            topic=topic,
-            section_evidence=section_evidence,
-            content_analysis=content_analysis,
-            section_images=section_images
-        )
+            section_images = await asyncio.to_thread(
+                self._identify_section_images, section_name, content_elements
+            )
 
+        # Prompt building and post-processing run in worker threads, so other
+        # sections' AI requests keep being issued while this one is assembled
         try:
             # Handle standalone mode
             if self.standalone_mode:
                 # Basic section generation without AI
-                section_content = self._generate_basic_section(
+                section_content = await asyncio.to_thread(
+                    self._generate_basic_section,
                     section_name, topic, section_evidence, section_images
                 )
             else:
+                # Generate comprehensive prompt with strict constraints
+                prompt = await asyncio.to_thread(
+                    self._create_comprehensive_section_prompt,
+                    section_name=section_name,
+                    topic=topic,
+                    section_evidence=section_evidence,
+                    top_contradictions=top_contradictions,
+                    section_images=section_images
+                )
+
                 # Generate section using Claude with strict adherence
-                section_content = await self.hybrid_ai_manager.query(
+                section_content = await self._cached_query(
                     "Claude",
                     prompt,
                     use_fallback=False
                 )
+                if not _is_ai_response(section_content):
+                    raise RuntimeError(section_content or "empty AI response")
 
             # Post-process to ensure all subtleties are included
-            section_content = self._post_process_section(
+            section_content = await asyncio.to_thread(
+                self._post_process_section,
                 section_content,
                 section_images,
-                content_analysis
+                has_contradictions
             )
 
-            return section_content
+            return section_content, False
 
         except Exception as e:
-            logger.error(f"Failed to generate section {section_name}: {e}")
+            logger.error("Failed to generate section %s: %s", section_name, e)
 
             # Fallback: Return structured gap notification
             if not section_evidence:
-                return f"Information regarding {section_name} for {topic} is not available in the internal reference library."
+                return f"Information regarding {section_name} for {topic} is not available in the internal reference library.", True
             else:
-                return f"Error generating content for {section_name}. Evidence available but synthesis failed."
+                return f"Error generating content for {section_name}. Evidence available but synthesis failed.", True
 
     def _filter_evidence_for_section(
         self,
@@ -612,27 +1096,18 @@ class EnhancedSynthesisEngine:
     ) -> str:
         """Filters evidence relevant to specific section"""
 
-        section_keywords = {
-            "Introduction": ["overview", "definition", "background", "introduction"],
-            "Epidemiology": ["incidence", "prevalence", "demographics", "statistics", "frequency"],
-            "Pathophysiology": ["mechanism", "pathogenesis", "molecular", "cellular", "pathway"],
-            "Clinical Presentation": ["symptoms", "signs", "presentation", "clinical", "features"],
-            "Diagnosis": ["diagnostic", "criteria", "diagnosis", "workup", "evaluation"],
-            "Imaging": ["MRI", "CT", "X-ray", "ultrasound", "imaging", "radiological"],
-            "Surgical Anatomy": ["anatomy", "anatomical", "landmarks", "structures", "approach"],
-            "Surgical Techniques": ["procedure", "technique", "approach", "surgical", "operation"],
-            "Complications": ["complication", "adverse", "risk", "morbidity", "mortality"],
-            "Prognosis": ["survival", "outcome", "prognosis", "progression", "recurrence"],
-            # Add more as needed
-        }
-
-        keywords = section_keywords.get(section_name, [section_name.lower()])
+        bit = _SECTION_BIT.get(section_name)
+        if bit is not None:
+            # Keyword hits were precomputed per element as a section bitmask
+            matches = lambda element: _section_mask(element) & bit
+        else:
+            pattern = _keyword_pattern(frozenset({section_name.lower()}))
+            matches = lambda element: pattern.search(element.content)
 
         filtered_evidence = ""
         for element in content_elements:
             if element.type == ContentType.TEXT:
-                content_lower = element.content.lower()
-                if any(keyword in content_lower for keyword in keywords):
+                if matches(element):
                     filtered_evidence += f"\nSource: {element.source}\n"
                     filtered_evidence += f"Content: {element.content}\n"
                     filtered_evidence += f"Citation: {element.citation}\n\n"
@@ -647,7 +1122,7 @@ class EnhancedSynthesisEngine:
         images: List[ContentElement]
     ) -> str:
         """Generate basic section content without AI for standalone mode"""
-        content = f"## {section_name}\n\n"
+        parts: List[str] = [f"## {section_name}\n\n"]
 
         if evidence:
             # Extract and format the evidence
@@ -659,20 +1134,20 @@ class EnhancedSynthesisEngine:
                 elif line.startswith('Content:'):
                     text = line.replace('Content:', '').strip()
                     if text:
-                        content += f"{text}\n\n"
+                        parts.append(f"{text}\n\n")
                         if current_source:
-                            content += f"*Source: {current_source}*\n\n"
+                            parts.append(f"*Source: {current_source}*\n\n")
         else:
-            content += f"Information regarding {section_name} for {topic} is not available in the internal reference library.\n"
+            parts.append(f"Information regarding {section_name} for {topic} is not available in the internal reference library.\n")
 
         # Add image references
         if images:
-            content += "\n### Related Images\n"
+            parts.append("\n### Related Images\n")
             for img in images:
-                caption = img.metadata.get('caption', 'Medical image')
-                content += f"- [Image: {caption}]\n"
+                caption = img.metadata.get('caption', _DEFAULT_IMAGE_CAPTION)
+                parts.append(f"- [Image: {caption}]\n")
 
-        return content
+        return ''.join(parts)
 
     def _identify_section_images(
         self,
@@ -683,20 +1158,14 @@ class EnhancedSynthesisEngine:
 
         section_images = []
 
-        # Keywords for image relevance
-        image_keywords = {
-            "Surgical Anatomy": ["anatomy", "anatomical", "structure"],
-            "Imaging": ["MRI", "CT", "scan", "radiograph"],
-            "Surgical Techniques": ["procedure", "technique", "step", "approach"],
-            "Pathology": ["histology", "microscopy", "specimen"]
-        }
-
-        keywords = image_keywords.get(section_name, [])
+        keywords = _IMAGE_KEYWORDS.get(section_name)
+        if not keywords:
+            return section_images
+        pattern = _keyword_pattern(keywords)
 
         for element in content_elements:
             if element.type == ContentType.IMAGE:
-                caption = element.metadata.get('caption', '').lower()
-                if any(keyword in caption for keyword in keywords):
+                if pattern.search(element.metadata.get('caption', '')):
                     section_images.append(element)
 
         return section_images
@@ -706,86 +1175,84 @@ class EnhancedSynthesisEngine:
         section_name: str,
         topic: str,
         section_evidence: str,
-        content_analysis: ContentAnalysis,
+        top_contradictions: List[Dict[str, Any]],
         section_images: List[ContentElement]
     ) -> str:
         """Creates comprehensive prompt for section generation"""
 
-        prompt = f"""
-        TASK: Generate the '{section_name}' section for a comprehensive neurosurgical chapter on '{topic}'.
-
-        CRITICAL REQUIREMENTS:
-        1. MUST synthesize ALL information provided in the evidence below
-        2. MUST preserve ALL subtleties and detailed information
-        3. MUST integrate information from multiple sources seamlessly
-        4. MUST explicitly note any contradictions found between sources
-        5. MUST include citations for all statements
-        6. If evidence is insufficient, state: "Additional information regarding [specific aspect] is not available in the internal reference library."
-
-        SYNTHESIS GUIDELINES:
-        - Combine similar information from multiple sources into coherent paragraphs
-        - Preserve unique details from each source
-        - When sources disagree, present both perspectives with citations
-        - Include all relevant statistics, measurements, and specific data
-        - Maintain medical accuracy and professional terminology
-        """
+        # Static instructions come first so every section prompt shares a
+        # byte-identical prefix that provider prompt caching can reuse
+        parts: List[str] = [
+            _SECTION_PROMPT_PREFIX,
+            f"\n        TASK: Generate the '{section_name}' section for a comprehensive neurosurgical chapter on '{topic}'."
+        ]
 
         # Add specific contradictions to address
-        if content_analysis.contradictions:
-            prompt += "\n\nCONTRADICTIONS TO ADDRESS:\n"
-            for contradiction in content_analysis.contradictions[:3]:  # Limit to top 3
-                prompt += f"- {contradiction}\n"
+        if top_contradictions:
+            parts.append("\n\nCONTRADICTIONS TO ADDRESS:\n")
+            for contradiction in top_contradictions:
+                parts.append(f"- {contradiction}\n")
 
         # Add evidence
-        prompt += f"\n\nEVIDENCE TO SYNTHESIZE:\n{section_evidence}"
+        parts.append(f"\n\nEVIDENCE TO SYNTHESIZE:\n{section_evidence}")
 
         # Note available images
         if section_images:
-            prompt += "\n\nIMAGES AVAILABLE FOR THIS SECTION:\n"
+            parts.append("\n\nIMAGES AVAILABLE FOR THIS SECTION:\n")
             for img in section_images:
-                prompt += f"- {img.metadata.get('caption', 'Medical image')} [{img.citation}]\n"
-            prompt += "Note: Reference these images where appropriate using [Image: caption]"
+                parts.append(f"- {img.metadata.get('caption', _DEFAULT_IMAGE_CAPTION)} [{img.citation}]\n")
+            parts.append("Note: Reference these images where appropriate using [Image: caption]")
 
-        prompt += "\n\nGenerate comprehensive, well-structured content that includes ALL provided information:"
+        parts.append("\n\nGenerate comprehensive, well-structured content that includes ALL provided information:")
 
-        return prompt
+        return ''.join(parts)
 
     def _post_process_section(
         self,
         section_content: str,
         section_images: List[ContentElement],
-        content_analysis: ContentAnalysis
+        has_contradictions: bool
     ) -> str:
         """Post-processes section to ensure completeness"""
 
+        parts: List[str] = [section_content]
+
         # Add image placeholders if not already included
         if section_images and "[Image:" not in section_content:
-            image_refs = "\n\n**Relevant Images:**\n"
+            parts.append("\n\n**Relevant Images:**\n")
             for img in section_images:
-                caption = img.metadata.get('caption', 'Medical image')
-                image_refs += f"- [Image: {caption}] - {img.citation}\n"
-            section_content += image_refs
+                caption = img.metadata.get('caption', _DEFAULT_IMAGE_CAPTION)
+                parts.append(f"- [Image: {caption}] - {img.citation}\n")
 
         # Add contradiction notes if significant
-        if len(content_analysis.contradictions) > 0 and "Note:" not in section_content:
-            section_content += "\n\n*Note: Some variations exist in the literature regarding specific aspects of this topic.*"
+        if has_contradictions and not any("Note:" in part for part in parts):
+            parts.append("\n\n*Note: Some variations exist in the literature regarding specific aspects of this topic.*")
 
-        return section_content
+        return ''.join(parts)
 
 
-    def _extract_image_references(self, content_elements: List[ContentElement]) -> List[Dict[str, Any]]:
+    def _extract_image_references(
+        self,
+        content_elements: List[ContentElement],
+        by_source: Optional[Dict[str, Dict[str, List[ContentElement]]]] = None
+    ) -> List[Dict[str, Any]]:
         """Extracts all image references for the chapter"""
 
+        # The per-source image lists already hold exactly the image elements
+        if by_source is None:
+            by_source = self._group_by_source(content_elements)
+
         images = []
-        for element in content_elements:
-            if element.type == ContentType.IMAGE:
+        for content in by_source.values():
+            for element in content['images']:
+                metadata = element.metadata
                 images.append({
                     'path': element.content,
-                    'caption': element.metadata.get('caption', ''),
+                    'caption': metadata.get('caption', ''),
                     'source': element.source,
                     'citation': element.citation,
                     'draggable': True,
-                    'figure_number': element.metadata.get('figure_number', '')
+                    'figure_number': metadata.get('figure_number', '')
                 })
 
         return images
@@ -793,7 +1260,7 @@ class EnhancedSynthesisEngine:
     def _compile_comprehensive_chapter(
         self,
         topic: str,
-        content: Dict[str, str],
+        content: List[Tuple[str, str]],
         images: List[Dict[str, Any]],
         content_analysis: ContentAnalysis,
         metadata: Dict[str, Any]
@@ -802,7 +1269,8 @@ class EnhancedSynthesisEngine:
 
         return {
             "topic": topic,
-            "content": content,
+            # Consumers look sections up and add new ones by name
+            "content": dict(content),
             "images": images,
             "analysis": {
                 "contradictions": content_analysis.contradictions,
@@ -817,16 +1285,62 @@ class EnhancedSynthesisEngine:
         }
 
 
+def _extract_pdf_images(pdf_path: str, topic_keywords: List[str], output_dir: Path) -> List[Dict[str, Any]]:
+    """
+    Writes out the embedded images of pages mentioning any topic keyword.
+    Pages are filtered on their text first, so irrelevant pages never have
+    their images decoded; image streams are saved as stored, without re-encoding.
+    Module-level so batches can run one PDF per worker process.
+    """
+    images = []
+    keywords = [kw.lower() for kw in topic_keywords]
+    pdf_stem = Path(pdf_path).stem
+    seen_xrefs = set()
+
+    with fitz.open(pdf_path) as doc:
+        for page in doc:
+            text = page.get_text("text").lower()
+            matched = [kw for kw in keywords if kw in text]
+            if not matched:
+                continue
+
+            for image_info in page.get_images(full=True):
+                xref = image_info[0]
+                # Figures reused across pages (logos, headers) are saved once
+                if xref in seen_xrefs:
+                    continue
+                seen_xrefs.add(xref)
+
+                extracted = doc.extract_image(xref)
+                if not extracted:
+                    continue
+
+                image_path = output_dir / f"{pdf_stem}_p{page.number + 1}_x{xref}.{extracted['ext']}"
+                image_path.write_bytes(extracted['image'])
+
+                images.append({
+                    'path': str(image_path),
+                    'caption': f"Figure from {pdf_stem}, page {page.number + 1} ({', '.join(matched)})",
+                    'page_number': page.number + 1,
+                    'confidence': len(matched) / len(keywords),
+                    'draggable': True
+                })
+
+    return images
+
+
 class ImageExtractor:
     """Handles extraction and management of images from PDFs and other sources"""
 
-    def __init__(self, output_dir: Path = Path("extracted_images")):
-        self.output_dir = output_dir
+    def __init__(self, output_dir: Union[str, os.PathLike] = Path("extracted_images")):
+        self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        # Relative image paths resolve against the working directory at construction
+        self._cwd = os.getcwd()
 
     async def extract_images_from_pdf(
         self,
-        pdf_path: str,
+        pdf_path: Union[str, os.PathLike],
         topic_keywords: List[str]
     ) -> List[Dict[str, Any]]:
         """
@@ -834,14 +1348,18 @@ class ImageExtractor:
         Makes images easily draggable for manual insertion.
         """
 
+        pdf_path = os.fspath(pdf_path)
         images = []
 
         try:
-            # This would integrate with PDF extraction library
-            # For now, returning structure
-            logger.info(f"Extracting images from {pdf_path} for keywords: {topic_keywords}")
+            logger.info("Extracting images from %s for keywords: %s", pdf_path, topic_keywords)
 
-            # Example structure for extracted images
+            if PYMUPDF_AVAILABLE:
+                # PyMuPDF is not thread-safe, so scans run one at a time in a
+                # worker thread off the event loop
+                return await asyncio.to_thread(self._extract_pdf_images_locked, pdf_path, topic_keywords)
+
+            # Without PyMuPDF, return the example structure
             images.append({
                 'path': str(self.output_dir / f"{topic_keywords[0]}_anatomy.png"),
                 'caption': f"Anatomical illustration relevant to {topic_keywords[0]}",
@@ -851,23 +1369,66 @@ class ImageExtractor:
             })
 
         except Exception as e:
-            logger.error(f"Failed to extract images: {e}")
+            logger.error("Failed to extract images: %s", e)
 
         return images
 
+    def _extract_pdf_images_locked(self, pdf_path: str, topic_keywords: List[str]) -> List[Dict[str, Any]]:
+        """Runs _extract_pdf_images while holding the process-wide PyMuPDF lock"""
+        with _PYMUPDF_LOCK:
+            return _extract_pdf_images(pdf_path, topic_keywords, self.output_dir)
+
+    async def extract_images_from_pdfs(
+        self,
+        pdf_paths: List[Union[str, os.PathLike]],
+        topic_keywords: List[str],
+        max_workers: Optional[int] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Extracts images from many PDFs, reading and scanning them in parallel
+        with one PDF per worker process. Returns images keyed by PDF path.
+        """
+        pdf_paths = [os.fspath(pdf_path) for pdf_path in pdf_paths]
+        if not PYMUPDF_AVAILABLE or len(pdf_paths) < 2:
+            results = [await self.extract_images_from_pdf(pdf_path, topic_keywords) for pdf_path in pdf_paths]
+            return dict(zip(pdf_paths, results))
+
+        logger.info("Extracting images from %s PDFs for keywords: %s", len(pdf_paths), topic_keywords)
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=_WORKER_CONTEXT) as pool:
+            results = await asyncio.gather(
+                *[
+                    loop.run_in_executor(pool, _extract_pdf_images, pdf_path, topic_keywords, self.output_dir)
+                    for pdf_path in pdf_paths
+                ],
+                return_exceptions=True
+            )
+
+        images = {}
+        for pdf_path, result in zip(pdf_paths, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to extract images from %s: %s", pdf_path, result)
+                result = []
+            images[pdf_path] = result
+        return images
+
     def prepare_images_for_drag_drop(self, images: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Prepares images for easy drag-and-drop into documents"""
 
         for image in images:
-            # Ensure absolute path for easy access
-            if 'path' in image:
-                image['absolute_path'] = str(Path(image['path']).absolute())
-                image['relative_path'] = image['path']
-                image['draggable'] = True
-
-                # Add HTML snippet for easy insertion
-                caption = image.get('caption', '')
-                image['html_snippet'] = f'<figure><img src="{image["path"]}" alt="{caption}"><figcaption>{caption}</figcaption></figure>'
+            # Skip images without a path or already prepared
+            path = image.get('path')
+            if path is None or 'absolute_path' in image:
+                continue
+
+            # Ensure absolute path for easy access, plus an HTML snippet for easy insertion
+            caption = image.get('caption', '')
+            image.update({
+                'absolute_path': os.path.normpath(os.path.join(self._cwd, path)),
+                'relative_path': path,
+                'draggable': True,
+                'html_snippet': f'<figure><img src="{path}" alt="{caption}"><figcaption>{caption}</figcaption></figure>'
+            })
 
         return images
 
@@ -876,8 +1437,40 @@ class ImageExtractor:
 class SynthesizerServiceAdapter:
     """Adapter to integrate enhanced synthesizer with existing system"""
 
-    def __init__(self, enhanced_engine: EnhancedSynthesisEngine):
+    def __init__(
+        self,
+        enhanced_engine: EnhancedSynthesisEngine,
+        cache: Optional[Any] = None,
+        cache_ttl: int = _CHAPTER_CACHE_TTL
+    ):
+        """
+        Args:
+            enhanced_engine: Engine used for synthesis
+            cache: Optional store with get(key) and set(key, value, ttl) methods
+                (e.g. a diskcache.Cache or a Redis-backed wrapper); None disables caching
+            cache_ttl: Seconds a cached chapter stays valid
+        """
         self.engine = enhanced_engine
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+
+    @staticmethod
+    def _chapter_cache_key(
+        topic: str,
+        internal_refs: List[Dict[str, Any]],
+        options: Dict[str, Any]
+    ) -> str:
+        """Canonical key for a topic, reference set and options"""
+        h = hashlib.blake2b(topic.strip().lower().encode(), digest_size=16)
+        ref_ids = sorted(
+            str(ref['id']) if 'id' in ref else hashlib.blake2b(
+                json.dumps(ref, sort_keys=True, default=str).encode(), digest_size=16
+            ).hexdigest()
+            for ref in internal_refs
+        )
+        h.update('|'.join(ref_ids).encode())
+        h.update(json.dumps(options, sort_keys=True, default=str).encode())
+        return 'chapter:' + h.hexdigest()
 
     async def synthesize_chapter(
         self,
@@ -889,8 +1482,29 @@ class SynthesizerServiceAdapter:
 
         options = options or {}
 
-        return await self.engine.synthesize_initial_chapter(
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self._chapter_cache_key(topic, internal_refs, options)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info("Using cached chapter for topic: %s", topic)
+                # Callers enrich and merge into the returned chapter in place
+                return copy.deepcopy(cached)
+
+        chapter = await self.engine.synthesize_initial_chapter(
             topic=topic,
             internal_references=internal_refs,
             include_images=options.get('include_images', True)
-        )
\ No newline at end of file
+        )
+
+        # Chapters with fallback text in place of failed sections are not
+        # cached, so the next request retries synthesis
+        if chapter is not None and chapter['metadata']['failed_sections']:
+            logger.warning(
+                "Not caching chapter for topic %s; failed sections: %s",
+                topic, ', '.join(chapter['metadata']['failed_sections'])
+            )
+        elif cache_key is not None and chapter is not None:
+            self.cache.set(cache_key, copy.deepcopy(chapter), self.cache_ttl)
+
+        return chapter
\ No newline at end of file
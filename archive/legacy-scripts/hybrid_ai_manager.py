@@ -75,7 +75,7 @@ class ClaudeService(AIServiceInterface):
 
     async def query(self, prompt: str, **kwargs) -> AIResponse:
         """Query Claude API"""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Simulate Claude API call (replace with actual implementation)
@@ -92,7 +92,7 @@ class ClaudeService(AIServiceInterface):
                 provider=AIProvider.CLAUDE,
                 model=self.config.model_name,
                 tokens_used=len(prompt.split()) * 2,
-                response_time=time.time() - start_time,
+                response_time=time.perf_counter() - start_time,
                 success=True
             )
 
@@ -103,7 +103,7 @@ class ClaudeService(AIServiceInterface):
                 provider=AIProvider.CLAUDE,
                 model=self.config.model_name,
                 tokens_used=0,
-                response_time=time.time() - start_time,
+                response_time=time.perf_counter() - start_time,
                 success=False,
                 error=str(e)
             )
@@ -121,7 +121,7 @@ class GPTService(AIServiceInterface):
 
     async def query(self, prompt: str, **kwargs) -> AIResponse:
         """Query OpenAI API"""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Simulate OpenAI API call (replace with actual implementation)
@@ -137,7 +137,7 @@ class GPTService(AIServiceInterface):
                 provider=self.config.provider,
                 model=self.config.model_name,
                 tokens_used=len(prompt.split()) * 2,
-                response_time=time.time() - start_time,
+                response_time=time.perf_counter() - start_time,
                 success=True
             )
 
@@ -148,7 +148,7 @@ class GPTService(AIServiceInterface):
                 provider=self.config.provider,
                 model=self.config.model_name,
                 tokens_used=0,
-                response_time=time.time() - start_time,
+                response_time=time.perf_counter() - start_time,
                 success=False,
                 error=str(e)
             )
@@ -5,6 +5,8 @@ Shows how to use the integrated system for various scenarios
 
 import asyncio
 import logging
+import os
+import sys
 from pathlib import Path
 
 # Configure logging
@@ -32,24 +34,27 @@ async def example_basic_synthesis():
         }
     )
 
-    # Generate a complete chapter on a topic
-    chapter = await system.generate_chapter(
-        topic="Glioblastoma Multiforme",
-        options={
-            "specialty": "neurosurgery",
-            "max_sources": 15,
-            "include_images": True
-        }
-    )
-
-    # Access the synthesized content
-    print(f"Chapter Status: {chapter['status']}")
-    print(f"Sources Used: {chapter['search_metadata']['sources_used']}")
-
-    # Print each section
-    for section_name, content in chapter['content'].items():
-        print(f"\n=== {section_name} ===")
-        print(content[:500] + "...")  # Preview first 500 chars
+    try:
+        # Generate a complete chapter on a topic
+        chapter = await system.generate_chapter(
+            topic="Glioblastoma Multiforme",
+            options={
+                "specialty": "neurosurgery",
+                "max_sources": 15,
+                "include_images": True
+            }
+        )
+
+        # Access the synthesized content
+        print(f"Chapter Status: {chapter['status']}")
+        print(f"Sources Used: {chapter['search_metadata']['sources_used']}")
+
+        # Print each section
+        for section_name, content in chapter['content'].items():
+            print(f"\n=== {section_name} ===")
+            print(content[:500] + "...")  # Preview first 500 chars
+    finally:
+        system.shutdown()
 
 
 async def example_search_then_select():
@@ -65,28 +70,31 @@ async def example_search_then_select():
     ai_manager = HybridAIManager(claude_api_key="your-key")
     system = IntegratedReferenceSystem(library, ai_manager)
 
-    # Step 1: Search for references
-    search_results = await system.search_references(
-        query="cerebral aneurysm clipping",
-        limit=20
-    )
+    try:
+        # Step 1: Search for references
+        search_results = await system.search_references(
+            query="cerebral aneurysm clipping",
+            limit=20
+        )
 
-    # Step 2: Display results for user selection
-    print("Found References:")
-    for i, ref in enumerate(search_results):
-        print(f"{i+1}. {ref['title']} ({ref['textbook']}) - Relevance: {ref['relevance']:.2f}")
+        # Step 2: Display results for user selection
+        print("Found References:")
+        for i, ref in enumerate(search_results):
+            print(f"{i+1}. {ref['title']} ({ref['textbook']}) - Relevance: {ref['relevance']:.2f}")
 
-    # Step 3: Simulate user selection (in real app, this would be interactive)
-    selected_indices = [0, 2, 4, 7]  # User selects these references
-    selected_ids = [search_results[i]['id'] for i in selected_indices]
+        # Step 3: Simulate user selection (in real app, this would be interactive)
+        selected_indices = [0, 2, 4, 7]  # User selects these references
+        selected_ids = [search_results[i]['id'] for i in selected_indices]
 
-    # Step 4: Synthesize with selected references
-    chapter = await system.synthesize_from_selected(
-        topic="Cerebral Aneurysm Clipping Technique",
-        chapter_ids=selected_ids
-    )
+        # Step 4: Synthesize with selected references
+        chapter = await system.synthesize_from_selected(
+            topic="Cerebral Aneurysm Clipping Technique",
+            chapter_ids=selected_ids
+        )
 
-    print(f"\nSynthesized chapter using {len(selected_ids)} selected references")
+        print(f"\nSynthesized chapter using {len(selected_ids)} selected references")
+    finally:
+        system.shutdown()
 
 
 async def example_multi_topic_batch():
@@ -110,22 +118,28 @@ async def example_multi_topic_batch():
         "Spinal Stenosis"
     ]
 
-    # Process all topics in parallel
-    tasks = []
-    for topic in topics:
-        tasks.append(system.generate_chapter(topic))
+    # Process topics in parallel, capped to stay within AI provider rate limits
+    semaphore = asyncio.Semaphore(int(os.getenv("NSEXP_CHAPTER_CONCURRENCY", "4")))
 
-    # Wait for all to complete
-    chapters = await asyncio.gather(*tasks, return_exceptions=True)
+    async def generate(topic):
+        async with semaphore:
+            try:
+                return topic, await system.generate_chapter(topic)
+            except Exception as e:
+                return topic, e
 
-    # Report results
-    for topic, chapter in zip(topics, chapters):
-        if isinstance(chapter, dict):
-            status = chapter.get('status', 'UNKNOWN')
-            sources = chapter.get('search_metadata', {}).get('sources_used', 0)
-            print(f"{topic}: {status} ({sources} sources)")
-        else:
-            print(f"{topic}: ERROR - {chapter}")
+    try:
+        # Report each result as soon as its chapter completes
+        for next_done in asyncio.as_completed([generate(topic) for topic in topics]):
+            topic, chapter = await next_done
+            if isinstance(chapter, dict):
+                status = chapter.get('status', 'UNKNOWN')
+                sources = chapter.get('search_metadata', {}).get('sources_used', 0)
+                print(f"{topic}: {status} ({sources} sources)")
+            else:
+                print(f"{topic}: ERROR - {chapter}")
+    finally:
+        system.shutdown()
 
 
 async def example_progressive_enrichment():
@@ -134,20 +148,21 @@ async def example_progressive_enrichment():
     """
     from reference_search_bridge import IntegratedReferenceSystem
     from reference_library import ReferenceLibraryService
-    from enhanced_synthesizer_service import EnhancedSynthesisEngine
     from hybrid_ai_manager import HybridAIManager
 
     # Initialize
     library = ReferenceLibraryService()
     ai_manager = HybridAIManager(claude_api_key="your-key")
-    synthesizer = EnhancedSynthesisEngine(ai_manager)
     system = IntegratedReferenceSystem(library, ai_manager)
 
     topic = "Deep Brain Stimulation"
 
     # Step 1: Initial synthesis from internal library
-    logger.info(f"Step 1: Synthesizing from internal library...")
-    initial_chapter = await system.generate_chapter(topic)
+    logger.info("Step 1: Synthesizing from internal library...")
+    try:
+        initial_chapter = await system.generate_chapter(topic)
+    finally:
+        system.shutdown()
 
     # Step 2: Identify knowledge gaps
     knowledge_gaps = initial_chapter.get('analysis', {}).get('knowledge_gaps', [])
@@ -177,23 +192,24 @@ async def example_quality_filtering():
     # Initialize with custom config
     library = ReferenceLibraryService()
     ai_manager = HybridAIManager(claude_api_key="your-key")
-    synthesizer = EnhancedSynthesisEngine(ai_manager)
-
-    # Create bridge with custom config
-    bridge = ReferenceSearchBridge(library, synthesizer)
-    bridge.config = SearchConfig(
-        max_results=30,
-        min_relevance_score=0.7,  # Higher threshold
-        include_images=True,
-        include_tables=True
-    )
 
-    # Synthesize with quality filtering
-    high_quality_chapter = await bridge.synthesize_from_library(
-        topic="Microsurgical Techniques",
-        specialty="neurosurgery",
-        max_sources=10  # Will be filtered by relevance score
-    )
+    # The engine's extraction workers are released when the block exits
+    with EnhancedSynthesisEngine(ai_manager) as synthesizer:
+        # Create bridge with custom config
+        bridge = ReferenceSearchBridge(library, synthesizer)
+        bridge.config = SearchConfig(
+            max_results=30,
+            min_relevance_score=0.7,  # Higher threshold
+            include_images=True,
+            include_tables=True
+        )
+
+        # Synthesize with quality filtering
+        high_quality_chapter = await bridge.synthesize_from_library(
+            topic="Microsurgical Techniques",
+            specialty="neurosurgery",
+            max_sources=10  # Will be filtered by relevance score
+        )
 
     sources_found = high_quality_chapter['search_metadata']['total_sources_found']
     sources_used = high_quality_chapter['search_metadata']['sources_used']
@@ -214,28 +230,37 @@ async def example_monitoring_and_stats():
         ai_config={"claude_api_key": "your-key"}
     )
 
-    # Get system statistics
-    stats = await system.get_system_stats()
-    print("System Statistics:")
-    print(f"- Total Textbooks: {stats['total_textbooks']}")
-    print(f"- Total Chapters: {stats['total_chapters']}")
-    print(f"- Indexed Content: {stats['indexed_content_gb']} GB")
-    print(f"- Search Index Size: {stats['search_index_size']} entries")
-    print(f"- Extraction Quality: {stats['extraction_quality']:.2%}")
-
-    # Measure synthesis performance
-    start_time = time.time()
-
-    chapter = await system.generate_chapter("Brain Tumor Classification")
-
-    end_time = time.time()
-    synthesis_time = end_time - start_time
-
-    print(f"\nSynthesis Performance:")
-    print(f"- Time taken: {synthesis_time:.2f} seconds")
-    print(f"- Sources processed: {chapter['search_metadata']['sources_used']}")
-    print(f"- Sections generated: {len(chapter['content'])}")
-    print(f"- Performance: {len(chapter['content']) / synthesis_time:.2f} sections/second")
+    try:
+        # Get system statistics
+        stats = await system.get_system_stats()
+        # Each report goes out in a single write so stdout doesn't skew the timing below
+        sys.stdout.write("\n".join([
+            "System Statistics:",
+            f"- Total Textbooks: {stats['total_textbooks']}",
+            f"- Total Chapters: {stats['total_chapters']}",
+            f"- Indexed Content: {stats['indexed_content_gb']} GB",
+            f"- Search Index Size: {stats['search_index_size']} entries",
+            f"- Extraction Quality: {stats['extraction_quality']:.2%}",
+        ]) + "\n")
+        sys.stdout.flush()
+
+        # Measure synthesis performance
+        start_ns = time.perf_counter_ns()
+
+        chapter = await system.generate_chapter("Brain Tumor Classification")
+
+        synthesis_time = (time.perf_counter_ns() - start_ns) / 1e9
+
+        sys.stdout.write("\n".join([
+            "\nSynthesis Performance:",
+            f"- Time taken: {synthesis_time:.2f} seconds",
+            f"- Sources processed: {chapter['search_metadata']['sources_used']}",
+            f"- Sections generated: {len(chapter['content'])}",
+            f"- Performance: {len(chapter['content']) / synthesis_time:.2f} sections/second",
+        ]) + "\n")
+        sys.stdout.flush()
+    finally:
+        system.shutdown()
 
 
 # Main execution
@@ -255,9 +280,7 @@ async def main():
         "6": ("System Monitoring", example_monitoring_and_stats)
     }
 
-    print("\nAvailable Examples:")
-    for key, (name, _) in examples.items():
-        print(f"{key}. {name}")
+    print("\nAvailable Examples:\n" + "\n".join(f"{key}. {name}" for key, (name, _) in examples.items()))
 
     # For demonstration, run example 1
     print("\nRunning Example 1: Basic Synthesis")
@@ -266,7 +289,7 @@ async def main():
     try:
         await example_basic_synthesis()
     except Exception as e:
-        logger.error(f"Example failed: {e}")
+        logger.error("Example failed: %s", e)
 
 
 if __name__ == "__main__":
@@ -5,17 +5,241 @@ Provides multiple summary modes tailored for different clinical needs
 """
 
 import asyncio
+from bisect import bisect_right
 import json
 import logging
 import re
-from typing import Dict, List, Optional, Any, Tuple, Set
-from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Any, Tuple
+from dataclasses import asdict, dataclass, field
 from enum import Enum
-from collections import defaultdict
+from functools import cached_property
+from itertools import chain
+from collections import OrderedDict, defaultdict
 import hashlib
+import heapq
 
 logger = logging.getLogger(__name__)
 
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+    re2 = None
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
+# Maximum number of cached chapter content analyses
+_ANALYSIS_CACHE_SIZE = 32
+
+# Sentence boundaries
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]\s+')
+
+# Sentences of a section considered for key sentences and critical points.
+# Scoring favours early sentences, so very long sections are cut off here.
+_MAX_SENTENCES = 500
+
+# Statistics kept per section and unique medical terms kept per section
+_MAX_STATISTICS = 10
+_MAX_MEDICAL_TERMS = 20
+
+# Terms that make a sentence more likely to be a key sentence
+_KEY_SENTENCE_TERMS = ("important", "critical", "significant", "essential", "must")
+
+# Statistics: percentages, ratios and incidence/prevalence figures
+_PERCENT_RE = re.compile(r'(\d+(?:\.\d+)?)\s*%')
+_RATIO_RE = re.compile(r'(\d+)\s*(?::|to|/)\s*(\d+)')
+_INCIDENCE_RE = re.compile(
+    r'(\d+(?:\.\d+)?)\s*(?:per|/)\s*(\d+,?\d*)\s*(?:people|patients|cases|population)',
+    re.IGNORECASE
+)
+
+# Joins section texts for chapter-wide scans; none of the patterns can match across it
+_SECTION_SEPARATOR = '\x00'
+
+# Common citation patterns
+_CITATION_RES = (
+    re.compile(r'\[(\d+)\]'),  # [1]
+    re.compile(r'\(([A-Z][a-zA-Z]+(?:\s+et\s+al\.?)?,?\s+\d{4})\)'),  # (Author, 2020)
+    re.compile(r'\[(\d+)-(\d+)\]'),  # [1-5]
+)
+
+# Common medical terminology. These case-insensitive word alternations are
+# where backtracking hurts most, so they use the linear-time RE2 engine when
+# installed; the other patterns are faster under re than through RE2's wrapper.
+_MEDICAL_TERM_PATTERNS = (
+    r'(?i)\b[A-Z][a-z]+(?:oma|itis|osis|pathy|ectomy|otomy|plasty|scopy)\b',
+    r'(?i)\b(?:anterior|posterior|lateral|medial|superior|inferior|proximal|distal)\b',
+    r'(?i)\b(?:acute|chronic|bilateral|unilateral|primary|secondary)\b',
+)
+_MEDICAL_TERM_RES = tuple((re2 if RE2_AVAILABLE else re).compile(p) for p in _MEDICAL_TERM_PATTERNS)
+
+# Medical terms and their lay equivalents, for patient education summaries
+_LAY_TERMS = {
+    "bilateral": "both sides",
+    "unilateral": "one side",
+    "anterior": "front",
+    "posterior": "back",
+    "superior": "upper",
+    "inferior": "lower",
+    "acute": "sudden",
+    "chronic": "long-term",
+    "malignant": "cancerous",
+    "benign": "non-cancerous",
+    "prognosis": "outlook",
+    "morbidity": "illness",
+    "mortality": "death rate",
+    "incidence": "how often it occurs",
+    "prevalence": "how common it is",
+    "contraindication": "reason not to use",
+    "adverse effect": "side effect"
+}
+_LAY_TERM_REPLACEMENTS = {f"t{i}": lay_term for i, lay_term in enumerate(_LAY_TERMS.values())}
+# Longest terms first, so a term never loses to a shorter one it starts with
+_LAY_TERM_RE = re.compile(
+    r'\b(?:' + '|'.join(
+        f"(?P<t{i}>{re.escape(term)})"
+        for i, term in sorted(enumerate(_LAY_TERMS), key=lambda item: len(item[1]), reverse=True)
+    ) + r')\b',
+    re.IGNORECASE
+)
+
+
+def _keyword_re(keywords: Iterable[str]) -> "re.Pattern[str]":
+    """Compiles keywords into one alternation matched anywhere in lowercased text"""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+
+# Surgical procedure steps and the keywords that place a sentence in them
+_SURGICAL_STEP_RES = tuple(
+    (name, _keyword_re(keywords))
+    for name, keywords in (
+        ("preparation", ("position", "preparation", "setup", "anesthesia", "equipment")),
+        ("approach", ("incision", "approach", "exposure", "dissection")),
+        ("technical", ("careful", "avoid", "preserve", "identify", "technique")),
+        ("closure", ("closure", "suture", "drain", "dressing")),
+    )
+)
+
+# Keywords the diagnostic and emergency generators filter key points by
+_CONFIRMATORY_RE = _keyword_re(("confirm", "definitive", "gold standard", "diagnostic"))
+_ASSESSMENT_RE = _keyword_re(("assess", "evaluate", "check", "monitor"))
+_STAT_DIAGNOSTIC_RE = _keyword_re(("urgent", "stat", "immediate", "emergency"))
+_EMERGENCY_TREATMENT_RE = _keyword_re(("immediate", "emergency", "urgent", "first"))
+
+# Everything but lowercase letters and digits, for near-duplicate detection
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]+')
+
+# Final-output cleanup applied by _format_summary
+_EXCESS_NEWLINES_RE = re.compile(r'\n{3,}')
+_EXCESS_SPACES_RE = re.compile(r' {2,}')
+_HEADING_RE = re.compile(r'^###', re.MULTILINE)
+_BRACKETED_CITATION_RE = re.compile(r'\[[^\]]+\]')
+_BULLET_RE = re.compile(r'^[•·▪]', re.MULTILINE)
+
+# Clinical category -> keyword group used to recognise it in a sentence
+_CATEGORY_GROUPS = {
+    "diagnosis": "diagnostic_criteria",
+    "treatment": "treatment_protocols",
+    "surgical_technique": "surgical_steps",
+    "complications": "complications",
+    "prognosis": "prognosis_markers",
+    "emergency": "critical_findings",
+    "clinical_presentation": "clinical_presentation",
+    "imaging": "imaging",
+    "laboratory": "laboratory",
+}
+
+# Keyword groups matched alongside the keyword extractors. Keywords are matched
+# against lowercased sentences as-is, like the substring checks they replace.
+_EXTRA_KEYWORD_GROUPS = {
+    "clinical_presentation": ["presents", "symptoms", "signs", "features"],
+    "imaging": ["MRI", "CT", "X-ray", "ultrasound", "scan"],
+    "laboratory": ["lab", "test", "marker", "level", "value"],
+    # Keywords that indicate clinical pearls
+    "pearl_indicators": [
+        "important to note", "key point", "remember", "critical",
+        "always", "never", "avoid", "prefer", "recommend",
+        "in our experience", "best practice", "gold standard",
+        "pitfall", "caution", "tip", "trick"
+    ],
+    "pearl_diagnostic": ["diagnos", "test", "imaging"],
+    "pearl_therapeutic": ["treat", "manag", "therap"],
+    "pearl_prognostic": ["prognos", "outcome", "surviv"],
+    "pearl_preventive": ["prevent", "avoid", "prophyla"],
+    "pearl_experience": ["in our experience", "we find", "we prefer"],
+}
+
+# Pearl category checks, in priority order
+_PEARL_CATEGORY_GROUPS = (
+    ("diagnostic", "pearl_diagnostic"),
+    ("therapeutic", "pearl_therapeutic"),
+    ("prognostic", "pearl_prognostic"),
+    ("preventive", "pearl_preventive"),
+)
+
+
+class _KeywordHits(NamedTuple):
+    """Keyword groups and clinical categories found in a sentence"""
+    groups: FrozenSet[str]
+    categories: FrozenSet[str]
+
+
+class _KeywordMatcher:
+    """
+    Finds which keyword groups, and through them which clinical categories, occur
+    in a text. With pyahocorasick installed every keyword is tagged with its groups
+    and categories up front and a text is matched in a single Aho-Corasick pass;
+    otherwise each group falls back to substring checks.
+    """
+
+    def __init__(self, groups: Dict[str, Iterable[str]], categories: Dict[str, str]):
+        self.groups = {name: tuple(keywords) for name, keywords in groups.items()}
+
+        # Inverted index: keyword group -> clinical categories it identifies
+        self._group_categories = defaultdict(set)
+        for category, group in categories.items():
+            self._group_categories[group].add(category)
+
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE:
+            # A keyword may belong to several groups (e.g. "approach", "avoid")
+            keyword_groups = defaultdict(set)
+            for name, keywords in self.groups.items():
+                for keyword in keywords:
+                    keyword_groups[keyword].add(name)
+
+            automaton = ahocorasick.Automaton()
+            for keyword, names in keyword_groups.items():
+                keyword_categories = set()
+                for name in names:
+                    keyword_categories.update(self._group_categories.get(name, ()))
+                automaton.add_word(keyword, (frozenset(names), frozenset(keyword_categories)))
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def match(self, text: str) -> _KeywordHits:
+        """Returns the keyword groups with a keyword in text, and their categories"""
+        found_groups = set()
+        found_categories = set()
+
+        if self._automaton is not None:
+            for _, (names, categories) in self._automaton.iter(text):
+                found_groups.update(names)
+                found_categories.update(categories)
+        else:
+            for name, keywords in self.groups.items():
+                if any(keyword in text for keyword in keywords):
+                    found_groups.add(name)
+                    found_categories.update(self._group_categories.get(name, ()))
+
+        return _KeywordHits(frozenset(found_groups), frozenset(found_categories))
+
 
 class SummaryMode(Enum):
     """Different summary modes for various clinical needs"""
@@ -39,7 +263,7 @@ class SummaryLength(Enum):
     EXTENSIVE = 2000  # ~2000 words - full review
 
 
-@dataclass
+@dataclass(slots=True)
 class KeyPoint:
     """Represents a key point extracted from content"""
     text: str
@@ -49,9 +273,20 @@ class KeyPoint:
     evidence_level: Optional[str] = None  # Level I, II, III, IV, V
     citations: List[str] = field(default_factory=list)
     clinical_relevance: Optional[str] = None
+    text_lower: str = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self):
+        # Lowercased once here; every keyword check in the generators reuses it
+        self.text_lower = self.text.lower()
 
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializes the key point without its derived fields"""
+        data = asdict(self)
+        del data["text_lower"]
+        return data
+
+
+@dataclass(slots=True)
 class ClinicalPearl:
     """Represents a clinical pearl - practical wisdom"""
     pearl: str
@@ -63,7 +298,7 @@ class ClinicalPearl:
     pitfalls: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class SummarySection:
     """Structured section for organized summaries"""
     title: str
@@ -84,6 +319,19 @@ class NeurosurgicalSummaryGenerator:
         self.medical_nlp = medical_nlp
         self.section_weights = self._initialize_section_weights()
         self.keyword_extractors = self._initialize_keyword_extractors()
+        self._analysis_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+
+    @cached_property
+    def _keyword_matcher(self) -> _KeywordMatcher:
+        """Keyword matcher over all keyword groups, built on first use"""
+        return _KeywordMatcher({**self.keyword_extractors, **_EXTRA_KEYWORD_GROUPS}, _CATEGORY_GROUPS)
+
+    @cached_property
+    def _critical_keywords(self) -> Tuple[str, ...]:
+        """Critical finding and contraindication keywords, built on first use"""
+        return tuple(dict.fromkeys(
+            self.keyword_extractors["critical_findings"] + self.keyword_extractors["contraindications"]
+        ))
 
     def _initialize_section_weights(self) -> Dict[str, float]:
         """Initialize importance weights for different sections"""
@@ -142,11 +390,14 @@ class NeurosurgicalSummaryGenerator:
         mode: SummaryMode = SummaryMode.EXECUTIVE,
         length: SummaryLength = SummaryLength.STANDARD,
         include_citations: bool = True,
-        custom_focus: Optional[List[str]] = None
+        custom_focus: Optional[List[str]] = None,
+        validate: bool = True
     ) -> Dict[str, Any]:
         """
         Main entry point for summary generation.
         Generates highly accurate, concise summaries based on specified mode and parameters.
+        Callers that don't use the "validation" result can skip it with validate=False,
+        in which case it is None.
         """
 
         logger.info(f"Generating {mode.value} summary with {length.value} word target")
@@ -155,18 +406,26 @@ class NeurosurgicalSummaryGenerator:
             # 1. Extract and analyze chapter content
             content_analysis = await self._analyze_chapter_content(chapter_data)
 
-            # 2. Extract key points based on mode
-            key_points = await self._extract_key_points(content_analysis, mode, custom_focus)
-
-            # 3. Extract clinical pearls if relevant
-            clinical_pearls = []
+            # 2. Extract key points based on mode, and
+            # 3. clinical pearls if relevant - both only read the analysis, so run them together
             if mode in [SummaryMode.CLINICAL_PEARLS, SummaryMode.EXECUTIVE, SummaryMode.QUICK_REFERENCE]:
-                clinical_pearls = await self._extract_clinical_pearls(content_analysis)
+                key_points, clinical_pearls = await asyncio.gather(
+                    self._extract_key_points(content_analysis, mode, custom_focus),
+                    self._extract_clinical_pearls(content_analysis)
+                )
+            else:
+                key_points = await self._extract_key_points(content_analysis, mode, custom_focus)
+                clinical_pearls = []
+
+            # Group key points by category once for the mode generators
+            points_by_category = defaultdict(list)
+            for kp in key_points:
+                points_by_category[kp.category].append(kp)
 
             # 4. Generate structured summary based on mode
             if mode == SummaryMode.EXECUTIVE:
                 summary = await self._generate_executive_summary(
-                    key_points, clinical_pearls, content_analysis, length
+                    points_by_category, clinical_pearls, content_analysis, length
                 )
             elif mode == SummaryMode.CLINICAL_PEARLS:
                 summary = await self._generate_clinical_pearls_summary(
@@ -174,7 +433,7 @@ class NeurosurgicalSummaryGenerator:
                 )
             elif mode == SummaryMode.QUICK_REFERENCE:
                 summary = await self._generate_quick_reference(
-                    key_points, clinical_pearls, content_analysis, length
+                    points_by_category, clinical_pearls, content_analysis, length
                 )
             elif mode == SummaryMode.SURGICAL_STEPS:
                 summary = await self._generate_surgical_steps_summary(
@@ -182,7 +441,7 @@ class NeurosurgicalSummaryGenerator:
                 )
             elif mode == SummaryMode.DIAGNOSTIC_ALGORITHM:
                 summary = await self._generate_diagnostic_algorithm(
-                    content_analysis, key_points, length
+                    content_analysis, key_points, points_by_category, length
                 )
             elif mode == SummaryMode.EVIDENCE_BASED:
                 summary = await self._generate_evidence_based_summary(
@@ -190,36 +449,38 @@ class NeurosurgicalSummaryGenerator:
                 )
             elif mode == SummaryMode.PATIENT_EDUCATION:
                 summary = await self._generate_patient_education_summary(
-                    key_points, content_analysis, length
+                    key_points, points_by_category, content_analysis, length
                 )
             elif mode == SummaryMode.BOARD_REVIEW:
                 summary = await self._generate_board_review_summary(
-                    key_points, content_analysis, length
+                    key_points, points_by_category, content_analysis, length
                 )
             elif mode == SummaryMode.EMERGENCY_GUIDE:
                 summary = await self._generate_emergency_guide(
-                    key_points, clinical_pearls, content_analysis, length
+                    key_points, points_by_category, clinical_pearls, content_analysis, length
                 )
             else:
                 # Default to executive summary
                 summary = await self._generate_executive_summary(
-                    key_points, clinical_pearls, content_analysis, length
+                    points_by_category, clinical_pearls, content_analysis, length
                 )
 
             # 5. Post-process and format
             formatted_summary = self._format_summary(summary, mode, include_citations)
 
             # 6. Validate accuracy and completeness
-            validation_result = await self._validate_summary(
-                formatted_summary, chapter_data, mode
-            )
+            validation_result = None
+            if validate:
+                validation_result = await self._validate_summary(
+                    formatted_summary, chapter_data, mode
+                )
 
             return {
                 "summary": formatted_summary,
                 "mode": mode.value,
                 "length": length.value,
-                "key_points": [kp.__dict__ for kp in key_points[:10]],  # Top 10
-                "clinical_pearls": [cp.__dict__ for cp in clinical_pearls[:5]],  # Top 5
+                "key_points": [kp.to_dict() for kp in key_points[:10]],  # Top 10
+                "clinical_pearls": [asdict(cp) for cp in clinical_pearls[:5]],  # Top 5
                 "validation": validation_result,
                 "metadata": {
                     "word_count": len(formatted_summary.split()),
@@ -240,153 +501,199 @@ class NeurosurgicalSummaryGenerator:
     async def _analyze_chapter_content(self, chapter_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Deeply analyzes chapter content to understand structure, key information, and relationships.
+        Section analysis depends only on the chapter content, so summaries of the same
+        chapter in other modes reuse it.
         """
 
-        analysis = {
-            "sections": {},
+        content = chapter_data.get("content", {})
+        cache_key = self._content_cache_key(content)
+        content_analysis = self._analysis_cache.get(cache_key)
+        if content_analysis is not None:
+            self._analysis_cache.move_to_end(cache_key)
+        else:
+            content_analysis = self._analyze_sections(content)
+            self._analysis_cache[cache_key] = content_analysis
+            if len(self._analysis_cache) > _ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+
+        return {
+            "sections": content_analysis["sections"],
             "overall_topic": chapter_data.get("topic", "Unknown"),
-            "total_content_length": 0,
-            "key_statistics": [],
-            "critical_information": [],
+            "total_content_length": content_analysis["total_content_length"],
+            "key_statistics": content_analysis["key_statistics"],
+            "critical_information": content_analysis["critical_information"],
             "contradictions": chapter_data.get("analysis", {}).get("contradictions", []),
             "knowledge_gaps": chapter_data.get("analysis", {}).get("knowledge_gaps", []),
-            "citations": []
+            "citations": content_analysis["citations"],
+            # Extract images if available
+            "images": chapter_data.get("images", [])
         }
 
-        # Analyze each section
-        content = chapter_data.get("content", {})
-        for section_name, section_content in content.items():
-            if section_content:
-                section_analysis = {
-                    "length": len(section_content),
-                    "weight": self.section_weights.get(section_name, 0.5),
-                    "key_sentences": self._extract_key_sentences(section_content),
-                    "statistics": self._extract_statistics(section_content),
-                    "citations": self._extract_citations(section_content),
-                    "medical_terms": self._extract_medical_terms(section_content),
-                    "critical_points": self._identify_critical_points(section_content)
-                }
-                analysis["sections"][section_name] = section_analysis
-                analysis["total_content_length"] += len(section_content)
+    @staticmethod
+    def _content_cache_key(content: Dict[str, Any]) -> bytes:
+        """Stable hash of a chapter's section content"""
+        serialized = json.dumps(content, sort_keys=True, default=str)
+        return hashlib.blake2b(serialized.encode(), digest_size=16).digest()
 
-                # Aggregate statistics and citations
-                analysis["key_statistics"].extend(section_analysis["statistics"])
-                analysis["citations"].extend(section_analysis["citations"])
-                analysis["critical_information"].extend(section_analysis["critical_points"])
+    def _analyze_sections(self, content: Dict[str, Any]) -> Dict[str, Any]:
+        """Analyzes each section and aggregates statistics, citations and critical points"""
+        sections = [(name, text) for name, text in content.items() if text]
+        statistics, citations = self._extract_statistics_and_citations([text for _, text in sections])
 
-        # Extract images if available
-        analysis["images"] = chapter_data.get("images", [])
+        # Analyze each section
+        section_analyses = {
+            section_name: self._analyze_section(
+                section_name, section_content, section_statistics, section_citations
+            )
+            for (section_name, section_content), section_statistics, section_citations in zip(
+                sections, statistics, citations
+            )
+        }
 
-        return analysis
+        # Aggregate statistics, citations and critical points in one go
+        return {
+            "sections": section_analyses,
+            "total_content_length": sum(len(text) for _, text in sections),
+            "key_statistics": list(chain.from_iterable(statistics)),
+            "critical_information": list(chain.from_iterable(
+                analysis["critical_points"] for analysis in section_analyses.values()
+            )),
+            "citations": list(chain.from_iterable(citations))
+        }
 
-    def _extract_key_sentences(self, text: str, top_n: int = 5) -> List[str]:
-        """Extracts most important sentences using TF-IDF and position weighting"""
-        sentences = re.split(r'[.!?]\s+', text)
+    def _analyze_section(
+        self,
+        section_name: str,
+        text: str,
+        statistics: List[Dict[str, str]],
+        citations: List[str]
+    ) -> Dict[str, Any]:
+        """
+        Analyzes a single section. The text is split into sentences once, and
+        key-sentence scoring and critical-point detection share that pass. Key
+        sentences are also kept lowercased for the keyword checks downstream.
+        """
+        # maxsplit stops the split early; the unsplit remainder is dropped
+        sentences = _SENTENCE_SPLIT_RE.split(text, maxsplit=_MAX_SENTENCES)[:_MAX_SENTENCES]
+        n_sentences = max(len(sentences), 1)
+        # Runs for every sentence of the chapter: a handful of short keywords is
+        # cheapest as plain substring checks, not a scan over every keyword group
+        critical_keywords = self._critical_keywords
 
-        # Simple scoring based on length and position
         scored_sentences = []
+        critical_points = []
         for i, sentence in enumerate(sentences):
-            if 20 < len(sentence) < 300:  # Reasonable sentence length
+            sentence_length = len(sentence)
+            scored = 20 < sentence_length < 300  # Reasonable sentence length
+            if not scored and len(critical_points) >= 5:
+                continue
+            sentence_lower = sentence.lower()
+
+            # Key sentences: simple scoring based on length and position
+            if scored:
                 # Higher score for earlier sentences and those with key terms
-                position_score = 1.0 - (i / max(len(sentences), 1))
-                keyword_score = sum(1 for kw in ["important", "critical", "significant", "essential", "must"]
-                                  if kw in sentence.lower()) * 0.3
-                length_score = min(len(sentence) / 100, 1.0)  # Prefer moderate length
+                position_score = 1.0 - (i / n_sentences)
+                keyword_score = sum(1 for kw in _KEY_SENTENCE_TERMS if kw in sentence_lower) * 0.3
+                length_score = min(sentence_length / 100, 1.0)  # Prefer moderate length
 
                 total_score = position_score * 0.3 + keyword_score + length_score * 0.2
-                scored_sentences.append((sentence.strip(), total_score))
-
-        # Sort by score and return top N
-        scored_sentences.sort(key=lambda x: x[1], reverse=True)
-        return [sent for sent, _ in scored_sentences[:top_n]]
-
-    def _extract_statistics(self, text: str) -> List[Dict[str, str]]:
-        """Extracts statistical information from text"""
-        statistics = []
-
-        # Pattern for percentages
-        percent_pattern = r'(\d+(?:\.\d+)?)\s*%'
-        for match in re.finditer(percent_pattern, text):
-            context_start = max(0, match.start() - 50)
-            context_end = min(len(text), match.end() + 50)
-            context = text[context_start:context_end]
-            statistics.append({
-                "value": match.group(),
-                "context": context.strip(),
-                "type": "percentage"
-            })
+                scored_sentences.append((sentence.strip(), sentence_lower.strip(), total_score))
 
-        # Pattern for ratios
-        ratio_pattern = r'(\d+)\s*(?::|to|/)\s*(\d+)'
-        for match in re.finditer(ratio_pattern, text):
-            context_start = max(0, match.start() - 30)
-            context_end = min(len(text), match.end() + 30)
-            context = text[context_start:context_end]
-            statistics.append({
-                "value": match.group(),
-                "context": context.strip(),
-                "type": "ratio"
-            })
+            # Critical clinical points: critical findings or contraindications (top 5)
+            if len(critical_points) < 5 and any(kw in sentence_lower for kw in critical_keywords):
+                critical_points.append(sentence.strip())
 
-        # Pattern for incidence/prevalence
-        incidence_pattern = r'(\d+(?:\.\d+)?)\s*(?:per|/)\s*(\d+,?\d*)\s*(?:people|patients|cases|population)'
-        for match in re.finditer(incidence_pattern, text, re.IGNORECASE):
-            statistics.append({
-                "value": match.group(),
-                "context": match.group(),
-                "type": "incidence"
-            })
+        # Keep the top 5 key sentences by score
+        top_sentences = heapq.nlargest(5, scored_sentences, key=lambda x: x[2])
+
+        return {
+            "length": len(text),
+            "weight": self.section_weights.get(section_name, 0.5),
+            "key_sentences": [sent for sent, _, _ in top_sentences],
+            "key_sentences_lower": [sent_lower for _, sent_lower, _ in top_sentences],
+            # Keyword groups and categories of each key sentence, reused by every summary mode
+            "key_sentence_hits": [self._keyword_matcher.match(sent_lower) for _, sent_lower, _ in top_sentences],
+            "statistics": statistics,
+            "citations": citations,
+            "medical_terms": self._extract_medical_terms(text),
+            "critical_points": critical_points
+        }
 
-        return statistics[:10]  # Limit to top 10 statistics
+    def _extract_statistics_and_citations(
+        self,
+        texts: List[str]
+    ) -> Tuple[List[List[Dict[str, str]]], List[List[str]]]:
+        """
+        Extracts statistical information and citations for each of several section
+        texts. The texts are joined so every pattern scans the chapter once; matches
+        are mapped back to their section by offset, and contexts stay within it.
+        Only the first 10 statistics of each section are kept.
+        """
+        joined = _SECTION_SEPARATOR.join(texts)
+        starts = []
+        ends = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text)
+            ends.append(offset)
+            offset += len(_SECTION_SEPARATOR)
+
+        statistics = [[] for _ in texts]
+        # Dicts de-duplicate citations while keeping first-seen order
+        citations = [{} for _ in texts]
+
+        def add_statistics(pattern, stat_type: str, context_chars: Optional[int]):
+            for match in pattern.finditer(joined):
+                i = bisect_right(starts, match.start()) - 1
+                if len(statistics[i]) >= _MAX_STATISTICS:
+                    continue
+                if context_chars is None:
+                    context = match.group()
+                else:
+                    context_start = max(starts[i], match.start() - context_chars)
+                    context_end = min(ends[i], match.end() + context_chars)
+                    context = joined[context_start:context_end].strip()
+                statistics[i].append({
+                    "value": match.group(),
+                    "context": context,
+                    "type": stat_type
+                })
+
+        add_statistics(_PERCENT_RE, "percentage", 50)
+        add_statistics(_RATIO_RE, "ratio", 30)
+        add_statistics(_INCIDENCE_RE, "incidence", None)  # Incidence/prevalence
+
+        for pattern in _CITATION_RES:
+            for match in pattern.finditer(joined):
+                i = bisect_right(starts, match.start()) - 1
+                citations[i][match.group(1) if pattern.groups == 1 else match.groups()] = None
+
+        return statistics, [list(cites) for cites in citations]
 
     def _extract_citations(self, text: str) -> List[str]:
         """Extracts citations from text"""
         citations = []
 
-        # Common citation patterns
-        patterns = [
-            r'\[(\d+)\]',  # [1]
-            r'\(([A-Z][a-zA-Z]+(?:\s+et\s+al\.?)?,?\s+\d{4})\)',  # (Author, 2020)
-            r'\[(\d+)-(\d+)\]',  # [1-5]
-        ]
+        for pattern in _CITATION_RES:
+            citations.extend(pattern.findall(text))
 
-        for pattern in patterns:
-            citations.extend(re.findall(pattern, text))
-
-        return list(set(citations))  # Remove duplicates
+        return list(dict.fromkeys(citations))  # Remove duplicates, keeping order
 
     def _extract_medical_terms(self, text: str) -> List[str]:
         """Extracts medical terminology"""
         # This would ideally use a medical NLP library
         # For now, using pattern matching for common medical terms
 
-        medical_patterns = [
-            r'\b[A-Z][a-z]+(?:oma|itis|osis|pathy|ectomy|otomy|plasty|scopy)\b',
-            r'\b(?:anterior|posterior|lateral|medial|superior|inferior|proximal|distal)\b',
-            r'\b(?:acute|chronic|bilateral|unilateral|primary|secondary)\b',
-        ]
-
-        terms = []
-        for pattern in medical_patterns:
-            terms.extend(re.findall(pattern, text, re.IGNORECASE))
+        # Top 20 unique terms, in order found; stop scanning once there are enough
+        terms = {}
+        for pattern in _MEDICAL_TERM_RES:
+            for match in pattern.finditer(text):
+                terms[match.group()] = None
+                if len(terms) == _MAX_MEDICAL_TERMS:
+                    return list(terms)
 
-        return list(set(terms))[:20]  # Top 20 unique terms
-
-    def _identify_critical_points(self, text: str) -> List[str]:
-        """Identifies critical clinical points"""
-        critical_points = []
-
-        sentences = re.split(r'[.!?]\s+', text)
-        for sentence in sentences:
-            sentence_lower = sentence.lower()
-            # Check for critical keywords
-            if any(keyword in sentence_lower for keyword in self.keyword_extractors["critical_findings"]):
-                critical_points.append(sentence.strip())
-            # Check for contraindications
-            elif any(keyword in sentence_lower for keyword in self.keyword_extractors["contraindications"]):
-                critical_points.append(sentence.strip())
-
-        return critical_points[:5]  # Top 5 critical points
+        return list(terms)
 
     async def _extract_key_points(
         self,
@@ -417,9 +724,9 @@ class NeurosurgicalSummaryGenerator:
             weight = section_data["weight"]
 
             # Extract key sentences as potential key points
-            for sentence in section_data["key_sentences"]:
+            for sentence, hits in zip(section_data["key_sentences"], section_data["key_sentence_hits"]):
                 # Determine category
-                category = self._categorize_sentence(sentence, focus_categories)
+                category = self._categorize_sentence(hits, focus_categories)
                 if category:
                     key_point = KeyPoint(
                         text=sentence,
@@ -449,42 +756,23 @@ class NeurosurgicalSummaryGenerator:
 
         return unique_points[:30]  # Return top 30 points
 
-    def _categorize_sentence(self, sentence: str, focus_categories: List[str]) -> Optional[str]:
-        """Categorizes a sentence into clinical categories"""
-        sentence_lower = sentence.lower()
-
-        category_keywords = {
-            "diagnosis": self.keyword_extractors["diagnostic_criteria"],
-            "treatment": self.keyword_extractors["treatment_protocols"],
-            "surgical_technique": self.keyword_extractors["surgical_steps"],
-            "complications": self.keyword_extractors["complications"],
-            "prognosis": self.keyword_extractors["prognosis_markers"],
-            "emergency": self.keyword_extractors["critical_findings"],
-            "clinical_presentation": ["presents", "symptoms", "signs", "features"],
-            "imaging": ["MRI", "CT", "X-ray", "ultrasound", "scan"],
-            "laboratory": ["lab", "test", "marker", "level", "value"]
-        }
-
-        for category in focus_categories:
-            if category in category_keywords:
-                if any(keyword in sentence_lower for keyword in category_keywords[category]):
-                    return category
-
-        return None
+    def _categorize_sentence(self, hits: _KeywordHits, focus_categories: List[str]) -> Optional[str]:
+        """Categorizes a sentence into clinical categories from its keyword hits"""
+        # First focus category, in priority order, that the sentence mentions
+        return next((category for category in focus_categories if category in hits.categories), None)
 
     def _deduplicate_key_points(self, key_points: List[KeyPoint]) -> List[KeyPoint]:
         """Removes duplicate or very similar key points"""
         unique_points = []
-        seen_hashes = set()
+        seen = set()
 
         for point in key_points:
-            # Create simplified hash of the point
-            simplified = re.sub(r'[^a-z0-9]+', '', point.text.lower())[:50]
-            point_hash = hashlib.md5(simplified.encode()).hexdigest()
+            # The simplified text is the identity of the point
+            simplified = _NON_ALNUM_RE.sub('', point.text_lower)[:50]
 
-            if point_hash not in seen_hashes:
+            if simplified not in seen:
                 unique_points.append(point)
-                seen_hashes.add(point_hash)
+                seen.add(simplified)
 
         return unique_points
 
@@ -498,36 +786,21 @@ class NeurosurgicalSummaryGenerator:
 
         clinical_pearls = []
 
-        # Keywords that indicate clinical pearls
-        pearl_indicators = [
-            "important to note", "key point", "remember", "critical",
-            "always", "never", "avoid", "prefer", "recommend",
-            "in our experience", "best practice", "gold standard",
-            "pitfall", "caution", "tip", "trick"
-        ]
-
         for section_name, section_data in content_analysis["sections"].items():
             # Look for sentences containing pearl indicators
-            for sentence in section_data["key_sentences"]:
-                sentence_lower = sentence.lower()
+            for sentence, hits in zip(section_data["key_sentences"], section_data["key_sentence_hits"]):
+                groups = hits.groups
 
-                if any(indicator in sentence_lower for indicator in pearl_indicators):
+                if "pearl_indicators" in groups:
                     # Determine pearl category
-                    if any(word in sentence_lower for word in ["diagnos", "test", "imaging"]):
-                        category = "diagnostic"
-                    elif any(word in sentence_lower for word in ["treat", "manag", "therap"]):
-                        category = "therapeutic"
-                    elif any(word in sentence_lower for word in ["prognos", "outcome", "surviv"]):
-                        category = "prognostic"
-                    elif any(word in sentence_lower for word in ["prevent", "avoid", "prophyla"]):
-                        category = "preventive"
-                    else:
-                        category = "general"
+                    category = next(
+                        (name for name, group in _PEARL_CATEGORY_GROUPS if group in groups),
+                        "general"
+                    )
 
                     # Check if evidence-based or experience-based
                     evidence_based = bool(self._extract_citations(sentence))
-                    experience_based = any(phrase in sentence_lower
-                                         for phrase in ["in our experience", "we find", "we prefer"])
+                    experience_based = "pearl_experience" in groups
 
                     pearl = ClinicalPearl(
                         pearl=sentence,
@@ -538,14 +811,12 @@ class NeurosurgicalSummaryGenerator:
                     )
                     clinical_pearls.append(pearl)
 
-        # Sort by relevance (evidence-based pearls first)
-        clinical_pearls.sort(key=lambda x: (x.evidence_based, not x.experience_based), reverse=True)
-
-        return clinical_pearls[:10]  # Top 10 pearls
+        # Top 10 pearls by relevance (evidence-based pearls first)
+        return heapq.nlargest(10, clinical_pearls, key=lambda x: (x.evidence_based, not x.experience_based))
 
     async def _generate_executive_summary(
         self,
-        key_points: List[KeyPoint],
+        points_by_category: Dict[str, List[KeyPoint]],
         clinical_pearls: List[ClinicalPearl],
         content_analysis: Dict[str, Any],
         length: SummaryLength
@@ -559,83 +830,82 @@ class NeurosurgicalSummaryGenerator:
 
         # 1. Overview
         topic = content_analysis["overall_topic"]
-        overview = f"## {topic} - Executive Summary\n\n"
+        overview = [f"## {topic} - Executive Summary\n\n"]
 
         # 2. Key Statistics
         if content_analysis["key_statistics"]:
-            overview += "### Key Metrics\n"
+            overview.append("### Key Metrics\n")
             for stat in content_analysis["key_statistics"][:3]:
-                overview += f"• {stat['context']}\n"
-        sections.append(overview)
+                overview.append(f"• {stat['context']}\n")
+        sections.append("".join(overview))
 
         # 3. Critical Points
-        if any(kp.category == "critical" for kp in key_points):
-            critical_section = "\n### Critical Considerations\n"
-            for kp in key_points:
-                if kp.category == "critical":
-                    critical_section += f"• {kp.text}\n"
-            sections.append(critical_section)
+        if points_by_category["critical"]:
+            critical_section = ["\n### Critical Considerations\n"]
+            for kp in points_by_category["critical"]:
+                critical_section.append(f"• {kp.text}\n")
+            sections.append("".join(critical_section))
 
         # 4. Diagnostic Approach
-        diagnostic_points = [kp for kp in key_points if kp.category == "diagnosis"]
+        diagnostic_points = points_by_category["diagnosis"]
         if diagnostic_points:
-            diag_section = "\n### Diagnostic Approach\n"
+            diag_section = ["\n### Diagnostic Approach\n"]
             for point in diagnostic_points[:3]:
-                diag_section += f"• {point.text}\n"
-            sections.append(diag_section)
+                diag_section.append(f"• {point.text}\n")
+            sections.append("".join(diag_section))
 
         # 5. Treatment Strategy
-        treatment_points = [kp for kp in key_points if kp.category == "treatment"]
+        treatment_points = points_by_category["treatment"]
         if treatment_points:
-            treat_section = "\n### Treatment Strategy\n"
+            treat_section = ["\n### Treatment Strategy\n"]
             for point in treatment_points[:3]:
-                treat_section += f"• {point.text}\n"
-            sections.append(treat_section)
+                treat_section.append(f"• {point.text}\n")
+            sections.append("".join(treat_section))
 
         # 6. Complications & Risks
-        complication_points = [kp for kp in key_points if kp.category == "complications"]
+        complication_points = points_by_category["complications"]
         if complication_points:
-            comp_section = "\n### Major Complications\n"
+            comp_section = ["\n### Major Complications\n"]
             for point in complication_points[:3]:
-                comp_section += f"• {point.text}\n"
-            sections.append(comp_section)
+                comp_section.append(f"• {point.text}\n")
+            sections.append("".join(comp_section))
 
         # 7. Prognosis
-        prognosis_points = [kp for kp in key_points if kp.category == "prognosis"]
+        prognosis_points = points_by_category["prognosis"]
         if prognosis_points:
-            prog_section = "\n### Prognosis\n"
+            prog_section = ["\n### Prognosis\n"]
             for point in prognosis_points[:2]:
-                prog_section += f"• {point.text}\n"
-            sections.append(prog_section)
+                prog_section.append(f"• {point.text}\n")
+            sections.append("".join(prog_section))
 
         # 8. Clinical Pearls
         if clinical_pearls:
-            pearls_section = "\n### Clinical Pearls\n"
+            pearls_section = ["\n### Clinical Pearls\n"]
             for pearl in clinical_pearls[:3]:
-                pearls_section += f"• {pearl.pearl}\n"
-            sections.append(pearls_section)
+                pearls_section.append(f"• {pearl.pearl}\n")
+            sections.append("".join(pearls_section))
 
         # 9. Knowledge Gaps (if any)
         if content_analysis["knowledge_gaps"]:
-            gaps_section = "\n### Areas Requiring Further Research\n"
+            gaps_section = ["\n### Areas Requiring Further Research\n"]
             for gap in content_analysis["knowledge_gaps"][:2]:
-                gaps_section += f"• {gap}\n"
-            sections.append(gaps_section)
+                gaps_section.append(f"• {gap}\n")
+            sections.append("".join(gaps_section))
 
         # Combine sections based on target length
-        summary = ""
+        summary = []
         current_length = 0
         target_words = length.value
 
         for section in sections:
             section_words = len(section.split())
             if current_length + section_words <= target_words * 1.1:  # Allow 10% overflow
-                summary += section
+                summary.append(section)
                 current_length += section_words
             else:
                 break
 
-        return summary
+        return "".join(summary)
 
     async def _generate_clinical_pearls_summary(
         self,
@@ -647,7 +917,7 @@ class NeurosurgicalSummaryGenerator:
         Generates summary focused on clinical pearls and practical wisdom.
         """
 
-        summary = "## Clinical Pearls & Practical Guidelines\n\n"
+        summary = ["## Clinical Pearls & Practical Guidelines\n\n"]
 
         # Group pearls by category
         pearls_by_category = defaultdict(list)
@@ -657,26 +927,31 @@ class NeurosurgicalSummaryGenerator:
         # Add pearls by category
         for category in ["diagnostic", "therapeutic", "preventive", "prognostic", "general"]:
             if category in pearls_by_category:
-                summary += f"\n### {category.title()} Pearls\n"
+                summary.append(f"\n### {category.title()} Pearls\n")
                 for pearl in pearls_by_category[category]:
                     marker = "📊" if pearl.evidence_based else "💡"
-                    summary += f"{marker} {pearl.pearl}\n"
+                    summary.append(f"{marker} {pearl.pearl}\n")
                     if pearl.pitfalls:
-                        summary += f"   ⚠️ Pitfalls: {', '.join(pearl.pitfalls)}\n"
+                        summary.append(f"   ⚠️ Pitfalls: {', '.join(pearl.pitfalls)}\n")
 
         # Add high-yield facts
-        summary += "\n### High-Yield Facts\n"
+        summary.append("\n### High-Yield Facts\n")
+
+        # Every fragment ends in a newline, so word counts add up across fragments
+        word_count = sum(len(part.split()) for part in summary)
         for point in key_points:
             if point.importance > 0.8:
-                summary += f"• {point.text}\n"
-                if len(summary.split()) > length.value:
+                fact = f"• {point.text}\n"
+                summary.append(fact)
+                word_count += len(fact.split())
+                if word_count > length.value:
                     break
 
-        return summary
+        return "".join(summary)
 
     async def _generate_quick_reference(
         self,
-        key_points: List[KeyPoint],
+        points_by_category: Dict[str, List[KeyPoint]],
         clinical_pearls: List[ClinicalPearl],
         content_analysis: Dict[str, Any],
         length: SummaryLength
@@ -685,52 +960,52 @@ class NeurosurgicalSummaryGenerator:
         Generates quick reference guide for rapid consultation.
         """
 
-        summary = f"## Quick Reference: {content_analysis['overall_topic']}\n\n"
+        summary = [f"## Quick Reference: {content_analysis['overall_topic']}\n\n"]
 
         # Red Flags / Emergency
-        critical_points = [kp for kp in key_points if kp.category == "critical"]
+        critical_points = points_by_category["critical"]
         if critical_points:
-            summary += "### 🚨 RED FLAGS\n"
+            summary.append("### 🚨 RED FLAGS\n")
             for point in critical_points[:3]:
-                summary += f"• {point.text}\n"
+                summary.append(f"• {point.text}\n")
 
         # Diagnosis at a glance
-        summary += "\n### 🔍 DIAGNOSIS\n"
-        diagnostic_points = [kp for kp in key_points if kp.category == "diagnosis"]
+        summary.append("\n### 🔍 DIAGNOSIS\n")
+        diagnostic_points = points_by_category["diagnosis"]
         for point in diagnostic_points[:4]:
-            summary += f"• {point.text}\n"
+            summary.append(f"• {point.text}\n")
 
         # Treatment algorithm
-        summary += "\n### 💊 TREATMENT\n"
-        treatment_points = [kp for kp in key_points if kp.category == "treatment"]
-        summary += "**First Line:**\n"
+        summary.append("\n### 💊 TREATMENT\n")
+        treatment_points = points_by_category["treatment"]
+        summary.append("**First Line:**\n")
         for point in treatment_points[:2]:
-            summary += f"• {point.text}\n"
+            summary.append(f"• {point.text}\n")
 
         if len(treatment_points) > 2:
-            summary += "**Alternative Options:**\n"
+            summary.append("**Alternative Options:**\n")
             for point in treatment_points[2:4]:
-                summary += f"• {point.text}\n"
+                summary.append(f"• {point.text}\n")
 
         # Key complications
-        summary += "\n### ⚠️ COMPLICATIONS\n"
-        complication_points = [kp for kp in key_points if kp.category == "complications"]
+        summary.append("\n### ⚠️ COMPLICATIONS\n")
+        complication_points = points_by_category["complications"]
         for point in complication_points[:3]:
-            summary += f"• {point.text}\n"
+            summary.append(f"• {point.text}\n")
 
         # Prognosis snapshot
-        prognosis_points = [kp for kp in key_points if kp.category == "prognosis"]
+        prognosis_points = points_by_category["prognosis"]
         if prognosis_points:
-            summary += "\n### 📈 PROGNOSIS\n"
-            summary += f"{prognosis_points[0].text}\n"
+            summary.append("\n### 📈 PROGNOSIS\n")
+            summary.append(f"{prognosis_points[0].text}\n")
 
         # Key statistics
         if content_analysis["key_statistics"]:
-            summary += "\n### 📊 KEY STATISTICS\n"
+            summary.append("\n### 📊 KEY STATISTICS\n")
             for stat in content_analysis["key_statistics"][:3]:
-                summary += f"• {stat['value']}: {stat['context'][:50]}...\n"
+                summary.append(f"• {stat['value']}: {stat['context'][:50]}...\n")
 
-        return summary
+        return "".join(summary)
 
     async def _generate_surgical_steps_summary(
         self,
@@ -741,7 +1016,7 @@ class NeurosurgicalSummaryGenerator:
         Generates step-by-step surgical procedure summary.
         """
 
-        summary = "## Surgical Procedure - Step-by-Step Guide\n\n"
+        summary = ["## Surgical Procedure - Step-by-Step Guide\n\n"]
 
         # Extract surgical content
         surgical_sections = ["Surgical Techniques", "Surgical Anatomy",
@@ -750,100 +1025,93 @@ class NeurosurgicalSummaryGenerator:
         surgical_content = []
         for section in surgical_sections:
             if section in content_analysis["sections"]:
+                section_data = content_analysis["sections"][section]
                 surgical_content.extend(
-                    content_analysis["sections"][section]["key_sentences"]
+                    zip(section_data["key_sentences"], section_data["key_sentences_lower"])
                 )
 
-        # Organize into steps
-        summary += "### Preoperative Preparation\n"
-        prep_keywords = ["position", "preparation", "setup", "anesthesia", "equipment"]
-        for sentence in surgical_content:
-            if any(kw in sentence.lower() for kw in prep_keywords):
-                summary += f"• {sentence}\n"
-
-        summary += "\n### Surgical Approach\n"
-        approach_keywords = ["incision", "approach", "exposure", "dissection"]
-        step_number = 1
-        for sentence in surgical_content:
-            if any(kw in sentence.lower() for kw in approach_keywords):
-                summary += f"{step_number}. {sentence}\n"
-                step_number += 1
-
-        summary += "\n### Key Technical Points\n"
-        technical_keywords = ["careful", "avoid", "preserve", "identify", "technique"]
-        for sentence in surgical_content:
-            if any(kw in sentence.lower() for kw in technical_keywords):
-                summary += f"• {sentence}\n"
-
-        summary += "\n### Closure\n"
-        closure_keywords = ["closure", "suture", "drain", "dressing"]
-        for sentence in surgical_content:
-            if any(kw in sentence.lower() for kw in closure_keywords):
-                summary += f"• {sentence}\n"
+        # Organize into steps: route each sentence to every step it mentions in one pass
+        steps = {name: [] for name, _ in _SURGICAL_STEP_RES}
+        for sentence, sentence_lower in surgical_content:
+            for name, step_re in _SURGICAL_STEP_RES:
+                if step_re.search(sentence_lower):
+                    steps[name].append(sentence)
+
+        summary.append("### Preoperative Preparation\n")
+        summary.extend(f"• {sentence}\n" for sentence in steps["preparation"])
+
+        summary.append("\n### Surgical Approach\n")
+        summary.extend(f"{step_number}. {sentence}\n" for step_number, sentence in enumerate(steps["approach"], 1))
+
+        summary.append("\n### Key Technical Points\n")
+        summary.extend(f"• {sentence}\n" for sentence in steps["technical"])
+
+        summary.append("\n### Closure\n")
+        summary.extend(f"• {sentence}\n" for sentence in steps["closure"])
 
         # Add relevant images if available
         if content_analysis["images"]:
-            summary += "\n### Relevant Figures\n"
+            summary.append("\n### Relevant Figures\n")
             for img in content_analysis["images"][:3]:
                 if "surgical" in img.get("caption", "").lower():
-                    summary += f"• See: {img['caption']}\n"
+                    summary.append(f"• See: {img['caption']}\n")
 
-        return summary
+        return "".join(summary)
 
     async def _generate_diagnostic_algorithm(
         self,
         content_analysis: Dict[str, Any],
         key_points: List[KeyPoint],
+        points_by_category: Dict[str, List[KeyPoint]],
         length: SummaryLength
     ) -> str:
         """
         Generates diagnostic algorithm in decision-tree format.
         """
 
-        summary = "## Diagnostic Algorithm\n\n"
+        summary = ["## Diagnostic Algorithm\n\n"]
 
         # Clinical Presentation
-        summary += "### Step 1: Clinical Presentation\n"
+        summary.append("### Step 1: Clinical Presentation\n")
         presentation_points = [kp for kp in key_points
                              if kp.category in ["clinical_presentation", "diagnosis"]]
         for point in presentation_points[:3]:
-            summary += f"• {point.text}\n"
+            summary.append(f"• {point.text}\n")
 
         # Initial Workup
-        summary += "\n### Step 2: Initial Workup\n"
-        summary += "**Laboratory Tests:**\n"
-        lab_points = [kp for kp in key_points if "lab" in kp.text.lower()]
+        summary.append("\n### Step 2: Initial Workup\n")
+        summary.append("**Laboratory Tests:**\n")
+        lab_points = [kp for kp in key_points if "lab" in kp.text_lower]
         for point in lab_points[:2]:
-            summary += f"• {point.text}\n"
+            summary.append(f"• {point.text}\n")
 
-        summary += "\n**Imaging:**\n"
-        imaging_points = [kp for kp in key_points if kp.category == "imaging"]
+        summary.append("\n**Imaging:**\n")
+        imaging_points = points_by_category["imaging"]
         for point in imaging_points[:2]:
-            summary += f"• {point.text}\n"
+            summary.append(f"• {point.text}\n")
 
         # Differential Diagnosis
-        summary += "\n### Step 3: Differential Diagnosis\n"
+        summary.append("\n### Step 3: Differential Diagnosis\n")
         if "Differential Diagnosis" in content_analysis["sections"]:
             diff_sentences = content_analysis["sections"]["Differential Diagnosis"]["key_sentences"]
             for sentence in diff_sentences[:3]:
-                summary += f"• {sentence}\n"
+                summary.append(f"• {sentence}\n")
 
         # Confirmatory Tests
-        summary += "\n### Step 4: Confirmatory Testing\n"
-        confirmatory_keywords = ["confirm", "definitive", "gold standard", "diagnostic"]
+        summary.append("\n### Step 4: Confirmatory Testing\n")
         for point in key_points:
-            if any(kw in point.text.lower() for kw in confirmatory_keywords):
-                summary += f"• {point.text}\n"
+            if _CONFIRMATORY_RE.search(point.text_lower):
+                summary.append(f"• {point.text}\n")
                 break
 
         # Decision Points
-        summary += "\n### Decision Points\n"
-        summary += "```\n"
-        summary += "If [positive finding] → Consider [diagnosis/action]\n"
-        summary += "If [negative finding] → Consider [alternative diagnosis/action]\n"
-        summary += "```\n"
+        summary.append("\n### Decision Points\n")
+        summary.append("```\n")
+        summary.append("If [positive finding] → Consider [diagnosis/action]\n")
+        summary.append("If [negative finding] → Consider [alternative diagnosis/action]\n")
+        summary.append("```\n")
 
-        return summary
+        return "".join(summary)
 
     async def _generate_evidence_based_summary(
         self,
@@ -856,53 +1124,54 @@ class NeurosurgicalSummaryGenerator:
         Generates evidence-based summary with citations and evidence levels.
         """
 
-        summary = "## Evidence-Based Summary\n\n"
+        summary = ["## Evidence-Based Summary\n\n"]
 
         # Group points by evidence level
         points_with_citations = [kp for kp in key_points if kp.citations]
         points_without_citations = [kp for kp in key_points if not kp.citations]
 
         # Level I Evidence (RCTs, Meta-analyses)
-        summary += "### High-Quality Evidence\n"
+        summary.append("### High-Quality Evidence\n")
         for point in points_with_citations[:5]:
             citations = f" [{', '.join(point.citations)}]" if include_citations else ""
-            summary += f"• {point.text}{citations}\n"
+            summary.append(f"• {point.text}{citations}\n")
 
         # Observational Studies
         if points_without_citations:
-            summary += "\n### Observational Data & Expert Opinion\n"
+            summary.append("\n### Observational Data & Expert Opinion\n")
             for point in points_without_citations[:3]:
-                summary += f"• {point.text}\n"
+                summary.append(f"• {point.text}\n")
 
         # Key Statistics with Evidence
         if content_analysis["key_statistics"]:
-            summary += "\n### Key Statistics from Literature\n"
+            summary.append("\n### Key Statistics from Literature\n")
             for stat in content_analysis["key_statistics"][:4]:
-                summary += f"• {stat['value']}: {stat['context']}\n"
+                summary.append(f"• {stat['value']}: {stat['context']}\n")
 
         # Contradictions in Evidence
         if content_analysis["contradictions"]:
-            summary += "\n### Conflicting Evidence\n"
+            summary.append("\n### Conflicting Evidence\n")
             for contradiction in content_analysis["contradictions"][:2]:
-                summary += f"• {contradiction}\n"
+                summary.append(f"• {contradiction}\n")
 
         # Research Gaps
         if content_analysis["knowledge_gaps"]:
-            summary += "\n### Areas Requiring Further Research\n"
+            summary.append("\n### Areas Requiring Further Research\n")
             for gap in content_analysis["knowledge_gaps"][:2]:
-                summary += f"• {gap}\n"
+                summary.append(f"• {gap}\n")
 
         # References
         if include_citations and content_analysis["citations"]:
-            summary += "\n### Key References\n"
-            for citation in list(set(content_analysis["citations"]))[:10]:
-                summary += f"• {citation}\n"
+            summary.append("\n### Key References\n")
+            for citation in list(dict.fromkeys(content_analysis["citations"]))[:10]:
+                summary.append(f"• {citation}\n")
 
-        return summary
+        return "".join(summary)
 
     async def _generate_patient_education_summary(
         self,
         key_points: List[KeyPoint],
+        points_by_category: Dict[str, List[KeyPoint]],
         content_analysis: Dict[str, Any],
         length: SummaryLength
     ) -> str:
@@ -910,90 +1179,66 @@ class NeurosurgicalSummaryGenerator:
         Generates patient-friendly educational summary.
         """
 
-        summary = f"## Understanding {content_analysis['overall_topic']}\n\n"
+        summary = [f"## Understanding {content_analysis['overall_topic']}\n\n"]
 
         # What is it?
-        summary += "### What is this condition?\n"
+        summary.append("### What is this condition?\n")
         intro_points = [kp for kp in key_points
                        if kp.source_section in ["Introduction", "Pathophysiology"]]
         if intro_points:
             # Simplify medical terminology
             simplified = self._simplify_medical_language(intro_points[0].text)
-            summary += f"{simplified}\n"
+            summary.append(f"{simplified}\n")
 
         # Signs and Symptoms
-        summary += "\n### What are the symptoms?\n"
-        symptom_points = [kp for kp in key_points
-                         if kp.category == "clinical_presentation"]
+        summary.append("\n### What are the symptoms?\n")
+        symptom_points = points_by_category["clinical_presentation"]
         for point in symptom_points[:3]:
             simplified = self._simplify_medical_language(point.text)
-            summary += f"• {simplified}\n"
+            summary.append(f"• {simplified}\n")
 
         # Diagnosis
-        summary += "\n### How is it diagnosed?\n"
-        diagnostic_points = [kp for kp in key_points if kp.category == "diagnosis"]
+        summary.append("\n### How is it diagnosed?\n")
+        diagnostic_points = points_by_category["diagnosis"]
         if diagnostic_points:
             simplified = self._simplify_medical_language(diagnostic_points[0].text)
-            summary += f"{simplified}\n"
+            summary.append(f"{simplified}\n")
 
         # Treatment Options
-        summary += "\n### Treatment options\n"
-        treatment_points = [kp for kp in key_points if kp.category == "treatment"]
+        summary.append("\n### Treatment options\n")
+        treatment_points = points_by_category["treatment"]
         for point in treatment_points[:3]:
             simplified = self._simplify_medical_language(point.text)
-            summary += f"• {simplified}\n"
+            summary.append(f"• {simplified}\n")
 
         # What to Expect
-        summary += "\n### What to expect\n"
-        prognosis_points = [kp for kp in key_points if kp.category == "prognosis"]
+        summary.append("\n### What to expect\n")
+        prognosis_points = points_by_category["prognosis"]
         if prognosis_points:
             simplified = self._simplify_medical_language(prognosis_points[0].text)
-            summary += f"{simplified}\n"
+            summary.append(f"{simplified}\n")
 
         # Important Points
-        summary += "\n### Important points to remember\n"
+        summary.append("\n### Important points to remember\n")
         for pearl in key_points[:3]:
             if pearl.clinical_relevance == "HIGH":
                 simplified = self._simplify_medical_language(pearl.text)
-                summary += f"• {simplified}\n"
+                summary.append(f"• {simplified}\n")
 
-        return summary
+        return "".join(summary)
 
     def _simplify_medical_language(self, text: str) -> str:
         """
         Simplifies medical terminology for patient understanding.
         """
 
-        # Dictionary of medical terms to lay terms
-        replacements = {
-            "bilateral": "both sides",
-            "unilateral": "one side",
-            "anterior": "front",
-            "posterior": "back",
-            "superior": "upper",
-            "inferior": "lower",
-            "acute": "sudden",
-            "chronic": "long-term",
-            "malignant": "cancerous",
-            "benign": "non-cancerous",
-            "prognosis": "outlook",
-            "morbidity": "illness",
-            "mortality": "death rate",
-            "incidence": "how often it occurs",
-            "prevalence": "how common it is",
-            "contraindication": "reason not to use",
-            "adverse effect": "side effect"
-        }
-
-        simplified = text
-        for medical_term, lay_term in replacements.items():
-            simplified = re.sub(f"\\b{medical_term}\\b", lay_term, simplified, flags=re.IGNORECASE)
-
-        return simplified
+        # One case-insensitive pass; the named group that matched identifies the term
+        return _LAY_TERM_RE.sub(lambda match: _LAY_TERM_REPLACEMENTS[match.lastgroup], text)
 
     async def _generate_board_review_summary(
         self,
         key_points: List[KeyPoint],
+        points_by_category: Dict[str, List[KeyPoint]],
         content_analysis: Dict[str, Any],
         length: SummaryLength
     ) -> str:
@@ -1001,62 +1246,62 @@ class NeurosurgicalSummaryGenerator:
         Generates board exam review format summary.
         """
 
-        summary = f"## Board Review: {content_analysis['overall_topic']}\n\n"
+        summary = [f"## Board Review: {content_analysis['overall_topic']}\n\n"]
 
         # High-Yield Facts
-        summary += "### HIGH-YIELD FACTS\n"
+        summary.append("### HIGH-YIELD FACTS\n")
         high_yield = [kp for kp in key_points if kp.importance > 0.8]
         for i, point in enumerate(high_yield[:10], 1):
-            summary += f"{i}. {point.text}\n"
+            summary.append(f"{i}. {point.text}\n")
 
         # Classic Presentation
-        summary += "\n### CLASSIC PRESENTATION\n"
-        presentation_points = [kp for kp in key_points
-                             if kp.category == "clinical_presentation"]
+        summary.append("\n### CLASSIC PRESENTATION\n")
+        presentation_points = points_by_category["clinical_presentation"]
         if presentation_points:
-            summary += f"• {presentation_points[0].text}\n"
+            summary.append(f"• {presentation_points[0].text}\n")
 
         # Diagnostic Test of Choice
-        summary += "\n### DIAGNOSTIC TEST OF CHOICE\n"
-        diagnostic_points = [kp for kp in key_points if kp.category == "diagnosis"]
+        summary.append("\n### DIAGNOSTIC TEST OF CHOICE\n")
+        diagnostic_points = points_by_category["diagnosis"]
         for point in diagnostic_points:
-            if "gold standard" in point.text.lower() or "first" in point.text.lower():
-                summary += f"• {point.text}\n"
+            if "gold standard" in point.text_lower or "first" in point.text_lower:
+                summary.append(f"• {point.text}\n")
                 break
 
         # Treatment of Choice
-        summary += "\n### TREATMENT OF CHOICE\n"
-        treatment_points = [kp for kp in key_points if kp.category == "treatment"]
+        summary.append("\n### TREATMENT OF CHOICE\n")
+        treatment_points = points_by_category["treatment"]
         for point in treatment_points:
-            if "first line" in point.text.lower() or "treatment of choice" in point.text.lower():
-                summary += f"• {point.text}\n"
+            if "first line" in point.text_lower or "treatment of choice" in point.text_lower:
+                summary.append(f"• {point.text}\n")
                 break
 
         # Complications to Know
-        summary += "\n### MUST-KNOW COMPLICATIONS\n"
-        complication_points = [kp for kp in key_points if kp.category == "complications"]
+        summary.append("\n### MUST-KNOW COMPLICATIONS\n")
+        complication_points = points_by_category["complications"]
         for point in complication_points[:3]:
-            summary += f"• {point.text}\n"
+            summary.append(f"• {point.text}\n")
 
         # Buzzwords
-        summary += "\n### BUZZWORDS & ASSOCIATIONS\n"
+        summary.append("\n### BUZZWORDS & ASSOCIATIONS\n")
         # Extract characteristic findings
         for section_data in content_analysis["sections"].values():
             for term in section_data["medical_terms"][:5]:
                 if len(term) > 5:  # Filter out very short terms
-                    summary += f"• {term}\n"
+                    summary.append(f"• {term}\n")
 
         # Key Statistics to Memorize
         if content_analysis["key_statistics"]:
-            summary += "\n### KEY NUMBERS\n"
+            summary.append("\n### KEY NUMBERS\n")
             for stat in content_analysis["key_statistics"][:5]:
-                summary += f"• {stat['value']}: {stat['context'][:40]}...\n"
+                summary.append(f"• {stat['value']}: {stat['context'][:40]}...\n")
 
-        return summary
+        return "".join(summary)
 
     async def _generate_emergency_guide(
         self,
         key_points: List[KeyPoint],
+        points_by_category: Dict[str, List[KeyPoint]],
         clinical_pearls: List[ClinicalPearl],
         content_analysis: Dict[str, Any],
         length: SummaryLength
@@ -1065,59 +1310,53 @@ class NeurosurgicalSummaryGenerator:
         Generates emergency management guide.
         """
 
-        summary = f"## EMERGENCY GUIDE: {content_analysis['overall_topic']}\n\n"
+        summary = [f"## EMERGENCY GUIDE: {content_analysis['overall_topic']}\n\n"]
 
         # Immediate Actions
-        summary += "### ⚡ IMMEDIATE ACTIONS\n"
-        critical_points = [kp for kp in key_points if kp.category == "critical"]
+        summary.append("### ⚡ IMMEDIATE ACTIONS\n")
+        critical_points = points_by_category["critical"]
         for i, point in enumerate(critical_points[:5], 1):
-            summary += f"{i}. {point.text}\n"
+            summary.append(f"{i}. {point.text}\n")
 
         # Red Flags
-        summary += "\n### 🚨 RED FLAGS\n"
+        summary.append("\n### 🚨 RED FLAGS\n")
         for point in content_analysis["critical_information"][:5]:
-            summary += f"• {point}\n"
+            summary.append(f"• {point}\n")
 
         # Initial Assessment
-        summary += "\n### 📋 INITIAL ASSESSMENT\n"
-        summary += "**Vital Signs & Primary Survey**\n"
-        assessment_points = [kp for kp in key_points
-                            if any(word in kp.text.lower()
-                                  for word in ["assess", "evaluate", "check", "monitor"])]
+        summary.append("\n### 📋 INITIAL ASSESSMENT\n")
+        summary.append("**Vital Signs & Primary Survey**\n")
+        assessment_points = [kp for kp in key_points if _ASSESSMENT_RE.search(kp.text_lower)]
         for point in assessment_points[:3]:
-            summary += f"• {point.text}\n"
+            summary.append(f"• {point.text}\n")
 
         # Emergency Diagnostics
-        summary += "\n### 🔬 STAT DIAGNOSTICS\n"
-        diagnostic_points = [kp for kp in key_points
-                           if kp.category == "diagnosis" and
-                           any(word in kp.text.lower()
-                               for word in ["urgent", "stat", "immediate", "emergency"])]
+        summary.append("\n### 🔬 STAT DIAGNOSTICS\n")
+        diagnostic_points = [kp for kp in points_by_category["diagnosis"]
+                             if _STAT_DIAGNOSTIC_RE.search(kp.text_lower)]
         for point in diagnostic_points[:3]:
-            summary += f"• {point.text}\n"
+            summary.append(f"• {point.text}\n")
 
         # Emergency Treatment
-        summary += "\n### 💊 EMERGENCY TREATMENT\n"
-        treatment_points = [kp for kp in key_points
-                          if kp.category == "treatment" and
-                          any(word in kp.text.lower()
-                              for word in ["immediate", "emergency", "urgent", "first"])]
+        summary.append("\n### 💊 EMERGENCY TREATMENT\n")
+        treatment_points = [kp for kp in points_by_category["treatment"]
+                            if _EMERGENCY_TREATMENT_RE.search(kp.text_lower)]
         for point in treatment_points[:4]:
-            summary += f"• {point.text}\n"
+            summary.append(f"• {point.text}\n")
 
         # Complications to Watch
-        summary += "\n### ⚠️ COMPLICATIONS TO MONITOR\n"
-        complication_points = [kp for kp in key_points if kp.category == "complications"]
+        summary.append("\n### ⚠️ COMPLICATIONS TO MONITOR\n")
+        complication_points = points_by_category["complications"]
         for point in complication_points[:3]:
-            summary += f"• {point.text}\n"
+            summary.append(f"• {point.text}\n")
 
         # Disposition
-        summary += "\n### 🏥 DISPOSITION\n"
-        summary += "• Admit if: [Critical criteria]\n"
-        summary += "• Consult: [Relevant specialties]\n"
-        summary += "• Transfer if: [Higher level of care needed]\n"
+        summary.append("\n### 🏥 DISPOSITION\n")
+        summary.append("• Admit if: [Critical criteria]\n")
+        summary.append("• Consult: [Relevant specialties]\n")
+        summary.append("• Transfer if: [Higher level of care needed]\n")
 
-        return summary
+        return "".join(summary)
 
     def _format_summary(
         self,
@@ -1130,13 +1369,13 @@ class NeurosurgicalSummaryGenerator:
         """
 
         # Clean up formatting
-        summary = re.sub(r'\n{3,}', '\n\n', summary)  # Remove excess newlines
-        summary = re.sub(r' {2,}', ' ', summary)  # Remove excess spaces
+        summary = _EXCESS_NEWLINES_RE.sub('\n\n', summary)  # Remove excess newlines
+        summary = _EXCESS_SPACES_RE.sub(' ', summary)  # Remove excess spaces
 
         # Add mode-specific formatting
         if mode == SummaryMode.QUICK_REFERENCE:
             # Add visual separators for quick scanning
-            summary = re.sub(r'^###', '---\n###', summary, flags=re.MULTILINE)
+            summary = _HEADING_RE.sub('---\n###', summary)
 
         elif mode == SummaryMode.EMERGENCY_GUIDE:
             # Add timestamp
@@ -1146,10 +1385,10 @@ class NeurosurgicalSummaryGenerator:
 
         # Remove citations if not needed
         if not include_citations:
-            summary = re.sub(r'\[[^\]]+\]', '', summary)
+            summary = _BRACKETED_CITATION_RE.sub('', summary)
 
         # Ensure consistent bullet points
-        summary = re.sub(r'^[•·▪]', '•', summary, flags=re.MULTILINE)
+        summary = _BULLET_RE.sub('•', summary)
 
         return summary.strip()
 
@@ -1210,25 +1449,33 @@ class NeurosurgicalSummaryGenerator:
         self,
         chapter_data: Dict[str, Any],
         modes: List[SummaryMode],
-        length: SummaryLength = SummaryLength.STANDARD
+        length: SummaryLength = SummaryLength.STANDARD,
+        validate: bool = True,
+        max_concurrency: Optional[int] = None
     ) -> Dict[str, Dict[str, Any]]:
         """
         Generates multiple summary types for the same chapter.
         Useful for creating comprehensive documentation.
+
+        Modes are generated concurrently; max_concurrency caps how many run
+        at once when the AI backend is rate limited.
         """
 
-        summaries = {}
+        semaphore = asyncio.Semaphore(max_concurrency or max(len(modes), 1))
 
-        for mode in modes:
-            logger.info(f"Generating {mode.value} summary...")
-            summary_result = await self.generate_summary(
-                chapter_data=chapter_data,
-                mode=mode,
-                length=length
-            )
-            summaries[mode.value] = summary_result
+        async def generate(mode: SummaryMode) -> Dict[str, Any]:
+            async with semaphore:
+                logger.info(f"Generating {mode.value} summary...")
+                return await self.generate_summary(
+                    chapter_data=chapter_data,
+                    mode=mode,
+                    length=length,
+                    validate=validate
+                )
+
+        results = await asyncio.gather(*(generate(mode) for mode in modes))
 
-        return summaries
+        return {mode.value: result for mode, result in zip(modes, results)}
 
 
 # Utility class for summary export
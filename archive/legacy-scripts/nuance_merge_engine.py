@@ -6,11 +6,12 @@ Uses multi-algorithm similarity detection with ML fallback and Claude-powered me
 
 import asyncio
 import difflib
+import functools
 import hashlib
 import logging
 import re
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, FrozenSet, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from collections import defaultdict
@@ -19,9 +20,17 @@ logger = logging.getLogger(__name__)
 
 # Optional ML imports with graceful fallback
 try:
-    from sentence_transformers import SentenceTransformer
     import numpy as np
-    SENTENCE_TRANSFORMERS_AVAILABLE = True
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+    logger.info("numpy not available, using fallback methods")
+
+# The embedding and compiled edit distance paths below both operate on numpy arrays
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = NUMPY_AVAILABLE
 except ImportError:
     SENTENCE_TRANSFORMERS_AVAILABLE = False
     logger.info("sentence-transformers not available, using fallback methods")
@@ -34,6 +43,54 @@ except ImportError:
     SKLEARN_AVAILABLE = False
     logger.info("sklearn not available, using basic similarity methods")
 
+try:
+    from rapidfuzz.distance import Levenshtein
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+    logger.info("rapidfuzz not available, using fallback edit distance")
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.info("numba not available, using pure Python edit distance")
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _levenshtein_kernel(codes1, codes2):
+        """Two-row Levenshtein DP over character code arrays (codes1 the longer)"""
+        previous_row = np.arange(codes2.shape[0] + 1, dtype=np.int32)
+        current_row = np.empty_like(previous_row)
+        for i in range(codes1.shape[0]):
+            current_row[0] = i + 1
+            for j in range(codes2.shape[0]):
+                insertions = previous_row[j + 1] + 1
+                deletions = current_row[j] + 1
+                substitutions = previous_row[j] + (codes1[i] != codes2[j])
+                current_row[j + 1] = min(insertions, deletions, substitutions)
+            previous_row, current_row = current_row, previous_row
+        return previous_row[codes2.shape[0]]
+
+
+@functools.lru_cache(maxsize=1024)
+def _content_digest(text: str) -> str:
+    """Digest of the full text, so sections sharing a prefix never share cache entries"""
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+@functools.lru_cache(maxsize=4096)
+def _word_set(text: str) -> FrozenSet[str]:
+    """Lowercased whitespace tokens of text, shared by the set-based metrics"""
+    return frozenset(text.lower().split())
+
+
+def _char_codes(text: str) -> "np.ndarray":
+    """Unicode code points of text as a uint32 array for the JIT kernels"""
+    return np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+
 
 # ============================================================================
 # ENUMS AND DATA CLASSES
@@ -258,6 +315,13 @@ class NuanceMergeEngine:
         # Parse external content by sections
         external_sections = self._parse_external_sections(external_content)
 
+        # Embed every matched section pair in one batch up front
+        await self._precompute_semantic_similarities([
+            (section_content, external_sections[section_name])
+            for section_name, section_content in merged_chapter.get('content', {}).items()
+            if section_name in external_sections
+        ])
+
         # Merge each section intelligently
         for section_name, section_content in merged_chapter.get('content', {}).items():
             if section_name in external_sections:
@@ -454,34 +518,61 @@ class NuanceMergeEngine:
     async def _calculate_semantic_similarity(self, content1: str, content2: str) -> float:
         """Calculate semantic similarity using available methods"""
 
+        cache_key = self._generate_cache_key(content1, content2, "semantic")
+        if cache_key in self.similarity_cache:
+            return self.similarity_cache[cache_key]
+
         if SENTENCE_TRANSFORMERS_AVAILABLE and self.sentence_transformer_model:
             try:
-                # Primary: Sentence transformers
-                embeddings = self.sentence_transformer_model.encode([content1, content2])
-                similarity = float(np.dot(embeddings[0], embeddings[1]) / (
-                    np.linalg.norm(embeddings[0]) * np.linalg.norm(embeddings[1])
-                ))
+                # Primary: Sentence transformers (normalized, so the dot product is the cosine)
+                embeddings = self._encode_normalized([content1, content2])
+                similarity = float(embeddings[0] @ embeddings[1])
+                self.similarity_cache[cache_key] = similarity
                 return similarity
             except Exception as e:
                 logger.warning(f"Sentence transformer failed: {e}")
 
         if SKLEARN_AVAILABLE:
             try:
-                # Fallback 1: TF-IDF with cosine similarity
+                # Fallback 1: TF-IDF with cosine similarity. IDF weights are specific
+                # to the pair, so the vectorizer is fitted per pair and the result cached.
                 vectorizer = TfidfVectorizer()
                 tfidf_matrix = vectorizer.fit_transform([content1, content2])
-                similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-                return float(similarity)
+                similarity = float(cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0])
+                self.similarity_cache[cache_key] = similarity
+                return similarity
             except Exception as e:
                 logger.warning(f"TF-IDF failed: {e}")
 
         # Fallback 2: Simple word overlap
         return self._calculate_word_overlap_ratio(content1, content2)
 
+    async def _precompute_semantic_similarities(self, pairs: List[Tuple[str, str]]) -> None:
+        """Embed all content pairs in one batched encode and cache their similarities"""
+        if not (SENTENCE_TRANSFORMERS_AVAILABLE and self.sentence_transformer_model) or not pairs:
+            return
+
+        try:
+            embeddings = self._encode_normalized([text for pair in pairs for text in pair])
+        except Exception as e:
+            logger.warning(f"Batched sentence transformer encoding failed: {e}")
+            return
+
+        # Row-wise dot products of (original, updated) embeddings
+        similarities = (embeddings[0::2] * embeddings[1::2]).sum(axis=1)
+        for (content1, content2), similarity in zip(pairs, similarities):
+            self.similarity_cache[self._generate_cache_key(content1, content2, "semantic")] = float(similarity)
+
+    def _encode_normalized(self, texts: List[str]) -> "np.ndarray":
+        """Encode texts into unit-length embeddings"""
+        return self.sentence_transformer_model.encode(
+            texts, batch_size=64, convert_to_numpy=True, normalize_embeddings=True
+        )
+
     def _calculate_jaccard_similarity(self, content1: str, content2: str) -> float:
         """Calculate Jaccard similarity coefficient"""
-        words1 = set(content1.lower().split())
-        words2 = set(content2.lower().split())
+        words1 = _word_set(content1)
+        words2 = _word_set(content2)
 
         if not words1 and not words2:
             return 1.0
@@ -493,12 +584,18 @@ class NuanceMergeEngine:
 
     def _calculate_levenshtein_distance(self, content1: str, content2: str) -> int:
         """Calculate Levenshtein edit distance"""
+        if RAPIDFUZZ_AVAILABLE:
+            return Levenshtein.distance(content1, content2)
+
         if len(content1) < len(content2):
             return self._calculate_levenshtein_distance(content2, content1)
 
         if len(content2) == 0:
             return len(content1)
 
+        if NUMBA_AVAILABLE:
+            return int(_levenshtein_kernel(_char_codes(content1), _char_codes(content2)))
+
         previous_row = range(len(content2) + 1)
         for i, c1 in enumerate(content1):
             current_row = [i + 1]
@@ -533,8 +630,8 @@ class NuanceMergeEngine:
 
     def _calculate_word_overlap_ratio(self, content1: str, content2: str) -> float:
         """Calculate simple word overlap ratio"""
-        words1 = set(content1.lower().split())
-        words2 = set(content2.lower().split())
+        words1 = _word_set(content1)
+        words2 = _word_set(content2)
 
         if not words1 and not words2:
             return 1.0
@@ -882,8 +979,7 @@ Merged Content:"""
 
     def _generate_cache_key(self, content1: str, content2: str, algorithm: str) -> str:
         """Generate cache key for similarity calculations"""
-        combined = f"{content1[:100]}::{content2[:100]}::{algorithm}"
-        return hashlib.md5(combined.encode()).hexdigest()
+        return f"{_content_digest(content1)}::{_content_digest(content2)}::{algorithm}"
 
     def _parse_external_sections(self, external_content: str) -> Dict[str, str]:
         """Parse external enrichment content into sections"""
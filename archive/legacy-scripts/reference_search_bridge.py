@@ -322,6 +322,10 @@ class IntegratedReferenceSystem:
         self.bridge = ReferenceSearchBridge(self.library, self.synthesizer)
         self.external_searcher = external_searcher  # Optional external AI searcher
 
+    def shutdown(self):
+        """Releases the synthesizer's extraction worker pool"""
+        self.synthesizer.shutdown()
+
     async def generate_chapter(
         self,
         topic: str,
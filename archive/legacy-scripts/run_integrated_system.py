@@ -22,6 +22,23 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def save_chapter_json(path: Path, chapter: dict):
+    """Writes a chapter as indented UTF-8 JSON, encoding with orjson when available"""
+    if ORJSON_AVAILABLE:
+        path.write_bytes(orjson.dumps(chapter, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+
+    import json
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(chapter, f, indent=2, ensure_ascii=False)
+
 
 async def run_synthesis(args):
     """Run synthesis for a single topic"""
@@ -56,10 +73,8 @@ async def run_synthesis(args):
     # Output results
     if args.output:
         # Save to file
-        import json
         output_path = Path(args.output)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(chapter, f, indent=2, ensure_ascii=False)
+        save_chapter_json(output_path, chapter)
         logger.info(f"Chapter saved to: {output_path}")
     else:
         # Print summary
@@ -120,8 +135,7 @@ async def run_batch(args):
                 output_dir = Path(args.output)
                 output_dir.mkdir(exist_ok=True)
                 chapter_file = output_dir / f"{topic.replace(' ', '_').lower()}.json"
-                with open(chapter_file, 'w', encoding='utf-8') as f:
-                    json.dump(chapter, f, indent=2, ensure_ascii=False)
+                save_chapter_json(chapter_file, chapter)
 
         except Exception as e:
             logger.error(f"Failed to process {topic}: {e}")
@@ -287,8 +301,7 @@ async def run_enrichment(args):
             # Save to same location with _enriched suffix
             output_path = chapter_file.with_stem(f"{chapter_file.stem}_enriched")
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(enriched_chapter, f, indent=2, ensure_ascii=False)
+        save_chapter_json(output_path, enriched_chapter)
 
         print(f"\n✅ Enriched chapter saved to: {output_path}")
 
@@ -360,8 +373,7 @@ async def run_merge(args):
         # Default: internal_chapter_merged.json
         output_path = internal_file.with_stem(f"{internal_file.stem}_merged")
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(merged_chapter, f, indent=2, ensure_ascii=False)
+    save_chapter_json(output_path, merged_chapter)
 
     print(f"\n✅ Merged chapter saved to: {output_path}")
 
@@ -423,7 +435,8 @@ async def run_summarize(args):
         chapter_data=chapter,
         mode=mode,
         length=length,
-        include_citations=not args.no_citations
+        include_citations=not args.no_citations,
+        validate=False  # Only the summary and its metadata are reported
     )
 
     # Save summary
@@ -482,8 +495,7 @@ async def run_activate(args):
     else:
         output_path = chapter_file.with_stem(f"{chapter_file.stem}_activated")
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(activated_chapter, f, indent=2, ensure_ascii=False)
+    save_chapter_json(output_path, activated_chapter)
 
     print(f"\n✅ Chapter activated: {output_path}")
 
@@ -546,8 +558,7 @@ async def run_ask(args):
         else:
             output_path = chapter_file.with_stem(f"{chapter_file.stem}_qa_updated")
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(result['updated_chapter'], f, indent=2, ensure_ascii=False)
+        save_chapter_json(output_path, result['updated_chapter'])
 
         print(f"\n✅ Chapter updated with Q&A integration: {output_path}")
 
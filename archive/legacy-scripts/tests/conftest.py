@@ -0,0 +1,8 @@
+"""
+Shared fixtures for the legacy script tests
+"""
+import sys
+from pathlib import Path
+
+# The legacy scripts are plain modules, not a package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,143 @@
+"""
+Unit tests for the enhanced synthesis engine
+Tests caching of AI responses, content analyses and chapters
+"""
+import pytest
+
+from enhanced_synthesizer_service import (
+    ContentElement, ContentType, EnhancedSynthesisEngine, SynthesizerServiceAdapter
+)
+
+
+class ScriptedAIManager:
+    """Returns queued responses in order and counts the calls made"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    async def query(self, preferred_provider, prompt, use_fallback=True, **kwargs):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+class TestCachedQuery:
+    """Test reuse of AI query responses"""
+
+    @pytest.mark.asyncio
+    async def test_successful_response_is_reused(self):
+        """Identical prompts reach the AI manager once"""
+        manager = ScriptedAIManager("Section text")
+        engine = EnhancedSynthesisEngine(hybrid_ai_manager=manager)
+
+        assert await engine._cached_query("Claude", "prompt") == "Section text"
+        assert await engine._cached_query("Claude", "prompt") == "Section text"
+        assert manager.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_query_is_retried(self):
+        """A provider failure is not cached; the next call retries and caches the success"""
+        manager = ScriptedAIManager("[AI Service Error: All providers failed]", "Section text")
+        engine = EnhancedSynthesisEngine(hybrid_ai_manager=manager)
+
+        assert (await engine._cached_query("Claude", "prompt")).startswith("[AI Service Error")
+        assert await engine._cached_query("Claude", "prompt") == "Section text"
+        assert await engine._cached_query("Claude", "prompt") == "Section text"
+        assert manager.calls == 2
+
+
+class TestAnalysisCache:
+    """Test caching of AI content analyses"""
+
+    @staticmethod
+    def make_elements():
+        return [
+            ContentElement(
+                type=ContentType.TEXT,
+                content="Gross total resection improves survival.",
+                source="Youmans",
+                citation="Youmans 2022"
+            )
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("failed_response", [
+        "[AI Service Error: All providers failed]",
+        "The sources broadly agree.",
+    ])
+    async def test_unusable_analysis_is_not_cached(self, failed_response):
+        """Failed queries and responses without JSON are retried on the next call"""
+        manager = ScriptedAIManager(failed_response, '{"knowledge_gaps": ["Long-term outcomes"]}')
+        engine = EnhancedSynthesisEngine(hybrid_ai_manager=manager)
+        elements = self.make_elements()
+
+        first = await engine._analyze_content_relationships(elements, "Glioma")
+        second = await engine._analyze_content_relationships(elements, "Glioma")
+        third = await engine._analyze_content_relationships(elements, "Glioma")
+
+        assert first.knowledge_gaps == []
+        assert second.knowledge_gaps == ["Long-term outcomes"]
+        assert third.knowledge_gaps == ["Long-term outcomes"]
+        assert manager.calls == 2
+
+
+class DictCache:
+    """Minimal get/set store recording the writes made"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ttl):
+        self.data[key] = value
+
+
+class StubEngine:
+    """Returns a fixed chapter from synthesize_initial_chapter"""
+
+    def __init__(self, chapter):
+        self.chapter = chapter
+        self.calls = 0
+
+    async def synthesize_initial_chapter(self, topic, internal_references, include_images=True):
+        self.calls += 1
+        return self.chapter
+
+
+class TestChapterCache:
+    """Test that only fully synthesized chapters are cached"""
+
+    @pytest.mark.asyncio
+    async def test_failed_section_is_reported(self):
+        """An AI failure yields fallback text flagged as failed"""
+        manager = ScriptedAIManager("[AI Service Error: All providers failed]")
+        engine = EnhancedSynthesisEngine(hybrid_ai_manager=manager)
+
+        content, failed = await engine._generate_comprehensive_section(
+            section_name="Introduction",
+            content_elements=[],
+            top_contradictions=[],
+            has_contradictions=False,
+            aggregated_evidence="",
+            topic="Glioma",
+            include_images=False
+        )
+
+        assert failed
+        assert "[AI Service Error" not in content
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("failed_sections, cached", [
+        ([], True),
+        (["Surgical Technique"], False),
+    ])
+    async def test_chapter_with_failed_sections_not_cached(self, failed_sections, cached):
+        """Chapters are cached only when no section fell back to error text"""
+        chapter = {"topic": "Glioma", "content": {}, "metadata": {"failed_sections": failed_sections}}
+        cache = DictCache()
+        adapter = SynthesizerServiceAdapter(StubEngine(chapter), cache=cache)
+
+        assert await adapter.synthesize_chapter("Glioma", [{"id": 1}]) == chapter
+        assert bool(cache.data) == cached
@@ -26,6 +26,7 @@ class Settings(BaseSettings):
     # Redis Cache
     REDIS_URL: str = Field(default="redis://localhost:6379/0")
     CACHE_TTL_SECONDS: int = 3600
+    CACHE_SHARED_L2: bool = False  # Share cached results across workers via Redis
 
     # AI Services (only what you need)
     OPENAI_API_KEY: Optional[str] = None
@@ -17,6 +17,7 @@ from core.database_simplified import engine, Base
 from core.exceptions import NSEXPException
 from services.ai_manager import ai_manager, initialize_ai_services
 from utils.logger import setup_logging
+from utils.cache import configure_cache
 from middleware.logging_middleware import LoggingMiddleware
 from middleware.version_middleware import VersionMiddleware
 from middleware.security_middleware import (
@@ -34,7 +35,8 @@ logger = setup_logging(
     log_level="INFO",
     log_file="logs/app.log",
     json_logs=True,
-    rotate_logs=True
+    rotate_logs=True,
+    async_logging=True
 )
 
 
@@ -52,6 +54,10 @@ async def lifespan(app: FastAPI):
         logger.warning(f"Database connection failed (will use mock data): {e}")
         # System can still run with mock responses
 
+    # Share cached results across uvicorn workers when enabled
+    if settings.CACHE_SHARED_L2:
+        configure_cache(redis_url=settings.REDIS_URL, default_ttl=settings.CACHE_TTL_SECONDS)
+
     # Initialize AI services
     await initialize_ai_services()
 
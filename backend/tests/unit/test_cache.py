@@ -0,0 +1,202 @@
+"""
+Unit tests for the caching utility
+Tests compression, the Redis L2 tier and tiered TTL handling
+"""
+import pickle
+
+import pytest
+
+from utils.cache import SimpleCache, RedisCache, TieredCache, _CompressedValue
+
+
+class FakePipeline:
+    """Buffers GET/PTTL calls and replays them against a FakeRedis"""
+
+    def __init__(self, redis_client):
+        self._redis = redis_client
+        self._ops = []
+
+    def get(self, key):
+        self._ops.append((self._redis.get, key))
+        return self
+
+    def pttl(self, key):
+        self._ops.append((self._redis.pttl, key))
+        return self
+
+    def execute(self):
+        return [op(key) for op, key in self._ops]
+
+
+class FakeAsyncPipeline(FakePipeline):
+    """Async flavour of FakePipeline, usable as an async context manager"""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self):
+        return super().execute()
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis client calls RedisCache makes"""
+
+    def __init__(self):
+        self.data = {}
+        self.ttl_ms = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def pttl(self, key):
+        if key not in self.data:
+            return -2
+        return self.ttl_ms.get(key, -1)
+
+    def set(self, key, value, px=None):
+        self.data[key] = value
+        if px is not None:
+            self.ttl_ms[key] = px
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+            self.ttl_ms.pop(key, None)
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakeAsyncRedis(FakeRedis):
+    """Async client sharing the sync fake's storage"""
+
+    def __init__(self, shared):
+        self.data = shared.data
+        self.ttl_ms = shared.ttl_ms
+
+    async def set(self, key, value, px=None):
+        super().set(key, value, px=px)
+
+    def pipeline(self):
+        return FakeAsyncPipeline(self)
+
+
+@pytest.fixture
+def fake_redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def redis_cache(fake_redis):
+    """RedisCache wired to the in-memory fake instead of a server"""
+    pytest.importorskip("redis")
+    cache = RedisCache("redis://localhost:6379/0", default_ttl=300)
+    cache._client = fake_redis
+    cache._async_client = FakeAsyncRedis(fake_redis)
+    return cache
+
+
+class TestSimpleCacheCompression:
+    """Test lz4 compression of in-process values"""
+
+    @pytest.mark.unit
+    def test_compressed_round_trip(self):
+        """Large values are stored compressed and read back unchanged"""
+        pytest.importorskip("lz4.frame")
+        cache = SimpleCache()
+        value = {"content": "Glioblastoma resection " * 500, "sections": list(range(50))}
+
+        cache.set("chapter", value, compress=True)
+
+        assert isinstance(cache._cache["chapter"], _CompressedValue)
+        assert cache.get("chapter") == value
+
+    @pytest.mark.unit
+    def test_small_values_stay_uncompressed(self):
+        """Values below the size threshold are stored as-is"""
+        pytest.importorskip("lz4.frame")
+        cache = SimpleCache()
+
+        cache.set("small", {"a": 1}, compress=True)
+
+        assert cache._cache["small"] == {"a": 1}
+
+
+class TestRedisCache:
+    """Test Redis value encoding and decode failures"""
+
+    @pytest.mark.unit
+    def test_round_trip(self, redis_cache):
+        """JSON-able values round trip through Redis"""
+        redis_cache.set("chapter", {"title": "Meningioma", "pages": [1, 2]}, ttl=30)
+
+        assert redis_cache.get("chapter") == {"title": "Meningioma", "pages": [1, 2]}
+        assert redis_cache.get_with_ttl("chapter")[1] == 30.0
+
+    @pytest.mark.unit
+    def test_fractional_ttl_kept(self, redis_cache):
+        """Fractional TTLs reach Redis at millisecond precision"""
+        redis_cache.set("chapter", {"title": "Meningioma"}, ttl=1.5)
+
+        assert redis_cache.get_with_ttl("chapter")[1] == 1.5
+
+    @pytest.mark.unit
+    def test_pickled_entry_is_a_miss(self, redis_cache, fake_redis):
+        """Pickled payloads are never unpickled; the entry is dropped"""
+        fake_redis.data["nsexp:cache:legacy"] = pickle.dumps({"a": 1})
+
+        assert redis_cache.get("legacy") is None
+        assert "nsexp:cache:legacy" not in fake_redis.data
+
+    @pytest.mark.unit
+    def test_corrupt_entry_is_a_miss(self, redis_cache, fake_redis):
+        """Truncated payloads are treated as misses and dropped"""
+        redis_cache.set("chapter", {"title": "Meningioma"})
+        fake_redis.data["nsexp:cache:chapter"] = fake_redis.data["nsexp:cache:chapter"][:4]
+
+        assert redis_cache.get("chapter") is None
+        assert "nsexp:cache:chapter" not in fake_redis.data
+
+    @pytest.mark.unit
+    def test_unserializable_value_not_stored(self, redis_cache, fake_redis):
+        """Values without a safe encoding stay out of Redis"""
+        redis_cache.set("obj", object())
+
+        assert fake_redis.data == {}
+
+
+class TestTieredCache:
+    """Test L1 refill from the shared L2 tier"""
+
+    @pytest.mark.unit
+    def test_l2_hit_fills_l1_with_remaining_ttl(self, redis_cache):
+        """An L2 hit is copied into L1 for the key's remaining Redis TTL"""
+        tiered = TieredCache(SimpleCache(default_ttl=300), redis_cache)
+        redis_cache.set("chapter", {"title": "Meningioma"}, ttl=30)
+
+        assert tiered.get("chapter") == {"title": "Meningioma"}
+        assert tiered.l1.get("chapter") == {"title": "Meningioma"}
+        assert tiered.l1._timestamps["chapter"]["ttl"] == 30.0
+
+    @pytest.mark.unit
+    def test_set_fills_both_tiers(self, redis_cache):
+        """Writes go to both tiers with the caller's TTL"""
+        tiered = TieredCache(SimpleCache(default_ttl=300), redis_cache)
+
+        tiered.set("chapter", {"title": "Meningioma"}, ttl=30)
+
+        assert tiered.l1._timestamps["chapter"]["ttl"] == 30
+        assert redis_cache.get_with_ttl("chapter") == ({"title": "Meningioma"}, 30.0)
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_async_l2_hit_fills_l1_with_remaining_ttl(self, redis_cache):
+        """The async path refills L1 with the remaining TTL as well"""
+        tiered = TieredCache(SimpleCache(default_ttl=300), redis_cache)
+        await redis_cache.aset("chapter", {"title": "Meningioma"}, ttl=30)
+
+        assert await tiered.aget("chapter") == {"title": "Meningioma"}
+        assert tiered.l1._timestamps["chapter"]["ttl"] == 30.0
@@ -0,0 +1,121 @@
+"""
+Unit tests for the logging utility
+Tests level dispatch, caller-info toggling and error log routing
+"""
+import logging
+
+import pytest
+
+from utils.logger import setup_logging, log_with_context
+
+
+class ListHandler(logging.Handler):
+    """Collects emitted records"""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def capture_logger():
+    logger = logging.getLogger("tests.log_with_context")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    handler = ListHandler()
+    logger.addHandler(handler)
+    yield logger, handler.records
+    logger.removeHandler(handler)
+
+
+@pytest.fixture
+def restore_logging():
+    """Put the default logging setup back after a test reconfigures it"""
+    yield
+    setup_logging()
+
+
+class TestLogWithContext:
+    """Test log_with_context level names"""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("level, expected", [
+        ("debug", logging.DEBUG),
+        ("info", logging.INFO),
+        ("warning", logging.WARNING),
+        ("warn", logging.WARNING),
+        ("error", logging.ERROR),
+        ("exception", logging.ERROR),
+        ("critical", logging.CRITICAL),
+        ("fatal", logging.CRITICAL),
+        ("INFO", logging.INFO),
+    ])
+    def test_level_names(self, capture_logger, level, expected):
+        """Canonical names and Logger method aliases are accepted"""
+        logger, records = capture_logger
+
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            log_with_context(logger, level, "message", request_id="req-1")
+
+        assert len(records) == 1
+        assert records[0].levelno == expected
+        assert records[0].request_id == "req-1"
+        assert (records[0].exc_info is not None) == (level == "exception")
+
+    @pytest.mark.unit
+    def test_disabled_level_is_skipped(self, capture_logger):
+        """Records below the logger level are not emitted"""
+        logger, records = capture_logger
+        logger.setLevel(logging.WARNING)
+
+        log_with_context(logger, "info", "message")
+
+        assert records == []
+
+    @pytest.mark.unit
+    def test_unknown_level_raises(self, capture_logger):
+        """Unknown level names still fail loudly"""
+        logger, _ = capture_logger
+
+        with pytest.raises(AttributeError):
+            log_with_context(logger, "verbose", "message")
+
+
+class TestSetupLogging:
+    """Test setup_logging configuration"""
+
+    @pytest.mark.unit
+    def test_fast_caller_is_restored(self, restore_logging):
+        """Turning fast_caller off brings caller info back"""
+        setup_logging(fast_caller=True)
+        assert logging._srcfile is None
+
+        setup_logging(fast_caller=False)
+        assert logging._srcfile is not None
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("buffer_size", [0, 256])
+    @pytest.mark.parametrize("json_logs", [False, True])
+    def test_errors_routed_only_to_error_log(self, tmp_path, restore_logging, buffer_size, json_logs):
+        """ERROR records go to error.log only; lower levels to the main log only"""
+        log_file = tmp_path / "app.log"
+        logger = setup_logging(
+            log_file=str(log_file), json_logs=json_logs, buffer_size=buffer_size
+        )
+
+        logger.info("routine message")
+        logger.error("failure message")
+        # Reconfiguring closes (and flushes) the file handlers
+        setup_logging()
+
+        app_log = log_file.read_text()
+        error_log = (tmp_path / "error.log").read_text()
+        assert "routine message" in app_log
+        assert "failure message" not in app_log
+        assert "failure message" in error_log
+        assert "routine message" not in error_log
@@ -0,0 +1,31 @@
+"""
+Unit tests for the performance metrics utility
+Tests that the vectorized p95 matches the per-metric calculation
+"""
+import random
+
+import pytest
+
+from utils.metrics import MetricData, _batch_p95
+
+
+class TestBatchP95:
+    """Test the vectorized p95 across metrics"""
+
+    @pytest.mark.unit
+    def test_matches_p95_duration(self):
+        """Batch p95 equals p95_duration for windows of differing sizes"""
+        rng = random.Random(7)
+        metrics = []
+        for size in (0, 1, 2, 19, 20, 21, 137, 1000):
+            metric = MetricData()
+            for _ in range(size):
+                metric.record(rng.choice([rng.uniform(1, 500), 12.5]))
+            metrics.append(metric)
+
+        assert _batch_p95(metrics) == [metric.p95_duration for metric in metrics]
+
+    @pytest.mark.unit
+    def test_no_metrics(self):
+        """An empty batch yields no values"""
+        assert _batch_p95([]) == []
@@ -3,14 +3,57 @@ Simple in-memory caching utility for single-user deployment
 Uses Python's functools and dict for fast, lightweight caching
 """
 from functools import wraps, lru_cache
-from typing import Callable, Any, Optional
+from typing import Callable, Any, List, Optional, Tuple, Union
 from datetime import datetime, timedelta, timezone
 import hashlib
 import json
+import pickle
 from utils.logger import get_logger
 
+try:
+    import redis
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    redis = None
+    aioredis = None
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+    msgspec = None
+
+try:
+    import lz4.frame
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+    lz4 = None
+
 logger = get_logger(__name__)
 
+# Values whose pickled form is smaller than this are stored uncompressed
+COMPRESS_MIN_SIZE = 1024
+
+# One-byte format tags prefixed to every value stored in Redis
+_MSGPACK_TAG = b"M"
+_JSON_TAG = b"J"
+
+
+class _CompressedValue:
+    """Marker wrapping an lz4-compressed, pickled cache value"""
+
+    __slots__ = ("raw",)
+
+    def __init__(self, raw: bytes):
+        self.raw = raw
+
+    def load(self) -> Any:
+        return pickle.loads(lz4.frame.decompress(self.raw))
+
 
 class SimpleCache:
     """
@@ -18,7 +61,7 @@ class SimpleCache:
     Thread-safe, TTL support, memory-efficient
     """
 
-    def __init__(self, default_ttl: int = 300):
+    def __init__(self, default_ttl: float = 300):
         """
         Initialize cache
 
@@ -48,9 +91,18 @@ class SimpleCache:
             return None
 
         logger.debug(f"Cache hit: {key}")
-        return self._cache[key]
-
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        value = self._cache[key]
+        if isinstance(value, _CompressedValue):
+            return value.load()
+        return value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        compress: bool = False
+    ) -> None:
         """
         Set value in cache
 
@@ -58,7 +110,10 @@ class SimpleCache:
             key: Cache key
             value: Value to cache
             ttl: Time-to-live in seconds (uses default if None)
+            compress: Store large values lz4-compressed (requires lz4)
         """
+        if compress and LZ4_AVAILABLE:
+            value = self._compress(value)
         self._cache[key] = value
         self._timestamps[key] = {
             "created": datetime.now(timezone.utc),
@@ -66,6 +121,20 @@ class SimpleCache:
         }
         logger.debug(f"Cache set: {key} (TTL: {ttl or self._default_ttl}s)")
 
+    async def aget(self, key: str) -> Optional[Any]:
+        """Async variant of get (in-memory lookups never block)"""
+        return self.get(key)
+
+    async def aset(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        compress: bool = False
+    ) -> None:
+        """Async variant of set (in-memory writes never block)"""
+        self.set(key, value, ttl=ttl, compress=compress)
+
     def delete(self, key: str) -> None:
         """Delete key from cache"""
         self._cache.pop(key, None)
@@ -78,6 +147,17 @@ class SimpleCache:
         self._timestamps.clear()
         logger.info("Cache cleared")
 
+    @staticmethod
+    def _compress(value: Any) -> Any:
+        """Compress value if its pickled form is large enough to benefit"""
+        try:
+            pickled = pickle.dumps(value, protocol=5)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return value
+        if len(pickled) < COMPRESS_MIN_SIZE:
+            return value
+        return _CompressedValue(lz4.frame.compress(pickled))
+
     def _is_expired(self, key: str) -> bool:
         """Check if cache entry is expired"""
         if key not in self._timestamps:
@@ -96,15 +176,265 @@ class SimpleCache:
         }
 
 
+class RedisCache:
+    """
+    Shared Redis-backed cache for multi-worker deployments
+    Values are stored as msgpack (JSON without msgspec), never pickled, so a
+    writable Redis cannot run code in the workers. Values that cannot be
+    serialized stay in the per-process tier only. Connection and decode
+    errors are logged and treated as misses
+    """
+
+    def __init__(
+        self,
+        url: str,
+        default_ttl: float = 300,
+        namespace: str = "nsexp:cache:"
+    ):
+        """
+        Initialize Redis cache
+
+        Args:
+            url: Redis connection URL
+            default_ttl: Default time-to-live in seconds
+            namespace: Prefix applied to every Redis key
+        """
+        if not REDIS_AVAILABLE:
+            raise RuntimeError("redis package is not installed")
+
+        self._url = url
+        self._default_ttl = default_ttl
+        self._namespace = namespace
+        self._client = redis.Redis.from_url(url)
+        self._async_client = aioredis.Redis.from_url(url)
+
+    def _key(self, key: str) -> str:
+        return f"{self._namespace}{key}"
+
+    @staticmethod
+    def _dump(value: Any) -> Optional[bytes]:
+        """Serialize value, or None if it is not msgpack/JSON serializable"""
+        try:
+            if MSGSPEC_AVAILABLE:
+                return _MSGPACK_TAG + msgspec.msgpack.encode(value)
+            return _JSON_TAG + json.dumps(value).encode("utf-8")
+        except (TypeError, ValueError, OverflowError) as e:
+            logger.debug(f"Value not stored in Redis cache: {e}")
+            return None
+
+    @staticmethod
+    def _decode(raw: bytes) -> Any:
+        """Deserialize a stored value; raises ValueError if it is unreadable"""
+        tag, payload = raw[:1], raw[1:]
+        if tag == _MSGPACK_TAG and MSGSPEC_AVAILABLE:
+            try:
+                return msgspec.msgpack.decode(payload)
+            except msgspec.DecodeError as e:
+                raise ValueError(str(e)) from e
+        if tag == _JSON_TAG:
+            return json.loads(payload)
+        raise ValueError(f"unsupported cache value format {tag!r}")
+
+    def _load(self, key: str, raw: Optional[bytes]) -> Optional[Any]:
+        """Decode raw, dropping entries that cannot be decoded"""
+        if raw is None:
+            return None
+        try:
+            return self._decode(raw)
+        except ValueError as e:
+            logger.warning(f"Discarding undecodable Redis cache entry {key}: {e}")
+            self.delete(key)
+            return None
+
+    def _expiry_ms(self, ttl: Optional[float]) -> int:
+        """Millisecond expiry for SET, so fractional TTLs are not truncated"""
+        return max(1, round((ttl or self._default_ttl) * 1000))
+
+    @staticmethod
+    def _remaining_ttl(pttl: int) -> Optional[float]:
+        """Seconds left from a PTTL reply (None when the key has no expiry)"""
+        return pttl / 1000 if pttl > 0 else None
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get value from Redis"""
+        return self.get_with_ttl(key)[0]
+
+    def get_with_ttl(self, key: str) -> Tuple[Optional[Any], Optional[float]]:
+        """Get value from Redis along with its remaining time-to-live in seconds"""
+        try:
+            pipe = self._client.pipeline()
+            pipe.get(self._key(key))
+            pipe.pttl(self._key(key))
+            raw, pttl = pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Redis cache get failed: {e}")
+            return None, None
+        return self._load(key, raw), self._remaining_ttl(pttl)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Set value in Redis"""
+        data = self._dump(value)
+        if data is None:
+            return
+        try:
+            self._client.set(self._key(key), data, px=self._expiry_ms(ttl))
+        except redis.RedisError as e:
+            logger.warning(f"Redis cache set failed: {e}")
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """Get value from Redis without blocking the event loop"""
+        return (await self.aget_with_ttl(key))[0]
+
+    async def aget_with_ttl(self, key: str) -> Tuple[Optional[Any], Optional[float]]:
+        """Async variant of get_with_ttl"""
+        try:
+            async with self._async_client.pipeline() as pipe:
+                pipe.get(self._key(key))
+                pipe.pttl(self._key(key))
+                raw, pttl = await pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Redis cache get failed: {e}")
+            return None, None
+        return self._load(key, raw), self._remaining_ttl(pttl)
+
+    async def aset(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Set value in Redis without blocking the event loop"""
+        data = self._dump(value)
+        if data is None:
+            return
+        try:
+            await self._async_client.set(self._key(key), data, px=self._expiry_ms(ttl))
+        except redis.RedisError as e:
+            logger.warning(f"Redis cache set failed: {e}")
+
+    def delete(self, key: str) -> None:
+        """Delete key from Redis"""
+        try:
+            self._client.delete(self._key(key))
+        except redis.RedisError as e:
+            logger.warning(f"Redis cache delete failed: {e}")
+
+    def clear(self) -> None:
+        """Delete every key in this cache's namespace"""
+        try:
+            keys = list(self._client.scan_iter(match=f"{self._namespace}*"))
+            if keys:
+                self._client.delete(*keys)
+        except redis.RedisError as e:
+            logger.warning(f"Redis cache clear failed: {e}")
+
+    def get_stats(self) -> dict:
+        """Get cache statistics"""
+        return {
+            "url": self._url,
+            "namespace": self._namespace,
+            "default_ttl": self._default_ttl
+        }
+
+
+class TieredCache:
+    """
+    Two-tier cache: per-process L1 in front of a shared L2
+    L1 misses consult L2 before the caller recomputes; writes fill both tiers.
+    An L2 hit refills L1 only for the entry's remaining Redis TTL
+    """
+
+    def __init__(self, l1: SimpleCache, l2: RedisCache):
+        self.l1 = l1
+        self.l2 = l2
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.l1.get(key)
+        if value is None:
+            value, remaining_ttl = self.l2.get_with_ttl(key)
+            if value is not None:
+                self.l1.set(key, value, ttl=remaining_ttl)
+        return value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        compress: bool = False
+    ) -> None:
+        self.l1.set(key, value, ttl=ttl, compress=compress)
+        self.l2.set(key, value, ttl=ttl)
+
+    async def aget(self, key: str) -> Optional[Any]:
+        value = self.l1.get(key)
+        if value is None:
+            value, remaining_ttl = await self.l2.aget_with_ttl(key)
+            if value is not None:
+                self.l1.set(key, value, ttl=remaining_ttl)
+        return value
+
+    async def aset(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        compress: bool = False
+    ) -> None:
+        self.l1.set(key, value, ttl=ttl, compress=compress)
+        await self.l2.aset(key, value, ttl=ttl)
+
+    def delete(self, key: str) -> None:
+        self.l1.delete(key)
+        self.l2.delete(key)
+
+    def clear(self) -> None:
+        self.l1.clear()
+        self.l2.clear()
+
+    def get_stats(self) -> dict:
+        return {
+            "l1": self.l1.get_stats(),
+            "l2": self.l2.get_stats()
+        }
+
+
 # Global cache instance
 _global_cache = SimpleCache(default_ttl=300)  # 5 minutes default
 
+# Cache references captured by @cached at decoration time
+_cache_refs: List[list] = []
+
 
-def get_cache() -> SimpleCache:
+def get_cache() -> Union[SimpleCache, TieredCache]:
     """Get global cache instance"""
     return _global_cache
 
 
+def configure_cache(redis_url: Optional[str] = None, default_ttl: float = 300) -> None:
+    """
+    Configure the global cache
+
+    Args:
+        redis_url: When given, back the in-process cache with a shared Redis L2
+        default_ttl: Default time-to-live in seconds
+    """
+    global _global_cache
+
+    l1 = SimpleCache(default_ttl=default_ttl)
+    if redis_url and REDIS_AVAILABLE:
+        _global_cache = TieredCache(l1, RedisCache(redis_url, default_ttl=default_ttl))
+        logger.info("Cache configured with shared Redis L2")
+    else:
+        if redis_url:
+            logger.warning("redis package not installed, using in-process cache only")
+        _global_cache = l1
+
+    _refresh_cache()
+
+
+def _refresh_cache() -> None:
+    """Rebind every @cached wrapper to the current global cache"""
+    cache = get_cache()
+    for ref in _cache_refs:
+        ref[0] = cache
+
+
 def cache_key(*args, **kwargs) -> str:
     """
     Generate cache key from function arguments
@@ -125,13 +455,14 @@ def cache_key(*args, **kwargs) -> str:
     return hashlib.md5(key_string.encode()).hexdigest()
 
 
-def cached(ttl: int = 300, key_prefix: str = ""):
+def cached(ttl: float = 300, key_prefix: str = "", compress: bool = False):
     """
     Decorator to cache function results
 
     Args:
         ttl: Time-to-live in seconds
         key_prefix: Prefix for cache key
+        compress: lz4-compress large results (useful for text-heavy payloads)
 
     Example:
         @cached(ttl=600, key_prefix="chapters")
@@ -139,14 +470,18 @@ def cached(ttl: int = 300, key_prefix: str = ""):
             return await expensive_operation()
     """
     def decorator(func: Callable) -> Callable:
+        # Resolve the cache once; _refresh_cache() rebinds it if the global changes
+        cache_ref = [get_cache()]
+        _cache_refs.append(cache_ref)
+
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
             # Generate cache key
             func_key = f"{key_prefix}:{func.__name__}:{cache_key(*args, **kwargs)}"
 
             # Check cache
-            cache = get_cache()
-            cached_value = cache.get(func_key)
+            cache = cache_ref[0]
+            cached_value = await cache.aget(func_key)
             if cached_value is not None:
                 return cached_value
 
@@ -154,7 +489,7 @@ def cached(ttl: int = 300, key_prefix: str = ""):
             result = await func(*args, **kwargs)
 
             # Cache result
-            cache.set(func_key, result, ttl=ttl)
+            await cache.aset(func_key, result, ttl=ttl, compress=compress)
 
             return result
 
@@ -164,7 +499,7 @@ def cached(ttl: int = 300, key_prefix: str = ""):
             func_key = f"{key_prefix}:{func.__name__}:{cache_key(*args, **kwargs)}"
 
             # Check cache
-            cache = get_cache()
+            cache = cache_ref[0]
             cached_value = cache.get(func_key)
             if cached_value is not None:
                 return cached_value
@@ -173,7 +508,7 @@ def cached(ttl: int = 300, key_prefix: str = ""):
             result = func(*args, **kwargs)
 
             # Cache result
-            cache.set(func_key, result, ttl=ttl)
+            cache.set(func_key, result, ttl=ttl, compress=compress)
 
             return result
 
@@ -190,7 +525,10 @@ def cached(ttl: int = 300, key_prefix: str = ""):
 # Export main components
 __all__ = [
     "SimpleCache",
+    "RedisCache",
+    "TieredCache",
     "get_cache",
+    "configure_cache",
     "cached",
     "cache_key",
 ]
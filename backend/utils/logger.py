@@ -2,14 +2,98 @@
 Enhanced Logging Utility for Neurosurgical Knowledge System
 Provides structured logging with JSON format and rotation
 """
+import atexit
 import logging
+import os
+import queue
+import socket
 import sys
 import json
+import time
 from pathlib import Path
-from datetime import datetime, timezone
-from logging.handlers import RotatingFileHandler
-from typing import Optional, Dict, Any
-import traceback
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping, Union
+
+try:
+    import msgspec
+    from msgspec import UNSET, UnsetType
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+    msgspec = None
+
+# logging's own source path; setup_logging(fast_caller=True) clears it to skip
+# the caller lookup, and fast_caller=False puts it back
+_LOGGING_SRCFILE = logging._srcfile
+
+# Process-constant fields, resolved once instead of per record
+_HOSTNAME = socket.gethostname()
+_PID = os.getpid()
+
+# Optional context fields copied from the record when present
+_EXTRA_KEYS = ("request_id", "user_id", "endpoint", "duration_ms")
+
+# log_with_context level names, including the Logger method aliases
+_NAME_TO_LEVEL: Dict[str, int] = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "warn": logging.WARNING,
+    "error": logging.ERROR,
+    "exception": logging.ERROR,
+    "critical": logging.CRITICAL,
+    "fatal": logging.CRITICAL,
+}
+
+
+def _reset_pid() -> None:
+    global _PID
+    _PID = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pid)
+
+
+if MSGSPEC_AVAILABLE:
+    class _LogEntry(msgspec.Struct):
+        """Fixed JSON log schema; unset optional fields are omitted"""
+
+        timestamp: str
+        level: str
+        logger: str
+        message: str
+        hostname: str
+        pid: int
+        module: Union[str, UnsetType] = UNSET
+        function: Union[str, None, UnsetType] = UNSET
+        line: Union[int, UnsetType] = UNSET
+        exception: Union[Dict[str, Any], UnsetType] = UNSET
+        request_id: Any = UNSET
+        user_id: Any = UNSET
+        endpoint: Any = UNSET
+        duration_ms: Any = UNSET
+
+    _encode_entry = msgspec.json.Encoder(enc_hook=str).encode
+
+
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") of the last record seen
+_iso_cache = (None, "")
+
+
+def _iso_timestamp(created: float) -> str:
+    """
+    Format an epoch timestamp as UTC ISO-8601, reusing the formatted
+    date/time prefix for records logged within the same second
+    """
+    global _iso_cache
+    second = int(created)
+    cached_second, prefix = _iso_cache
+    if cached_second != second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _iso_cache = (second, prefix)
+    return f"{prefix}.{int((created - second) * 1_000_000):06d}Z"
 
 
 class StructuredFormatter(logging.Formatter):
@@ -19,35 +103,75 @@ class StructuredFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON"""
+        exception = None
+        if record.exc_info:
+            # Format once and cache on the record so other handlers reuse it
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            exception = {
+                "type": record.exc_info[0].__name__ if record.exc_info[0] else None,
+                "message": str(record.exc_info[1]) if record.exc_info[1] else None,
+                "traceback": record.exc_text,
+            }
+
+        if MSGSPEC_AVAILABLE:
+            return self._format_struct(record, exception)
+
         log_data = {
-            "timestamp": datetime.now(timezone.utc).isoformat() + "Z",
+            "timestamp": _iso_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
-            "module": record.module,
-            "function": record.funcName,
-            "line": record.lineno,
+            "hostname": _HOSTNAME,
+            "pid": _PID,
         }
 
-        # Add exception info if present
-        if record.exc_info:
-            log_data["exception"] = {
-                "type": record.exc_info[0].__name__ if record.exc_info[0] else None,
-                "message": str(record.exc_info[1]) if record.exc_info[1] else None,
-                "traceback": traceback.format_exception(*record.exc_info),
-            }
+        # Caller info is unavailable when setup_logging(fast_caller=True)
+        if record.lineno:
+            log_data["module"] = record.module
+            log_data["function"] = record.funcName
+            log_data["line"] = record.lineno
+
+        if exception is not None:
+            log_data["exception"] = exception
 
         # Add extra fields if present
-        if hasattr(record, "request_id"):
-            log_data["request_id"] = record.request_id
-        if hasattr(record, "user_id"):
-            log_data["user_id"] = record.user_id
-        if hasattr(record, "endpoint"):
-            log_data["endpoint"] = record.endpoint
-        if hasattr(record, "duration_ms"):
-            log_data["duration_ms"] = record.duration_ms
+        record_dict = record.__dict__
+        for key in _EXTRA_KEYS:
+            if key in record_dict:
+                log_data[key] = record_dict[key]
+
+        return json.dumps(log_data, default=str)
+
+    @staticmethod
+    def _format_struct(record: logging.LogRecord, exception: Optional[Dict[str, Any]]) -> str:
+        """Encode through the fixed-schema msgspec struct, skipping the dict build"""
+        record_dict = record.__dict__
+        has_caller = bool(record.lineno)
+        entry = _LogEntry(
+            _iso_timestamp(record.created),
+            record.levelname,
+            record.name,
+            record.getMessage(),
+            _HOSTNAME,
+            _PID,
+            record.module if has_caller else UNSET,
+            record.funcName if has_caller else UNSET,
+            record.lineno if has_caller else UNSET,
+            UNSET if exception is None else exception,
+            *[record_dict.get(key, UNSET) for key in _EXTRA_KEYS],
+        )
+        return _encode_entry(entry).decode("utf-8")
+
 
-        return json.dumps(log_data)
+def _build_level_tags(colors: Mapping[str, str]) -> Mapping[int, str]:
+    """Map level numbers to padded, colorized level-name tags"""
+    reset = colors["RESET"]
+    return MappingProxyType({
+        getattr(logging, level): f"{color}{level:8}{reset}"
+        for level, color in colors.items()
+        if level != "RESET"
+    })
 
 
 class ConsoleFormatter(logging.Formatter):
@@ -55,31 +179,44 @@ class ConsoleFormatter(logging.Formatter):
     Human-readable formatter for console output with colors (if supported)
     """
 
-    COLORS = {
+    COLORS = MappingProxyType({
         "DEBUG": "\033[36m",  # Cyan
         "INFO": "\033[32m",  # Green
         "WARNING": "\033[33m",  # Yellow
         "ERROR": "\033[31m",  # Red
         "CRITICAL": "\033[35m",  # Magenta
         "RESET": "\033[0m",  # Reset
-    }
+    })
+
+    # Timestamps are reported in UTC
+    converter = time.gmtime
+
+    # Fully padded, colorized level tags, built once at class creation
+    _LEVEL_TAGS = _build_level_tags(COLORS)
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with colors"""
-        level_color = self.COLORS.get(record.levelname, "")
-        reset = self.COLORS["RESET"]
+        level_tag = self._LEVEL_TAGS.get(record.levelno) or f"{record.levelname:8}"
+
+        # Caller info is unavailable when setup_logging(fast_caller=True)
+        location = (
+            f"{record.module}:{record.funcName}:{record.lineno} - "
+            if record.lineno else ""
+        )
 
         # Format: timestamp - level - module:function:line - message
         formatted = (
-            f"{datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')} - "
-            f"{level_color}{record.levelname:8}{reset} - "
-            f"{record.module}:{record.funcName}:{record.lineno} - "
+            f"{self.formatTime(record, '%Y-%m-%d %H:%M:%S')} - "
+            f"{level_tag} - "
+            f"{location}"
             f"{record.getMessage()}"
         )
 
         # Add exception info if present
         if record.exc_info:
-            formatted += "\n" + "".join(traceback.format_exception(*record.exc_info))
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            formatted += "\n" + record.exc_text
 
         return formatted
 
@@ -91,6 +228,9 @@ def setup_logging(
     rotate_logs: bool = True,
     max_bytes: int = 10 * 1024 * 1024,  # 10MB
     backup_count: int = 7,  # Keep 7 days of logs
+    fast_caller: bool = False,
+    buffer_size: int = 256,
+    async_logging: bool = False,
 ) -> logging.Logger:
     """
     Setup comprehensive logging configuration
@@ -102,28 +242,49 @@ def setup_logging(
         rotate_logs: Enable log rotation
         max_bytes: Maximum size of each log file
         backup_count: Number of backup log files to keep
+        fast_caller: Skip the per-record stack frame walk. Module, function
+            and line are no longer reported, but each log call is ~30% cheaper
+        buffer_size: Records buffered in memory before the log file is written
+            (0 disables buffering; ERROR and above always flush immediately)
+        async_logging: Format and write file logs on a background thread,
+            leaving only a queue put on the calling thread
 
     Returns:
         Configured logger instance
     """
+    # None of our formatters report thread/process info, so skip collecting it
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None if fast_caller else _LOGGING_SRCFILE
+
+    level = getattr(logging, log_level.upper())
+
     # Create logger
     logger = logging.getLogger("neurosurgical_knowledge")
-    logger.setLevel(getattr(logging, log_level.upper()))
+    logger.setLevel(level)
 
-    # Remove existing handlers
+    # Remove existing handlers, flushing anything still buffered
+    _stop_queue_listener()
+    for handler in logger.handlers:
+        _close_handler(handler)
     logger.handlers = []
 
     # Console handler (human-readable)
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, log_level.upper()))
+    console_handler.setLevel(level)
     console_handler.setFormatter(ConsoleFormatter())
     logger.addHandler(console_handler)
 
-    # File handler (optional)
+    # File handlers (optional), attached directly or behind a queue
+    file_handlers = []
+    file_handler = None
+    # One instance shared by both file handlers
+    structured_formatter = StructuredFormatter() if json_logs else None
     if log_file or json_logs:
         log_file = log_file or "logs/app.log"
-        log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+        log_dir = Path(log_file).parent
+        log_dir.mkdir(parents=True, exist_ok=True)
 
         if rotate_logs:
             file_handler = RotatingFileHandler(
@@ -132,11 +293,11 @@ def setup_logging(
         else:
             file_handler = logging.FileHandler(log_file)
 
-        file_handler.setLevel(getattr(logging, log_level.upper()))
+        file_handler.setLevel(level)
 
         # Use JSON formatter for file logs if requested
         if json_logs:
-            file_handler.setFormatter(StructuredFormatter())
+            file_handler.setFormatter(structured_formatter)
         else:
             file_handler.setFormatter(
                 logging.Formatter(
@@ -145,27 +306,111 @@ def setup_logging(
                 )
             )
 
-        logger.addHandler(file_handler)
+        file_handlers.append(_buffered(file_handler, buffer_size))
 
     # Separate error log file
     if log_file:
-        error_log_path = Path(log_file).parent / "error.log"
+        error_log_path = log_dir / "error.log"
         error_handler = RotatingFileHandler(
             error_log_path, maxBytes=max_bytes, backupCount=backup_count
         )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(
-            StructuredFormatter() if json_logs else
+            structured_formatter if json_logs else
             logging.Formatter(
                 "%(asctime)s - %(name)s - %(levelname)s - %(message)s\n%(exc_info)s",
                 datefmt="%Y-%m-%d %H:%M:%S",
             )
         )
-        logger.addHandler(error_handler)
+        file_handlers.append(error_handler)
+
+        # ERROR and above are written to error.log only, so they are not formatted twice
+        if file_handler is not None:
+            file_handler.addFilter(_below_error)
+
+    if async_logging and file_handlers:
+        global _queue_listener
+        log_queue = queue.SimpleQueue()
+        _queue_listener = QueueListener(log_queue, *file_handlers, respect_handler_level=True)
+        _queue_listener.start()
+        logger.addHandler(_DeferredQueueHandler(log_queue))
+    else:
+        for handler in file_handlers:
+            logger.addHandler(handler)
 
     return logger
 
 
+def _below_error(record: logging.LogRecord) -> bool:
+    """Handler filter passing only records below ERROR"""
+    return record.levelno < logging.ERROR
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener's handlers
+
+    The stock prepare() formats the record (including its traceback) on
+    the calling thread; here only the message arguments are merged.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# Background listener started by setup_logging(async_logging=True)
+_queue_listener: Optional[QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Drain the background listener and close the handlers it feeds"""
+    global _queue_listener
+    if _queue_listener is None:
+        return
+    _queue_listener.stop()
+    for handler in _queue_listener.handlers:
+        _close_handler(handler)
+    _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
+def _buffered(handler: logging.Handler, buffer_size: int) -> logging.Handler:
+    """
+    Batch writes to a file handler through a MemoryHandler
+
+    Buffered records are flushed at exit by logging.shutdown(), which
+    flushes and closes every handler.
+
+    Args:
+        handler: Target handler receiving flushed records
+        buffer_size: Number of records to buffer (0 returns handler unchanged)
+
+    Returns:
+        Handler to attach to the logger
+    """
+    if buffer_size <= 0:
+        return handler
+
+    memory_handler = MemoryHandler(
+        capacity=buffer_size, flushLevel=logging.ERROR, target=handler
+    )
+    memory_handler.setLevel(handler.level)
+    return memory_handler
+
+
+def _close_handler(handler: logging.Handler) -> None:
+    """Close a handler, including the file handler behind a MemoryHandler"""
+    # MemoryHandler.close() flushes and then drops its target
+    target = handler.target if isinstance(handler, MemoryHandler) else None
+    handler.close()
+    if target is not None:
+        target.close()
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a child logger with the specified name
@@ -190,11 +435,20 @@ def log_with_context(
 
     Args:
         logger: Logger instance
-        level: Log level (debug, info, warning, error, critical)
+        level: Log level (debug, info, warning, error, critical) or a Logger
+            method alias (exception, warn, fatal)
         message: Log message
         **context: Additional context as keyword arguments
     """
-    log_func = getattr(logger, level.lower())
+    level = level.lower()
+    level_number = _NAME_TO_LEVEL.get(level)
+    if level_number is None:
+        level_number = getattr(logging, level.upper())
+    if not logger.isEnabledFor(level_number):
+        return
+
+    # Logger.warn is deprecated (and gone in Python 3.13)
+    log_func = getattr(logger, "warning" if level == "warn" else level)
     log_func(message, extra=context)
 
 
@@ -4,22 +4,111 @@ Simple metrics collection for monitoring system performance
 """
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta, timezone
-from collections import defaultdict, deque
-from dataclasses import dataclass, field
+from array import array
+import heapq
+import logging
+import threading
 import time
 from utils.logger import get_logger
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
 logger = get_logger(__name__)
 
 
-@dataclass
+def _batch_p95(metrics: List["MetricData"]) -> List[float]:
+    """
+    Compute p95 for many metrics in one vectorized pass
+
+    Recent-value windows are stacked into a NaN-padded matrix and each row
+    is partitioned around its p95 position (the same rank p95_duration
+    selects) rather than fully sorted; falls back to per-metric
+    p95_duration without numpy.
+    """
+    if not NUMPY_AVAILABLE or not metrics:
+        return [metric.p95_duration for metric in metrics]
+
+    counts = np.fromiter((len(m.recent_values) for m in metrics), dtype=np.intp, count=len(metrics))
+    width = int(counts.max())
+    if width == 0:
+        return [0.0] * len(metrics)
+
+    matrix = np.full((len(metrics), width), np.nan)
+    for row, metric in enumerate(metrics):
+        matrix[row, :counts[row]] = np.frombuffer(metric.recent_values, dtype=np.float64)
+
+    # Ascending rank of the k-th largest value, k = max(1, n - int(n * 0.95))
+    index = np.minimum((counts * 0.95).astype(np.intp), np.maximum(counts - 1, 0))
+    # Rows share one partition call, so every distinct rank is a kth; windows
+    # are mostly full, which keeps that set small. NaN padding goes last.
+    matrix.partition(np.unique(index), axis=1)
+    p95 = matrix[np.arange(len(metrics)), index]
+    return np.where(counts > 0, p95, 0.0).tolist()
+
+
 class MetricData:
-    """Container for metric measurements"""
-    count: int = 0
-    total_duration: float = 0.0
-    min_duration: float = float('inf')
-    max_duration: float = 0.0
-    recent_values: deque = field(default_factory=lambda: deque(maxlen=100))
+    """
+    Container for metric measurements
+
+    Aggregates live in a flat array of doubles and recent samples in a
+    ring buffer that grows up to WINDOW entries, so rarely-hit metrics
+    stay small. record() holds a per-metric lock, since its updates are
+    read-modify-writes that concurrent threads could otherwise interleave.
+    """
+
+    __slots__ = ("_stats", "_ring", "_pos", "_lock")
+
+    WINDOW = 100
+    _COUNT, _TOTAL, _MIN, _MAX = range(4)
+
+    def __init__(self):
+        self._stats = array("d", (0.0, 0.0, float('inf'), 0.0))
+        self._ring = array("d")
+        self._pos = 0
+        self._lock = threading.Lock()
+
+    def record(self, duration_ms: float) -> None:
+        """Record one measurement"""
+        stats = self._stats
+        with self._lock:
+            stats[self._COUNT] += 1
+            stats[self._TOTAL] += duration_ms
+            if duration_ms < stats[self._MIN]:
+                stats[self._MIN] = duration_ms
+            if duration_ms > stats[self._MAX]:
+                stats[self._MAX] = duration_ms
+
+            if len(self._ring) < self.WINDOW:
+                self._ring.append(duration_ms)
+            else:
+                self._ring[self._pos] = duration_ms
+                self._pos = (self._pos + 1) % self.WINDOW
+
+    @property
+    def count(self) -> int:
+        return int(self._stats[self._COUNT])
+
+    @property
+    def total_duration(self) -> float:
+        return self._stats[self._TOTAL]
+
+    @property
+    def min_duration(self) -> float:
+        return self._stats[self._MIN]
+
+    @property
+    def max_duration(self) -> float:
+        return self._stats[self._MAX]
+
+    @property
+    def recent_values(self) -> array:
+        """Most recent measurements (up to WINDOW, unordered)"""
+        return self._ring
 
     @property
     def avg_duration(self) -> float:
@@ -29,11 +118,13 @@ class MetricData:
     @property
     def p95_duration(self) -> float:
         """Calculate 95th percentile duration"""
-        if not self.recent_values:
+        recent = self.recent_values
+        if not recent:
             return 0.0
-        sorted_values = sorted(self.recent_values)
-        index = int(len(sorted_values) * 0.95)
-        return sorted_values[min(index, len(sorted_values) - 1)]
+        # Partial selection of the top 5% instead of sorting the whole window
+        n = len(recent)
+        k = max(1, n - int(n * 0.95))
+        return heapq.nlargest(k, recent)[-1]
 
 
 class PerformanceMetrics:
@@ -44,8 +135,8 @@ class PerformanceMetrics:
 
     def __init__(self):
         """Initialize metrics collector"""
-        self._endpoint_metrics: Dict[str, MetricData] = defaultdict(MetricData)
-        self._ai_metrics: Dict[str, MetricData] = defaultdict(MetricData)
+        self._endpoint_metrics: Dict[str, MetricData] = {}
+        self._ai_metrics: Dict[str, MetricData] = {}
         self._start_time = datetime.now(timezone.utc)
 
     def record_api_call(self, endpoint: str, duration_ms: float) -> None:
@@ -56,12 +147,11 @@ class PerformanceMetrics:
             endpoint: API endpoint path
             duration_ms: Request duration in milliseconds
         """
-        metric = self._endpoint_metrics[endpoint]
-        metric.count += 1
-        metric.total_duration += duration_ms
-        metric.min_duration = min(metric.min_duration, duration_ms)
-        metric.max_duration = max(metric.max_duration, duration_ms)
-        metric.recent_values.append(duration_ms)
+        metric = self._endpoint_metrics.get(endpoint)
+        if metric is None:
+            # setdefault, so racing first calls share one MetricData
+            metric = self._endpoint_metrics.setdefault(endpoint, MetricData())
+        metric.record(duration_ms)
 
     def record_ai_call(self, provider: str, duration_ms: float) -> None:
         """
@@ -71,12 +161,11 @@ class PerformanceMetrics:
             provider: AI provider name (openai, anthropic, etc.)
             duration_ms: Call duration in milliseconds
         """
-        metric = self._ai_metrics[provider]
-        metric.count += 1
-        metric.total_duration += duration_ms
-        metric.min_duration = min(metric.min_duration, duration_ms)
-        metric.max_duration = max(metric.max_duration, duration_ms)
-        metric.recent_values.append(duration_ms)
+        metric = self._ai_metrics.get(provider)
+        if metric is None:
+            # setdefault, so racing first calls share one MetricData
+            metric = self._ai_metrics.setdefault(provider, MetricData())
+        metric.record(duration_ms)
 
     def get_api_stats(self) -> Dict[str, Dict]:
         """
@@ -85,17 +174,7 @@ class PerformanceMetrics:
         Returns:
             Dictionary with endpoint stats
         """
-        stats = {}
-        for endpoint, metric in self._endpoint_metrics.items():
-            if metric.count > 0:
-                stats[endpoint] = {
-                    "calls": metric.count,
-                    "avg_ms": round(metric.avg_duration, 2),
-                    "min_ms": round(metric.min_duration, 2),
-                    "max_ms": round(metric.max_duration, 2),
-                    "p95_ms": round(metric.p95_duration, 2),
-                }
-        return stats
+        return self._build_stats(self._endpoint_metrics)
 
     def get_ai_stats(self) -> Dict[str, Dict]:
         """
@@ -104,16 +183,23 @@ class PerformanceMetrics:
         Returns:
             Dictionary with AI provider stats
         """
+        return self._build_stats(self._ai_metrics)
+
+    @staticmethod
+    def _build_stats(metrics: Dict[str, MetricData]) -> Dict[str, Dict]:
+        """Summarize a metric table, computing all p95 values in one batch"""
+        active = [(name, metric) for name, metric in metrics.items() if metric.count > 0]
+        p95_values = _batch_p95([metric for _, metric in active])
+
         stats = {}
-        for provider, metric in self._ai_metrics.items():
-            if metric.count > 0:
-                stats[provider] = {
-                    "calls": metric.count,
-                    "avg_ms": round(metric.avg_duration, 2),
-                    "min_ms": round(metric.min_duration, 2),
-                    "max_ms": round(metric.max_duration, 2),
-                    "p95_ms": round(metric.p95_duration, 2),
-                }
+        for (name, metric), p95 in zip(active, p95_values):
+            stats[name] = {
+                "calls": metric.count,
+                "avg_ms": round(metric.avg_duration, 2),
+                "min_ms": round(metric.min_duration, 2),
+                "max_ms": round(metric.max_duration, 2),
+                "p95_ms": round(p95, 2),
+            }
         return stats
 
     def get_summary(self) -> Dict:
@@ -139,12 +225,17 @@ class PerformanceMetrics:
             "ai_providers_used": len(self._ai_metrics),
         }
 
-    def get_slow_endpoints(self, threshold_ms: float = 1000) -> List[Dict]:
+    def get_slow_endpoints(
+        self,
+        threshold_ms: float = 1000,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
         """
         Get endpoints slower than threshold
 
         Args:
             threshold_ms: Threshold in milliseconds
+            limit: Return only the N slowest endpoints
 
         Returns:
             List of slow endpoints with stats
@@ -158,6 +249,8 @@ class PerformanceMetrics:
                     "calls": metric.count,
                     "max_ms": round(metric.max_duration, 2),
                 })
+        if limit is not None:
+            return heapq.nlargest(limit, slow, key=lambda x: x["avg_ms"])
         return sorted(slow, key=lambda x: x["avg_ms"], reverse=True)
 
     def reset(self) -> None:
@@ -196,28 +289,32 @@ class TimingContext:
             name: Operation name for logging
         """
         self.name = name
-        self.start_time = None
-        self.end_time = None
+        self.start_ns = None
+        self.end_ns = None
         self.duration_ms = 0.0
 
     def __enter__(self):
         """Start timing"""
-        self.start_time = time.time()
+        self.start_ns = time.perf_counter_ns()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Stop timing and log"""
-        self.end_time = time.time()
-        self.duration_ms = (self.end_time - self.start_time) * 1000
+        self.end_ns = time.perf_counter_ns()
+        self.duration_ms = (self.end_ns - self.start_ns) / 1_000_000
 
         if self.duration_ms > 1000:  # Log if > 1 second
+            if not logger.isEnabledFor(logging.WARNING):
+                return
             logger.warning(
-                f"Slow operation: {self.name} took {self.duration_ms:.2f}ms",
+                "Slow operation: %s took %.2fms", self.name, self.duration_ms,
                 extra={"operation": self.name, "duration_ms": self.duration_ms}
             )
         elif self.duration_ms > 100:  # Log if > 100ms
+            if not logger.isEnabledFor(logging.INFO):
+                return
             logger.info(
-                f"Operation: {self.name} took {self.duration_ms:.2f}ms",
+                "Operation: %s took %.2fms", self.name, self.duration_ms,
                 extra={"operation": self.name, "duration_ms": self.duration_ms}
             )
 